@@ -0,0 +1,55 @@
+"""
+Entities, value objects, repository ports and interfaces of the domain.
+
+Every public name is exported lazily: `from app.core.domain import Email`
+imports email_vo and its dependencies only, and `import app.core.domain`
+imports nothing at all.
+"""
+from typing import TYPE_CHECKING
+
+from app.core.domain.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from app.core.domain.entities.post import Post
+    from app.core.domain.entities.user import User
+    from app.core.domain.interfaces.base_entity import BaseEntity
+    from app.core.domain.interfaces.password_hasher import PasswordHasher
+    from app.core.domain.interfaces.use_case_observer import UseCaseInvocation, UseCaseObserver
+    from app.core.domain.repositories.async_post_repository import AsyncPostRepository
+    from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+    from app.core.domain.repositories.post_repository import PostRepository
+    from app.core.domain.repositories.user_repository import UserRepository
+    from app.core.domain.value_objects.document_vo import Document
+    from app.core.domain.value_objects.email_vo import Email
+    from app.core.domain.value_objects.password_vo import Password
+    from app.core.domain.value_objects.person_name_vo import PersonName
+    from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+    from app.core.domain.value_objects.post_status_vo import PostStatus, StatusEnum
+    from app.core.domain.value_objects.timestamp_vo import Timestamp
+    from app.core.domain.value_objects.uuidv7_vo import UUIDv7, UUIDv7Generator
+    from app.core.domain.value_objects.value_object_cache import ValueObjectCache
+
+_EXPORTS = {
+    "app.core.domain.entities.post": ("Post",),
+    "app.core.domain.entities.user": ("User",),
+    "app.core.domain.interfaces.base_entity": ("BaseEntity",),
+    "app.core.domain.interfaces.password_hasher": ("PasswordHasher",),
+    "app.core.domain.interfaces.use_case_observer": ("UseCaseInvocation", "UseCaseObserver"),
+    "app.core.domain.repositories.async_post_repository": ("AsyncPostRepository",),
+    "app.core.domain.repositories.async_user_repository": ("AsyncUserRepository",),
+    "app.core.domain.repositories.post_repository": ("PostRepository",),
+    "app.core.domain.repositories.user_repository": ("UserRepository",),
+    "app.core.domain.value_objects.document_vo": ("Document",),
+    "app.core.domain.value_objects.email_vo": ("Email",),
+    "app.core.domain.value_objects.password_vo": ("Password",),
+    "app.core.domain.value_objects.person_name_vo": ("PersonName",),
+    "app.core.domain.value_objects.phone_number_vo": ("PhoneNumber",),
+    "app.core.domain.value_objects.post_status_vo": ("PostStatus", "StatusEnum"),
+    "app.core.domain.value_objects.timestamp_vo": ("Timestamp",),
+    "app.core.domain.value_objects.uuidv7_vo": ("UUIDv7", "UUIDv7Generator"),
+    "app.core.domain.value_objects.value_object_cache": ("ValueObjectCache",),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,8 +1,13 @@
+from typing import Any, Mapping
+
 from app.core.domain.value_objects.post_status_vo import PostStatus
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
 
 
 class Post():
+    __slots__ = ('id', 'user_id', 'image', 'title', 'link', 'description',
+                 'body_content', 'status', 'created_at_utc', 'updated_at_utc', 'version')
 
     def __init__(self,
                  id: UUIDv7,
@@ -13,8 +18,9 @@ class Post():
                  description: str,
                  body_content: str,
                  status: PostStatus,
-                 created_at_utc: str,
-                 updated_at_utc: str
+                 created_at_utc: Timestamp | None,
+                 updated_at_utc: Timestamp | None,
+                 version: int = 0
                  ) -> None:
 
         self.id = id
@@ -25,5 +31,27 @@ class Post():
         self.description = description
         self.body_content = body_content
         self.status = status
-        self.created_at_utc = created_at_utc
-        self.updated_at_utc = updated_at_utc
\ No newline at end of file
+        self.created_at_utc = created_at_utc or Timestamp.from_uuidv7_or_now(id)
+        self.updated_at_utc = updated_at_utc or self.created_at_utc
+        self.version = version
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "Post":
+        """
+        Builds a Post from a stored row without revalidating its fields.
+
+        `status` holds the StatusEnum name, timestamps are epoch microseconds.
+        """
+        return cls(
+            id=UUIDv7.from_trusted(row["id"]),
+            user_id=UUIDv7.from_trusted(row["user_id"]),
+            image=row["image"],
+            title=row["title"],
+            link=row["link"],
+            description=row["description"],
+            body_content=row["body_content"],
+            status=PostStatus.from_trusted(row["status"]),
+            created_at_utc=Timestamp.from_trusted(row["created_at_utc"]),
+            updated_at_utc=Timestamp.from_trusted(row["updated_at_utc"]),
+            version=row["version"],
+        )
@@ -1,13 +1,20 @@
+from typing import TYPE_CHECKING, Any, Mapping
+
 from app.core.domain.interfaces.base_entity import BaseEntity
 from app.core.domain.value_objects.document_vo import Document
 from app.core.domain.value_objects.email_vo import Email
 from app.core.domain.value_objects.password_vo import Password
 from app.core.domain.value_objects.person_name_vo import PersonName
 from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
 
+if TYPE_CHECKING:
+    from app.core.domain.interfaces.password_hasher import PasswordHasher
+
 
 class User(BaseEntity):
+    __slots__ = ('last_accessed_at_utc', 'password', 'admin', 'super_admin')
 
     def __init__(self,
                  id: UUIDv7,
@@ -15,12 +22,13 @@ class User(BaseEntity):
                  name: PersonName,
                  email: Email,
                  phone: PhoneNumber,
-                 created_at_utc: str,
-                 updated_at_utc: str,
-                 last_accessed_at_utc: str,
+                 created_at_utc: Timestamp | None,
+                 updated_at_utc: Timestamp | None,
+                 last_accessed_at_utc: Timestamp | None,
                  password: Password,
                  admin: bool = False,
                  super_admin: bool = False,
+                 version: int = 0,
                  ) -> None:
 
         super().__init__(
@@ -30,8 +38,36 @@ class User(BaseEntity):
             email,
             phone,
             created_at_utc,
-            updated_at_utc)
+            updated_at_utc,
+            version)
         self.last_accessed_at_utc = last_accessed_at_utc
         self.password = password
         self.admin = admin
         self.super_admin = super_admin
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any], password_hasher: "PasswordHasher") -> "User":
+        """
+        Builds a User from a stored row without revalidating its fields.
+
+        Only for data that was written through the validated constructors;
+        `row` holds the normalized values under the User attribute names and
+        `password` holds the stored hash. Timestamps are epoch microseconds,
+        `last_accessed_at_utc` is NULL for users that never logged in.
+        """
+        last_accessed_at_utc = row["last_accessed_at_utc"]
+        return cls(
+            id=UUIDv7.from_trusted(row["id"]),
+            document=Document.from_trusted(row["document"]),
+            name=PersonName.from_trusted(row["name"]),
+            email=Email.from_trusted(row["email"]),
+            phone=PhoneNumber.from_trusted(row["phone"]),
+            created_at_utc=Timestamp.from_trusted(row["created_at_utc"]),
+            updated_at_utc=Timestamp.from_trusted(row["updated_at_utc"]),
+            last_accessed_at_utc=(Timestamp.from_trusted(last_accessed_at_utc)
+                                  if last_accessed_at_utc is not None else None),
+            password=Password.from_trusted(row["password"], password_hasher),
+            admin=bool(row["admin"]),
+            super_admin=bool(row["super_admin"]),
+            version=row["version"],
+        )
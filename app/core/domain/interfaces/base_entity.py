@@ -4,10 +4,14 @@ from app.core.domain.value_objects.document_vo import Document
 from app.core.domain.value_objects.person_name_vo import PersonName
 from app.core.domain.value_objects.phone_number_vo import PhoneNumber
 from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
 
 
 class BaseEntity(ABC):
+    __slots__ = ('id', 'document', 'name', 'email', 'phone',
+                 'created_at_utc', 'updated_at_utc', 'version')
+
     @abstractmethod
     def __init__(self,
                  id: UUIDv7,
@@ -15,13 +19,17 @@ class BaseEntity(ABC):
                  name: PersonName,
                  email: Email,
                  phone: PhoneNumber,
-                 created_at_utc: str,
-                 updated_at_utc: str,
+                 created_at_utc: Timestamp | None,
+                 updated_at_utc: Timestamp | None,
+                 version: int = 0,
                  ) -> None:
         self.id = id
         self.document = document
         self.name = name
         self.email = email
         self.phone = phone
-        self.created_at_utc = created_at_utc
-        self.updated_at_utc = updated_at_utc
+        # without an explicit value the creation time is the one in the UUIDv7
+        self.created_at_utc = created_at_utc or Timestamp.from_uuidv7_or_now(id)
+        self.updated_at_utc = updated_at_utc or self.created_at_utc
+        # bumped by the repository on every write, used for compare-and-swap
+        self.version = version
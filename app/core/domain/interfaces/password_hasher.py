@@ -33,3 +33,17 @@ class PasswordHasher(ABC):
             True if the password attempt matches the hash, False otherwise.
         """
         pass
+
+    async def hash_async(self, password: Password) -> str:
+        """
+        `hash` without blocking the event loop. This default runs it in the
+        loop's default thread pool; hashers with a pool of their own override it.
+        """
+        # imported here, the domain layer is also used without any event loop
+        import asyncio
+        return await asyncio.to_thread(self.hash, password)
+
+    async def verify_async(self, password: Password, hashed_password: str) -> bool:
+        """`verify` without blocking the event loop, see `hash_async`."""
+        import asyncio
+        return await asyncio.to_thread(self.verify, password, hashed_password)
@@ -0,0 +1,43 @@
+class UseCaseInvocation:
+    """
+    One use-case call as seen by an observer.
+
+    The use case moves through named phases with `enter`, reports Value
+    Objects it failed to build with `validation_failed`, then calls
+    `finish` once. This base class does nothing, which is what use cases
+    get without an observer.
+    """
+
+    __slots__ = ()
+
+    def enter(self, phase: str) -> None:
+        """Ends the running phase, if any, and starts `phase`."""
+
+    def validation_failed(self, value_object: type, error: Exception) -> None:
+        """Building a `value_object` from the use case input raised `error`."""
+
+    def finish(self, error: BaseException | None = None) -> None:
+        pass
+
+
+_NO_OP_INVOCATION = UseCaseInvocation()
+
+
+class UseCaseObserver:
+    """
+    Receives the phases, validation failures, repository calls and password
+    hashes of use cases. This default ignores them at the cost of a few
+    method calls per use case; RecordingUseCaseObserver aggregates them.
+
+    Repository calls and hashes are reported by ObservedUserRepository and
+    ObservedPasswordHasher, wrapped around the real ones.
+    """
+
+    def start(self, use_case: str) -> UseCaseInvocation:
+        return _NO_OP_INVOCATION
+
+    def repository_call(self, method: str, seconds: float) -> None:
+        pass
+
+    def password_hash(self, seconds: float) -> None:
+        pass
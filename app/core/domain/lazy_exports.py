@@ -0,0 +1,30 @@
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(package: str,
+                 exports: dict[str, tuple[str, ...]],
+                 ) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Module-level `__getattr__` and `__dir__` (PEP 562) for `package`, whose
+    public names live in the submodules given by `exports` (module -> names)
+    and are only imported on first access. Each name is then stored in the
+    package namespace, so `__getattr__` runs once per name.
+    """
+    module_by_name = {name: module for module, names in exports.items() for name in names}
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = module_by_name.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        # with a fromlist, __import__ returns the submodule itself and spares importing importlib
+        value = getattr(__import__(module, fromlist=(name,)), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(namespace.keys() | module_by_name.keys())
+
+    return __getattr__, __dir__
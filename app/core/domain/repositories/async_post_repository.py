@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from app.core.domain.entities.post import Post
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+class AsyncPostRepository(ABC):
+
+    @abstractmethod
+    async def get_by_id(self, id: UUIDv7) -> Post | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self, user_id: UUIDv7) -> list[Post]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, post: Post) -> UUIDv7:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, post: Post) -> None:
+        """Compare-and-swap write on `post.version`, see UserRepository.update."""
+        raise NotImplementedError
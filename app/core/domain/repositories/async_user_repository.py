@@ -0,0 +1,117 @@
+import asyncio
+import copy
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
+
+from app.core.domain.entities.user import User
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+
+
+class AsyncUserRepository(ABC):
+
+    @abstractmethod
+    async def get_by_id(self, id: UUIDv7) -> User | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self) -> list[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self,
+                       limit: int,
+                       after_id: UUIDv7 | None = None,
+                       admin: bool | None = None,
+                       super_admin: bool | None = None,
+                       ) -> list[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, user: User) -> UUIDv7:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, user: User) -> None:
+        """Compare-and-swap write on `user.version`, see UserRepository.update."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_email(self, email: Email) -> User | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_document(self, document: Document) -> User | None:
+        raise NotImplementedError
+
+    async def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        """
+        Persists only `changes`, see UserRepository.patch. This fallback
+        loads the user and writes it back whole.
+        """
+        user = await self.get_by_id(id)
+        if not user:
+            raise BusinessRuleException(
+                f"User with id '{id.value}' does not exist.")
+
+        if expected_version is not None and user.version != expected_version:
+            raise ConcurrencyConflictException(
+                f"User with id '{id.value}' was modified concurrently.")
+
+        patched_user = copy.copy(user)
+        for name, value in changes.items():
+            setattr(patched_user, name, value)
+
+        await self.update(patched_user)
+
+    async def find_conflicts(self,
+                             email: Email | None = None,
+                             phone: PhoneNumber | None = None,
+                             document: Document | None = None,
+                             exclude_id: UUIDv7 | None = None,
+                             ) -> set[str]:
+        """
+        Names of the given values already used by a user other than
+        `exclude_id`, see UserRepository.find_conflicts. This fallback runs
+        the single-key lookups concurrently.
+        """
+        lookups = [
+            (field, lookup(value))
+            for field, value, lookup in (
+                ("email", email, self.get_by_email),
+                ("phone", phone, self.get_by_phone_number),
+                ("document", document, self.get_by_document),
+            )
+            if value is not None
+        ]
+        users = await asyncio.gather(*(lookup for _, lookup in lookups))
+
+        return {field for (field, _), user in zip(lookups, users)
+                if user and (exclude_id is None or user.id != exclude_id)}
+
+    async def iter_all(self,
+                       page_size: int = 1000,
+                       admin: bool | None = None,
+                       super_admin: bool | None = None,
+                       ) -> AsyncIterator[User]:
+        if page_size <= 0:
+            raise ValueError(f"Page size ({page_size}) must be positive")
+
+        after_id = None
+        while True:
+            page = await self.get_page(page_size, after_id, admin, super_admin)
+            for user in page:
+                yield user
+
+            if len(page) < page_size:
+                return
+
+            after_id = page[-1].id
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from app.core.domain.entities.post import Post
+from app.core.domain.value_objects.post_status_vo import PostStatus
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
 
 
@@ -20,4 +22,54 @@ class PostRepository(ABC):
 
     @abstractmethod
     def update(self, post: Post) -> None:
+        """
+        Compare-and-swap write on `post.version`, same contract as
+        UserRepository.update.
+        """
         raise NotImplementedError
+
+    def create_many(self, posts: list[Post]) -> list[UUIDv7]:
+        """Adapters should override this fallback with a single bulk write."""
+        return [self.create(post) for post in posts]
+
+    def get_page(self,
+                 user_id: UUIDv7,
+                 limit: int,
+                 status: PostStatus | None = None,
+                 created_from: Timestamp | None = None,
+                 created_to: Timestamp | None = None,
+                 before_id: UUIDv7 | None = None,
+                 ) -> list[Post]:
+        """
+        Returns up to `limit` posts of `user_id`, newest first.
+
+        Posts are ordered by their UUIDv7 id; `before_id` is the keyset
+        cursor (the last id of the previous page). `created_from` is
+        inclusive and `created_to` exclusive. Adapters should override this
+        fallback, which loads every post of the user.
+        """
+        posts = sorted(self.get_all(user_id), key=lambda post: post.id.value, reverse=True)
+        page = []
+        for post in posts:
+            if before_id is not None and post.id.value >= before_id.value:
+                continue
+            if status is not None and post.status != status:
+                continue
+            if created_from is not None and post.created_at_utc < created_from:
+                continue
+            if created_to is not None and post.created_at_utc >= created_to:
+                continue
+
+            page.append(post)
+            if len(page) == limit:
+                break
+
+        return page
+
+    def count_by_status(self, user_id: UUIDv7) -> dict[PostStatus, int]:
+        """Number of posts of `user_id` per status; statuses without posts are left out."""
+        counts: dict[PostStatus, int] = {}
+        for post in self.get_all(user_id):
+            counts[post.status] = counts.get(post.status, 0) + 1
+
+        return counts
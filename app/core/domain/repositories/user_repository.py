@@ -1,10 +1,15 @@
+import copy
 from abc import ABC, abstractmethod
+from typing import Any, Iterator
 
 from app.core.domain.entities.user import User
 from app.core.domain.value_objects.document_vo import Document
 from app.core.domain.value_objects.email_vo import Email
 from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
 
 
 class UserRepository(ABC):
@@ -23,6 +28,11 @@ class UserRepository(ABC):
 
     @abstractmethod
     def update(self, user: User) -> None:
+        """
+        Compare-and-swap write: succeeds only while the stored version still
+        equals `user.version`, then bumps it and sets `user.version` to the new
+        value. Raises ConcurrencyConflictException otherwise.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -36,3 +46,160 @@ class UserRepository(ABC):
     @abstractmethod
     def get_by_document(self, document: Document) -> User | None:
         raise NotImplementedError
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        return [self.create(user) for user in users]
+
+    def get_by_emails(self, emails: list[Email]) -> list[User]:
+        users = (self.get_by_email(email) for email in emails)
+        return [user for user in users if user]
+
+    def get_by_phone_numbers(self, telefones: list[PhoneNumber]) -> list[User]:
+        users = (self.get_by_phone_number(telefone) for telefone in telefones)
+        return [user for user in users if user]
+
+    def get_by_documents(self, documents: list[Document]) -> list[User]:
+        users = (self.get_by_document(document) for document in documents)
+        return [user for user in users if user]
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        """
+        Persists only `changes`, a mapping of User attribute name to new value.
+
+        With `expected_version` the write is a compare-and-swap like update().
+        This fallback loads the user and writes it back whole; adapters should
+        override it to write just the dirty columns.
+        """
+        user = self.get_by_id(id)
+        if not user:
+            raise BusinessRuleException(
+                f"User with id '{id.value}' does not exist.")
+
+        if expected_version is not None and user.version != expected_version:
+            raise ConcurrencyConflictException(
+                f"User with id '{id.value}' was modified concurrently.")
+
+        patched_user = copy.copy(user)
+        for name, value in changes.items():
+            setattr(patched_user, name, value)
+
+        self.update(patched_user)
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        """
+        Moves `last_accessed_at_utc` forward for many users at once
+        (user id value -> timestamp). Older timestamps and unknown ids are
+        ignored.
+
+        Adapters should override this fallback to write the column alone,
+        without bumping the version, so access tracking never conflicts with
+        profile updates. The fallback can only write through `patch`, which
+        bumps it: a profile update that read the user before the flush then
+        gets a ConcurrencyConflictException and has to retry.
+        """
+        for user_id, accessed_at_utc in last_accesses.items():
+            user = self.get_by_id(UUIDv7(user_id))
+            if user and (user.last_accessed_at_utc is None
+                         or user.last_accessed_at_utc < accessed_at_utc):
+                self.patch(user.id, {"last_accessed_at_utc": accessed_at_utc})
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        """Returns the users found among `ids`, keyed by their id value."""
+        users = (self.get_by_id(id) for id in ids)
+        return {user.id.value: user for user in users if user}
+
+    def get_permissions(self, id: UUIDv7) -> tuple[bool, bool] | None:
+        """
+        Returns `(admin, super_admin)` of the user, None if it does not exist.
+        Adapters should override this fallback to read only those two fields.
+        """
+        user = self.get_by_id(id)
+        return (user.admin, user.super_admin) if user else None
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        """
+        Answers every uniqueness question of a write in one call.
+
+        Returns the names ("email", "phone", "document") of the given values
+        already used by a user other than `exclude_id`. Adapters backed by a
+        remote store should override this fallback with a single query.
+        """
+        lookups = (
+            ("email", email, self.get_by_email),
+            ("phone", phone, self.get_by_phone_number),
+            ("document", document, self.get_by_document),
+        )
+        conflicts = set()
+        for field, value, lookup in lookups:
+            if value is None:
+                continue
+
+            user = lookup(value)
+            if user and (exclude_id is None or user.id != exclude_id):
+                conflicts.add(field)
+
+        return conflicts
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        """
+        Returns up to `limit` users ordered by id, starting right after
+        `after_id`. UUIDv7 ids are time-ordered, so this is a keyset page in
+        creation order. Adapters should override this fallback, which loads
+        every user.
+        """
+        if limit <= 0:
+            raise ValueError(f"Page limit ({limit}) must be positive")
+
+        users = sorted(self.get_all(), key=lambda user: user.id.value)
+        page = []
+        for user in users:
+            if after_id is not None and user.id.value <= after_id.value:
+                continue
+            if admin is not None and user.admin != admin:
+                continue
+            if super_admin is not None and user.super_admin != super_admin:
+                continue
+
+            page.append(user)
+            if len(page) == limit:
+                break
+
+        return page
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        """
+        Returns the users created in [start, end), oldest first. Adapters
+        should override this fallback, which loads every user.
+        """
+        users = [user for user in self.get_all()
+                 if start <= user.created_at_utc < end]
+        users.sort(key=lambda user: (user.created_at_utc, user.id.value))
+        return users
+
+    def iter_all(self,
+                 page_size: int = 1000,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> Iterator[User]:
+        if page_size <= 0:
+            raise ValueError(f"Page size ({page_size}) must be positive")
+
+        after_id = None
+        while True:
+            page = self.get_page(page_size, after_id, admin, super_admin)
+            yield from page
+
+            if len(page) < page_size:
+                return
+
+            after_id = page[-1].id
@@ -1,14 +1,24 @@
 import re
 from dataclasses import dataclass
-from typing import ClassVar, Pattern
+from operator import mul
+from typing import ClassVar, Iterable, Pattern
 
+from app.core.domain.value_objects.lazy_class_attribute import LazyClassAttribute
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Document:
     value: str
 
-    __REGEX_VALID_CHARACTERS: ClassVar[Pattern[str]] = re.compile(
-        r'^[0-9./-]+$')
+    __REGEX_VALID_CHARACTERS: ClassVar[Pattern[str]] = LazyClassAttribute(lambda: re.compile(
+        r'^[0-9./-]+$'))
+
+    __FORMATTING_CHARACTERS: ClassVar[dict[int, None]] = str.maketrans('', '', './-')
+
+    __CPF_WEIGHTS_1: ClassVar[tuple[int, ...]] = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+    __CPF_WEIGHTS_2: ClassVar[tuple[int, ...]] = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+    __CNPJ_WEIGHTS_1: ClassVar[tuple[int, ...]] = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+    __CNPJ_WEIGHTS_2: ClassVar[tuple[int, ...]] = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
 
     def __post_init__(self):
         if not isinstance(self.value, str):
@@ -74,6 +84,76 @@ class Document:
 
         return True
 
+    @classmethod
+    def validate_many(cls, values: Iterable[str]) -> tuple[list[bool], list[str | None]]:
+        """
+        Validates a batch of raw documents without building Document instances.
+
+        Accepts exactly the same inputs as the constructor. Returns a mask with
+        the validation result of each input and, at the same position, its
+        digits-only value (None when the input has invalid characters).
+        """
+        values = list(values)
+        mask = [False] * len(values)
+        normalized: list[str | None] = [None] * len(values)
+        cpf_positions: list[int] = []
+        cnpj_positions: list[int] = []
+
+        for position, value in enumerate(values):
+            if not isinstance(value, str) or not value:
+                continue
+
+            # keeps the `$` semantics of __REGEX_VALID_CHARACTERS
+            checked_value = value[:-1] if value.endswith('\n') else value
+            digits = checked_value.translate(cls.__FORMATTING_CHARACTERS)
+            if not checked_value or (digits and not (digits.isascii() and digits.isdigit())):
+                continue
+
+            normalized[position] = digits
+            if len(digits) == 11:
+                cpf_positions.append(position)
+            elif len(digits) == 14:
+                cnpj_positions.append(position)
+
+        cpf_1, cpf_2 = cls.__CPF_WEIGHTS_1, cls.__CPF_WEIGHTS_2
+        cpf_offset_1, cpf_offset_2 = 48 * sum(cpf_1), 48 * sum(cpf_2)
+        for position in cpf_positions:
+            cpf = normalized[position]
+            if cpf.count(cpf[0]) == 11:
+                continue
+
+            digits = cpf.encode('ascii')
+            rest = (sum(map(mul, cpf_1, digits)) - cpf_offset_1) * 10 % 11
+            if (rest if rest < 10 else 0) != digits[9] - 48:
+                continue
+
+            rest = (sum(map(mul, cpf_2, digits)) - cpf_offset_2) * 10 % 11
+            mask[position] = (rest if rest < 10 else 0) == digits[10] - 48
+
+        cnpj_1, cnpj_2 = cls.__CNPJ_WEIGHTS_1, cls.__CNPJ_WEIGHTS_2
+        cnpj_offset_1, cnpj_offset_2 = 48 * sum(cnpj_1), 48 * sum(cnpj_2)
+        for position in cnpj_positions:
+            cnpj = normalized[position]
+            if cnpj.count(cnpj[0]) == 14:
+                continue
+
+            digits = cnpj.encode('ascii')
+            rest = (sum(map(mul, cnpj_1, digits)) - cnpj_offset_1) % 11
+            if (0 if rest < 2 else 11 - rest) != digits[12] - 48:
+                continue
+
+            rest = (sum(map(mul, cnpj_2, digits)) - cnpj_offset_2) % 11
+            mask[position] = (0 if rest < 2 else 11 - rest) == digits[13] - 48
+
+        return mask, normalized
+
+    @classmethod
+    def from_trusted(cls, value: str) -> "Document":
+        """Rehydrates a stored digits-only document without recomputing its check digits."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        return instance
+
     def is_cpf(self) -> bool:
 
         return len(self.value) == 11
@@ -1,32 +1,31 @@
 from dataclasses import dataclass
-from typing import ClassVar, Pattern
-import re
+from typing import ClassVar
 
+from app.core.domain.value_objects.value_object_cache import ValueObjectCache
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Email:
     address: str
 
-    # _EMAIL_REGEX: ClassVar[Pattern[str]] = re.compile(
-    #     r"^[a-zA-Z0-9!#$%&'*+/=?^_\`{|}~.-]+@[a-zA-Z0-9.-]+\.[a-zA-Z0-9-]+$"
-    # )
-
-    __LOCAL_REGEX: ClassVar[Pattern[str]] = re.compile(
-        r"^[a-zA-Z0-9_.-]+$"
-    )
+    cache: ClassVar[ValueObjectCache["Email"]] = ValueObjectCache()
 
-    __DOMAIN_REGEX: ClassVar[Pattern[str]] = re.compile(
-        r"^[a-zA-Z0-9.-]+$"
-    )
+    # character-class tables, membership is tested in C with issuperset
+    __LOCAL_CHARS: ClassVar[frozenset[str]] = frozenset(
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.-")
 
-    __LABEL_REGEX: ClassVar[Pattern[str]] = re.compile(
-        r"^[a-zA-Z0-9-]+$"
-    )
+    __DOMAIN_CHARS: ClassVar[frozenset[str]] = frozenset(
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-")
 
     __MAX_LOCAL_PART_LEN: ClassVar[int] = 60
     __MAX_DOMAIN_PART_LEN: ClassVar[int] = 190
     __MAX_TOTAL_LEN: ClassVar[int] = 250
 
+    @classmethod
+    def parse(cls, address: str) -> "Email":
+        """Builds an Email through the shared normalization cache, when enabled."""
+        return cls.cache.get_or_create(address, cls)
+
     def __post_init__(self):
         if not isinstance(self.address, str):
             raise TypeError("Email address must be a string")
@@ -41,12 +40,13 @@ class Email:
             raise ValueError(
                 f"Email total length ({len(cleaned_address)}) invalid (must be 1-{self.__MAX_TOTAL_LEN})")
 
-        try:
-            local_part, domain_part = cleaned_address.split('@', 1)
-        except ValueError:
-            # Deveria ser pego pelo regex, mas é uma garantia extra
+        at = cleaned_address.find('@')
+        if at < 0:
             raise ValueError("Email address must contain exactly one '@'")
 
+        local_part = cleaned_address[:at]
+        domain_part = cleaned_address[at + 1:]
+
         if not (0 < len(local_part) <= self.__MAX_LOCAL_PART_LEN):
             raise ValueError(
                 f"Email local part length ({len(local_part)}) invalid (must be 1-{self.__MAX_LOCAL_PART_LEN})")
@@ -58,7 +58,7 @@ class Email:
             raise ValueError(
                 "Email local part cannot contain consecutive dots")
 
-        if not self.__LOCAL_REGEX.fullmatch(local_part):
+        if not self.__LOCAL_CHARS.issuperset(local_part):
             raise ValueError(
                 f"Email local part '{local_part}' contains invalid characters")
 
@@ -66,31 +66,39 @@ class Email:
             raise ValueError(
                 f"Email domain part length ({len(domain_part)}) invalid (must be 1-{self.__MAX_DOMAIN_PART_LEN})")
 
-        if not self.__DOMAIN_REGEX.fullmatch(domain_part):
+        if not self.__DOMAIN_CHARS.issuperset(domain_part):
             raise ValueError(
                 f"Email domain part '{domain_part}' contains invalid characters")
 
-        domain_labels = domain_part.split('.')
-
         # Precisa de pelo menos dominio.tld
-        if not domain_labels or len(domain_labels) < 2:
+        if '.' not in domain_part:
             raise ValueError(
                 "Email domain must include at least one dot and a TLD")
 
-        for label in domain_labels:
-            if not label:  # Checa rótulos vazios (ex: domain..com)
+        # rótulos só têm [a-zA-Z0-9-] aqui, já garantido pela tabela do domínio
+        if '-' not in domain_part:
+            # sem hífen, o único erro possível é um rótulo vazio
+            if domain_part[0] == '.' or domain_part[-1] == '.' or '..' in domain_part:
                 raise ValueError(
                     "Email domain cannot have empty labels (consecutive dots)")
-            if label.startswith('-') or label.endswith('-'):
-                raise ValueError(
-                    f"Email domain label '{label}' cannot start or end with a hyphen")
-            # Checa caracteres inválidos (redundante se o regex inicial for bom, mas seguro)
-            if not self.__LABEL_REGEX.fullmatch(label):
-                raise ValueError(
-                    f"Email domain label '{label}' contains invalid characters")
+        else:
+            for label in domain_part.split('.'):
+                if not label:  # Checa rótulos vazios (ex: domain..com)
+                    raise ValueError(
+                        "Email domain cannot have empty labels (consecutive dots)")
+                if label[0] == '-' or label[-1] == '-':
+                    raise ValueError(
+                        f"Email domain label '{label}' cannot start or end with a hyphen")
 
         object.__setattr__(self, 'address', cleaned_address)
 
+    @classmethod
+    def from_trusted(cls, address: str) -> "Email":
+        """Rehydrates a stored, already stripped address without parsing it again."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'address', address)
+        return instance
+
     def get_local_part(self) -> str:
         """Returns the local part of the email address (before @)."""
         return self.address.split('@', 1)[0]
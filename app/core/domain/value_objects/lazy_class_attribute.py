@@ -0,0 +1,41 @@
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyClassAttribute(Generic[T]):
+    """
+    Class attribute of a dataclass Value Object built by `factory` on first
+    access, for compiled regexes and lookup tables that would otherwise be
+    built at import time. The value then replaces the descriptor on the
+    class, so later lookups are plain class attribute lookups. Two threads
+    racing on the first access both build it; the factory must be
+    side-effect free.
+
+    `dataclass` reads every annotated class attribute while decorating, so
+    until the class is a dataclass, access through it returns the
+    descriptor itself.
+    """
+
+    __slots__ = ("factory", "name")
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object | None, owner: type) -> "T | LazyClassAttribute[T]":
+        if instance is None and "__dataclass_fields__" not in owner.__dict__:
+            return self
+
+        value = self.factory()
+        # dataclass(slots=True) replaces the class __set_name__ saw, so the
+        # owner is looked up again here
+        for klass in owner.__mro__:
+            if klass.__dict__.get(self.name) is self:
+                setattr(klass, self.name, value)
+                break
+
+        return value
@@ -2,11 +2,13 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, Pattern
 
+from app.core.domain.value_objects.lazy_class_attribute import LazyClassAttribute
+
 if TYPE_CHECKING:
     from app.core.domain.interfaces.password_hasher import PasswordHasher
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Password:
     value: str
 
@@ -14,8 +16,8 @@ class Password:
 
     is_hashed: bool = False
 
-    __REGEX_VALID_CHARACTERS: ClassVar[Pattern[str]] = re.compile(
-        r'^[a-zA-Z0-9!@#$%^&*()_+{}\[\]:;<>,.?~\\/-]+$')
+    __REGEX_VALID_CHARACTERS: ClassVar[Pattern[str]] = LazyClassAttribute(lambda: re.compile(
+        r'^[a-zA-Z0-9!@#$%^&*()_+{}\[\]:;<>,.?~\\/-]+$'))
 
     __MIN_LENGTH: ClassVar[int] = 8
 
@@ -27,14 +29,7 @@ class Password:
             object.__setattr__(self, 'value', self.value)
 
         else:
-            if not self.__REGEX_VALID_CHARACTERS.fullmatch(self.value):
-                raise ValueError(
-                    "Password contains invalid characters. Only alphanumeric and special characters are allowed."
-                )
-
-            if len(self.value) < self.__MIN_LENGTH:
-                raise ValueError(
-                    "Password must be at least 8 characters long.")
+            Password.validate(self.value)
 
             hashed_value = self.password_hasher.hash(self)
 
@@ -42,6 +37,42 @@ class Password:
 
             object.__setattr__(self, 'is_hashed', True)
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Checks a plain password as the constructor does, without hashing it."""
+        if not isinstance(value, str):
+            raise TypeError("Password must be a string")
+
+        if not cls.__REGEX_VALID_CHARACTERS.fullmatch(value):
+            raise ValueError(
+                "Password contains invalid characters. Only alphanumeric and special characters are allowed."
+            )
+
+        if len(value) < cls.__MIN_LENGTH:
+            raise ValueError(
+                "Password must be at least 8 characters long.")
+
+    @classmethod
+    def from_validated_plain(cls, value: str, password_hasher: "PasswordHasher") -> "Password":
+        """
+        Wraps a plain password that already passed `validate`, unhashed, to
+        hand it to a PasswordHasher without hashing it here.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        object.__setattr__(instance, 'password_hasher', password_hasher)
+        object.__setattr__(instance, 'is_hashed', False)
+        return instance
+
+    @classmethod
+    def from_trusted(cls, value: str, password_hasher: "PasswordHasher") -> "Password":
+        """Rehydrates a stored hash, skipping validation and hashing."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        object.__setattr__(instance, 'password_hasher', password_hasher)
+        object.__setattr__(instance, 'is_hashed', True)
+        return instance
+
     def __str__(self) -> str:
         return "*" * len(self.value)
 
@@ -2,15 +2,25 @@ from dataclasses import dataclass
 from typing import ClassVar, Pattern
 import re
 
+from app.core.domain.value_objects.lazy_class_attribute import LazyClassAttribute
+from app.core.domain.value_objects.value_object_cache import ValueObjectCache
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PersonName:
     name: str
 
+    cache: ClassVar[ValueObjectCache["PersonName"]] = ValueObjectCache()
+
     __MAX_LENGTH: ClassVar[int] = 100
 
-    __PERSON_NAME_CARACTERS: ClassVar[Pattern[str]] = re.compile(
-        r'^[a-zA-Z\s\u00C0-\u00FF]+$')
+    __PERSON_NAME_CARACTERS: ClassVar[Pattern[str]] = LazyClassAttribute(lambda: re.compile(
+        r'^[a-zA-Z\s\u00C0-\u00FF]+$'))
+
+    @classmethod
+    def parse(cls, name: str) -> "PersonName":
+        """Builds a PersonName through the shared normalization cache, when enabled."""
+        return cls.cache.get_or_create(name, cls)
 
     def __post_init__(self):
         if not isinstance(self.name, str):
@@ -35,6 +45,13 @@ class PersonName:
 
         object.__setattr__(self, 'name', cleaned_name)
 
+    @classmethod
+    def from_trusted(cls, name: str) -> "PersonName":
+        """Rehydrates a stored name whose whitespace is already collapsed."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'name', name)
+        return instance
+
     def __str__(self) -> str:
         """Returns the person's name string."""
         return self.name
@@ -1,23 +1,21 @@
 from dataclasses import dataclass
-from typing import ClassVar, Pattern, Set
-import re
+from typing import ClassVar, Set
 
+from app.core.domain.value_objects.lazy_class_attribute import LazyClassAttribute
+from app.core.domain.value_objects.value_object_cache import ValueObjectCache
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PhoneNumber:
     number: str
 
-    __PHONE_REGEX: ClassVar[Pattern[str]] = re.compile(
-        r"^55[1-9][0-9]{1}\d{9}$"
-    )
+    cache: ClassVar[ValueObjectCache["PhoneNumber"]] = ValueObjectCache()
 
-    __VALID_CARACTERS: ClassVar[Pattern[str]] = re.compile(
-        r"^[0-9\-()+]+$"
-    )
+    __VALID_CARACTERS: ClassVar[frozenset[str]] = frozenset("0123456789-()+")
 
     __MAX_LENGTH: ClassVar[int] = 30
 
-    __DDD_CODES_BRAZIL: ClassVar[Set[str]] = {
+    __DDD_CODES_BRAZIL: ClassVar[Set[str]] = LazyClassAttribute(lambda: {
         "11", "12", "13", "14", "15", "16", "17", "18", "19",  # São Paulo
         "21", "22", "24",  # Rio de Janeiro
         "27", "28",  # Espírito Santo
@@ -45,7 +43,16 @@ class PhoneNumber:
         "95",  # Roraima
         "96",  # Amapá
         "98", "99"  # Maranhão
-    }
+    })
+
+    # 100 entries, indexed by the DDD as an integer
+    __IS_DDD: ClassVar[tuple[bool, ...]] = LazyClassAttribute(lambda: tuple(map(
+        PhoneNumber.__DDD_CODES_BRAZIL.__contains__, (f"{code:02d}" for code in range(100)))))
+
+    @classmethod
+    def parse(cls, number: str) -> "PhoneNumber":
+        """Builds a PhoneNumber through the shared normalization cache, when enabled."""
+        return cls.cache.get_or_create(number, cls)
 
     def __post_init__(self):
         if not isinstance(self.number, str):
@@ -57,7 +64,7 @@ class PhoneNumber:
             raise ValueError(
                 "Phone number cannot be empty or whitespace only")
 
-        if not self.__VALID_CARACTERS.fullmatch(cleaned_number):
+        if not self.__VALID_CARACTERS.issuperset(cleaned_number):
             raise ValueError(
                 f"Phone number contains invalid characters ({cleaned_number})")
 
@@ -65,33 +72,33 @@ class PhoneNumber:
             raise ValueError(
                 f"Phone number length ({len(cleaned_number)}) invalid (must be 1-{self.__MAX_LENGTH})")
 
-        number = re.sub(r'\D', '', cleaned_number)
+        # only ASCII digits are left, the characters were checked above
+        number = cleaned_number.replace('-', '').replace('(', '').replace(')', '').replace('+', '')
 
         if not number.startswith("55"):
             number = "55" + number
 
-        ddi = number[:2]
+        if len(number) < 4 or not self.__IS_DDD[(ord(number[2]) - 48) * 10 + ord(number[3]) - 48]:
+            raise ValueError(f"Invalid DDD code: {number[2:4]}")
 
-        ddd = number[2:4]
-        if ddd not in self.__DDD_CODES_BRAZIL:
-            raise ValueError(f"Invalid DDD code: {ddd}")
+        remainder_length = len(number) - 4
 
-        remainder = number[4:]
-
-        if len(remainder) < 8 or len(remainder) > 9:
+        if remainder_length < 8 or remainder_length > 9:
             raise ValueError(
-                f"Invalid phone number length without ddi and ddd: {len(remainder)}")
-
-        if len(remainder) < 9:
-            remainder = "9" + remainder
+                f"Invalid phone number length without ddi and ddd: {remainder_length}")
 
-        formated_number = f"{ddi}{ddd}{remainder[:5]}{remainder[5:]}"
+        # 55 + a known DDD + 9 digits, the old final format check could not fail here
+        if remainder_length < 9:
+            number = f"{number[:4]}9{number[4:]}"
 
-        if not self.__PHONE_REGEX.fullmatch(formated_number):
-            raise ValueError(
-                f"Invalid phone number format: '{formated_number}'")
+        object.__setattr__(self, 'number', number)
 
-        object.__setattr__(self, 'number', formated_number)
+    @classmethod
+    def from_trusted(cls, number: str) -> "PhoneNumber":
+        """Rehydrates a stored number already in the 55 + DDD + 9 digits format."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'number', number)
+        return instance
 
     def __str__(self) -> str:
         return f"+{self.number[:2]} ({self.number[2:4]}) {self.number[4:5]}{self.number[5:9]}-{self.number[9:]}"
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
 
 
 class StatusEnum(Enum):
@@ -8,16 +9,32 @@ class StatusEnum(Enum):
     PUBLISHED = "PUBLISHED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostStatus:
 
     status: StatusEnum
 
+    # one shared instance per StatusEnum member
+    __INSTANCES: ClassVar[dict[StatusEnum, "PostStatus"]] = {}
+
+    def __new__(cls, status: StatusEnum | None = None):
+        instance = cls.__INSTANCES.get(status) if isinstance(status, StatusEnum) else None
+        return instance if instance is not None else object.__new__(cls)
+
     def __post_init__(self):
         if not isinstance(self.status, StatusEnum):
             raise ValueError("Status must be an instance of StatusEnum")
 
         object.__setattr__(self, "status", self.status)
+        PostStatus.__INSTANCES.setdefault(self.status, self)
+
+    @classmethod
+    def from_trusted(cls, status: str) -> "PostStatus":
+        """Rehydrates a stored status name into its shared instance."""
+        return cls(StatusEnum[status])
+
+    def __reduce__(self):
+        return (PostStatus, (self.status,))
 
     def __str__(self):
         """ Returns the string representation of the status. """
@@ -0,0 +1,87 @@
+import datetime
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class Timestamp:
+    """
+    UTC instant stored as integer microseconds since the Unix epoch.
+
+    Comparing, sorting and range filtering work on the integer; the ISO 8601
+    text is only built when `isoformat()`/`str()` is called.
+    """
+
+    epoch_us: int
+
+    __EPOCH: ClassVar[datetime.datetime] = datetime.datetime(
+        1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+    __ONE_MICROSECOND: ClassVar[datetime.timedelta] = datetime.timedelta(
+        microseconds=1)
+
+    def __post_init__(self):
+        if not isinstance(self.epoch_us, int) or isinstance(self.epoch_us, bool):
+            raise TypeError("Timestamp must be an integer of epoch microseconds")
+
+    @classmethod
+    def now(cls) -> "Timestamp":
+        # time_ns is a single clock read, no datetime object is built
+        return cls(time.time_ns() // 1000)
+
+    @classmethod
+    def from_trusted(cls, epoch_us: int) -> "Timestamp":
+        """Rehydrates a stored epoch value without type checks."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'epoch_us', epoch_us)
+        return instance
+
+    @classmethod
+    def from_iso(cls, value: str) -> "Timestamp":
+        """Parses an ISO 8601 string; naive values are taken as UTC."""
+        if not isinstance(value, str):
+            raise TypeError("Timestamp must be an ISO 8601 string")
+
+        try:
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Invalid ISO 8601 timestamp: '{value}'")
+
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+
+        return cls((parsed - cls.__EPOCH) // cls.__ONE_MICROSECOND)
+
+    @classmethod
+    def from_uuidv7(cls, uuidv7: "UUIDv7") -> "Timestamp":
+        """Creation time carried in the 48-bit millisecond prefix of a UUIDv7."""
+        try:
+            timestamp_ms = uuidv7.timestamp_ms()
+        except ValueError:
+            raise ValueError(f"UUID '{uuidv7.value}' has no UUIDv7 timestamp prefix")
+
+        return cls(timestamp_ms * 1000)
+
+    @classmethod
+    def from_uuidv7_or_now(cls, uuidv7: "UUIDv7") -> "Timestamp":
+        """`from_uuidv7`, or the current time for ids without a hex prefix (UUIDv7 accepts any string)."""
+        try:
+            return cls.from_uuidv7(uuidv7)
+        except ValueError:
+            return cls.now()
+
+    def to_datetime(self) -> datetime.datetime:
+        return self.__EPOCH + datetime.timedelta(microseconds=self.epoch_us)
+
+    def isoformat(self) -> str:
+        return self.to_datetime().isoformat()
+
+    def __str__(self) -> str:
+        return self.isoformat()
+
+    def __repr__(self) -> str:
+        return f"Timestamp({self.isoformat()})"
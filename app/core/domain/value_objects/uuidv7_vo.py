@@ -1,49 +1,209 @@
 import os
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from typing import ClassVar
+
+
+class UUIDv7Generator:
+    """
+    Monotonic UUIDv7 generator (RFC 9562, section 6.2, method 1).
+
+    The 12 bits of rand_a plus the 30 leftmost bits of rand_b hold a counter
+    that is seeded randomly on every new millisecond and incremented for ids
+    generated inside the same one, so ids from one process always sort in
+    generation order. The remaining 32 bits come from a pooled os.urandom buffer.
+    """
+
+    __COUNTER_MAX: ClassVar[int] = (1 << 42) - 1
+    __POOL_SIZE: ClassVar[int] = 4096
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__reset()
+
+    def __reset(self) -> None:
+        self.__last_timestamp = 0
+        self.__counter = 0
+        self.__pool = b''
+        self.__pool_position = 0
+
+    def reset_after_fork(self) -> None:
+        self.__lock = threading.Lock()
+        self.__reset()
+
+    def __random_bits(self, size: int) -> int:
+        if self.__pool_position + size > len(self.__pool):
+            self.__pool = os.urandom(self.__POOL_SIZE)
+            self.__pool_position = 0
+
+        start = self.__pool_position
+        self.__pool_position += size
+        return int.from_bytes(self.__pool[start:self.__pool_position], 'big')
+
+    def __next(self) -> int:
+        timestamp = time.time_ns() // 1_000_000
+
+        if timestamp > self.__last_timestamp:
+            self.__last_timestamp = timestamp
+            # leftmost bit stays clear to leave room for increments
+            self.__counter = self.__random_bits(6) >> 7
+
+        else:
+            self.__counter += 1
+            if self.__counter > self.__COUNTER_MAX:
+                self.__last_timestamp += 1
+                self.__counter = self.__random_bits(6) >> 7
+
+        rand_a = self.__counter >> 30
+        rand_b = ((self.__counter & 0x3FFFFFFF) << 32) | self.__random_bits(4)
+
+        return (self.__last_timestamp << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b
+
+    def next_int(self) -> int:
+        with self.__lock:
+            return self.__next()
+
+    def next_ints(self, count: int) -> list[int]:
+        with self.__lock:
+            return [self.__next() for _ in range(count)]
+
+    def next_bytes(self) -> bytes:
+        return self.next_int().to_bytes(16, 'big')
+
+    @staticmethod
+    def format(value: int) -> str:
+        hex_value = f'{value:032x}'
+        return f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}'
+
+
+default_uuidv7_generator = UUIDv7Generator()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=default_uuidv7_generator.reset_after_fork)
+
+
+_NOT_CANONICAL = -1
+
+
+def _parse_canonical(value: str) -> int:
+    """The integer of a lowercase 8-4-4-4-12 hex UUID string, _NOT_CANONICAL for anything else."""
+    if len(value) != 36 or value[8] != '-' or value[13] != '-' or value[18] != '-' or value[23] != '-':
+        return _NOT_CANONICAL
+
+    hex_value = value[:8] + value[9:13] + value[14:18] + value[19:23] + value[24:]
+    try:
+        number = int(hex_value, 16)
+    except ValueError:
+        return _NOT_CANONICAL
+
+    # int() also takes uppercase digits, signs, underscores and spaces
+    return number if f'{number:032x}' == hex_value else _NOT_CANONICAL
 
 
-@dataclass(frozen=True)
 class UUIDv7:
-    value: str | None
+    """
+    Immutable UUIDv7 id, held as its 128-bit integer when it was generated or
+    decoded and as its string when it was parsed. `value` formats the integer
+    on first access and keeps the string, so ids that are only compared,
+    hashed or written as bytes are never formatted.
+
+    The integer is the canonical form: a parsed id is converted on its first
+    comparison or hash. Strings that are not a canonical UUID (still
+    accepted) are compared and hashed as strings.
 
-    def __post_init__(self):
-        if self.value is None:
-            final_uuidv7 = UUIDv7.__generate_uuidv7()
-            object.__setattr__(self, 'value', final_uuidv7)
+    Hand-written rather than a dataclass, whose fields cannot be lazy; it
+    behaves like the other frozen Value Objects otherwise.
+    """
 
-        elif isinstance(self.value, str):
-            object.__setattr__(self, 'value', self.value)
+    __slots__ = ("_int", "_value")
+
+    def __init__(self, value: str | None) -> None:
+        if value is None:
+            object.__setattr__(self, '_int', default_uuidv7_generator.next_int())
+            object.__setattr__(self, '_value', None)
+
+        elif isinstance(value, str):
+            object.__setattr__(self, '_int', None)
+            object.__setattr__(self, '_value', value)
 
         else:
             raise ValueError("Invalid UUID format")
 
-    @staticmethod
-    def __generate_uuidv7() -> str:
-        # random bytes
-        value = bytearray(os.urandom(16))
-
-        # current timestamp in ms
-        timestamp = int(time.time() * 1000)
-
-        # timestamp
-        value[0] = (timestamp >> 40) & 0xFF
-        value[1] = (timestamp >> 32) & 0xFF
-        value[2] = (timestamp >> 24) & 0xFF
-        value[3] = (timestamp >> 16) & 0xFF
-        value[4] = (timestamp >> 8) & 0xFF
-        value[5] = timestamp & 0xFF
-
-        # version and variant
-        value[6] = (value[6] & 0x0F) | 0x70
-        value[8] = (value[8] & 0x3F) | 0x80
-
-        formated_uuid = '-'.join([
-            ''.join(f'{byte:02x}' for byte in value[0:4]),
-            ''.join(f'{byte:02x}' for byte in value[4:6]),
-            ''.join(f'{byte:02x}' for byte in value[6:8]),
-            ''.join(f'{byte:02x}' for byte in value[8:10]),
-            ''.join(f'{byte:02x}' for byte in value[10:16])
-        ])
-
-        return formated_uuid
+    @property
+    def value(self) -> str:
+        if self._value is None:
+            object.__setattr__(self, '_value', UUIDv7Generator.format(self._int))
+        return self._value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        number = self.__canonical_int()
+        other_number = other.__canonical_int()
+        if number == _NOT_CANONICAL and other_number == _NOT_CANONICAL:
+            return self._value == other._value
+        return number == other_number
+
+    def __hash__(self) -> int:
+        number = self.__canonical_int()
+        return hash(number) if number != _NOT_CANONICAL else hash(self._value)
+
+    def __canonical_int(self) -> int:
+        number = self._int
+        if number is None:
+            number = _parse_canonical(self._value)
+            object.__setattr__(self, '_int', number)
+        return number
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
+
+    def __reduce__(self):
+        return (self.__class__.from_trusted, (self.value,))
+
+    @classmethod
+    def generate_many(cls, count: int) -> list["UUIDv7"]:
+        """Generates `count` ordered ids under a single generator lock."""
+        return [cls.from_int(value) for value in default_uuidv7_generator.next_ints(count)]
+
+    @classmethod
+    def from_int(cls, value: int) -> "UUIDv7":
+        instance = object.__new__(cls)
+        object.__setattr__(instance, '_int', value)
+        object.__setattr__(instance, '_value', None)
+        return instance
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "UUIDv7":
+        return cls.from_int(int.from_bytes(value, 'big'))
+
+    @classmethod
+    def from_trusted(cls, value: str) -> "UUIDv7":
+        """Wraps a stored id string as is."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, '_int', None)
+        object.__setattr__(instance, '_value', value)
+        return instance
+
+    def timestamp_ms(self) -> int:
+        """Unix time in milliseconds stored in the first 48 bits."""
+        number = self.__canonical_int()
+        if number != _NOT_CANONICAL:
+            return number >> 80
+        return int(self._value[:8] + self._value[9:13], 16)
+
+    def to_int(self) -> int:
+        number = self.__canonical_int()
+        if number != _NOT_CANONICAL:
+            return number
+        return int(self._value.replace('-', ''), 16)
+
+    def to_bytes(self) -> bytes:
+        return self.to_int().to_bytes(16, 'big')
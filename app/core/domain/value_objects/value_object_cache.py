@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ValueObjectCache(Generic[T]):
+    """
+    Bounded LRU cache of validated Value Objects keyed on the raw input.
+
+    Value Objects are frozen, so the same instance can be handed to every
+    caller. Validation failures are cached too and raised again as a fresh
+    exception of the same type and message. The cache starts disabled.
+    """
+
+    def __init__(self, max_size: int = 10_000, enabled: bool = False) -> None:
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, T | Exception] = OrderedDict()
+        self.max_size = max_size
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, max_size: int | None = None, enabled: bool | None = None) -> None:
+        with self.__lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if enabled is not None:
+                self.enabled = enabled
+            self.__evict()
+
+    def enable(self) -> None:
+        self.configure(enabled=True)
+
+    def disable(self) -> None:
+        self.configure(enabled=False)
+        self.clear()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+            }
+
+    def get_or_create(self, raw: str, factory: Callable[[str], T]) -> T:
+        if not self.enabled or not isinstance(raw, str):
+            return factory(raw)
+
+        with self.__lock:
+            entry = self.__entries.get(raw)
+            if entry is not None:
+                self.__entries.move_to_end(raw)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is None:
+            try:
+                entry = factory(raw)
+            except (TypeError, ValueError) as error:
+                entry = error
+
+            with self.__lock:
+                self.__entries[raw] = entry
+                self.__evict()
+
+        if isinstance(entry, Exception):
+            raise type(entry)(*entry.args)
+
+        return entry
+
+    def __evict(self) -> None:
+        while len(self.__entries) > max(self.max_size, 0):
+            self.__entries.popitem(last=False)
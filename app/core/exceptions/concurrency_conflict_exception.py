@@ -0,0 +1,2 @@
+class ConcurrencyConflictException(Exception):
+    pass
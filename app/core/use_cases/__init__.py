@@ -0,0 +1,42 @@
+"""
+Application use cases, exported lazily: importing one use case from here
+only imports its module and the domain objects that module needs.
+"""
+from typing import TYPE_CHECKING
+
+from app.core.domain.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from app.core.use_cases.user.async_create_user import AsyncCreateUserUseCase
+    from app.core.use_cases.user.async_get_user import AsyncGetUserUseCase
+    from app.core.use_cases.user.async_get_user_by_email import AsyncGetUserByEmailUseCase
+    from app.core.use_cases.user.async_list_users import AsyncListUsersUseCase
+    from app.core.use_cases.user.async_update_user import AsyncUpdateUserUseCase
+    from app.core.use_cases.user.create_user import CreateUserUseCase
+    from app.core.use_cases.user.creator_permission_cache import CreatorPermissionCache, CreatorPermissions
+    from app.core.use_cases.user.get_user import GetUserUseCase
+    from app.core.use_cases.user.get_user_by_email import GetUserByEmailUseCase
+    from app.core.use_cases.user.import_users import ImportUserResult, ImportUserRow, ImportUsersUseCase
+    from app.core.use_cases.user.list_users import ListUsersUseCase, UserPage
+    from app.core.use_cases.user.update_user import UpdateUserUseCase
+    from app.core.use_cases.user.user_access_tracker import UserAccessTracker
+
+_EXPORTS = {
+    "app.core.use_cases.user.async_create_user": ("AsyncCreateUserUseCase",),
+    "app.core.use_cases.user.async_get_user": ("AsyncGetUserUseCase",),
+    "app.core.use_cases.user.async_get_user_by_email": ("AsyncGetUserByEmailUseCase",),
+    "app.core.use_cases.user.async_list_users": ("AsyncListUsersUseCase",),
+    "app.core.use_cases.user.async_update_user": ("AsyncUpdateUserUseCase",),
+    "app.core.use_cases.user.create_user": ("CreateUserUseCase",),
+    "app.core.use_cases.user.creator_permission_cache": ("CreatorPermissionCache", "CreatorPermissions"),
+    "app.core.use_cases.user.get_user": ("GetUserUseCase",),
+    "app.core.use_cases.user.get_user_by_email": ("GetUserByEmailUseCase",),
+    "app.core.use_cases.user.import_users": ("ImportUserResult", "ImportUserRow", "ImportUsersUseCase"),
+    "app.core.use_cases.user.list_users": ("ListUsersUseCase", "UserPage"),
+    "app.core.use_cases.user.update_user": ("UpdateUserUseCase",),
+    "app.core.use_cases.user.user_access_tracker": ("UserAccessTracker",),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
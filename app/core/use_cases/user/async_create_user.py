@@ -0,0 +1,89 @@
+import asyncio
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.password_vo import Password
+from app.core.domain.value_objects.person_name_vo import PersonName
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+class AsyncCreateUserUseCase:
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        document_str: str,
+        name_str: str,
+        email_str: str,
+        phone_number_str: str,
+        password_str: str,
+        password_hasher: PasswordHasher,
+        creator_id: str,
+        admin: bool = False,
+        super_admin: bool = False
+    ) -> str | None:
+
+        creator_user = await self.user_repository.get_by_id(UUIDv7(creator_id))
+        if not creator_user:
+            raise ValueError(f"Creator with id '{creator_id}' does not exist.")
+
+        if super_admin == True and creator_user.super_admin == False:
+            raise ValueError("Only super admins can create super admins.")
+
+        if creator_user.admin == False:
+            raise ValueError("Only admins can create new users.")
+
+        id_vo = UUIDv7(None)
+        document_vo = Document(document_str)
+        name_vo = PersonName.parse(name_str)
+        email_vo = Email.parse(email_str)
+        phone_number_vo = PhoneNumber.parse(phone_number_str)
+        Password.validate(password_str)
+
+        email_user, phone_user, document_user = await asyncio.gather(
+            self.user_repository.get_by_email(email_vo),
+            self.user_repository.get_by_phone_number(phone_number_vo),
+            self.user_repository.get_by_document(document_vo),
+        )
+
+        if email_user and email_user.email == email_vo:
+            raise ValueError(f"The email '{email_str}' is already in use.")
+
+        if phone_user and phone_user.phone == phone_number_vo:
+            raise ValueError(
+                f"The phone number '{phone_number_str}' is already in use.")
+
+        if document_user and document_user.document == document_vo:
+            raise ValueError(
+                f"The document '{document_str}' is already in use.")
+
+        # hashed off the event loop, and only once the user is known to be new
+        hashed_password = await password_hasher.hash_async(
+            Password.from_validated_plain(password_str, password_hasher))
+        password_vo = Password(hashed_password, password_hasher, is_hashed=True)
+
+        current_data = Timestamp.now()
+
+        user = User(
+            id=id_vo,
+            document=document_vo,
+            name=name_vo,
+            email=email_vo,
+            phone=phone_number_vo,
+            password=password_vo,
+            created_at_utc=current_data,
+            updated_at_utc=current_data,
+            last_accessed_at_utc=None,
+            admin=admin,
+            super_admin=super_admin,
+        )
+
+        user_uuid = await self.user_repository.create(user)
+
+        return user_uuid.value
@@ -0,0 +1,20 @@
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+class AsyncGetUserUseCase:
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, id: str) -> User:
+
+        id_vo = UUIDv7(id)
+
+        user_data = await self.user_repository.get_by_id(id_vo)
+
+        if not user_data:
+            raise ValueError(f"User with id '{id}' does not found.")
+
+        else:
+            return user_data
@@ -0,0 +1,20 @@
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+from app.core.domain.value_objects.email_vo import Email
+
+
+class AsyncGetUserByEmailUseCase:
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, email: str) -> User:
+
+        email_vo = Email.parse(email)
+
+        user_data = await self.user_repository.get_by_email(email=email_vo)
+
+        if not user_data:
+            raise ValueError(f"User with email '{email}' does not found.")
+
+        else:
+            return user_data
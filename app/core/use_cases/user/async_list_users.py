@@ -0,0 +1,57 @@
+from typing import AsyncIterator
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+from app.core.use_cases.user.list_users import (MAX_PAGE_SIZE, UserPage,
+                                                decode_continuation_token,
+                                                encode_continuation_token)
+
+
+class AsyncListUsersUseCase:
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self) -> list[User]:
+
+        users = await self.user_repository.get_all()
+
+        return users
+
+    async def execute_page(
+        self,
+        page_size: int = 100,
+        continuation_token: str | None = None,
+        admin: bool | None = None,
+        super_admin: bool | None = None,
+    ) -> UserPage:
+
+        if not (0 < page_size <= MAX_PAGE_SIZE):
+            raise ValueError(
+                f"Page size ({page_size}) invalid (must be 1-{MAX_PAGE_SIZE})")
+
+        after_id = decode_continuation_token(
+            continuation_token) if continuation_token else None
+
+        # one extra row tells whether another page exists
+        users = await self.user_repository.get_page(
+            page_size + 1, after_id, admin, super_admin)
+
+        if len(users) <= page_size:
+            return UserPage(users=users, next_token=None)
+
+        users = users[:page_size]
+
+        return UserPage(users=users, next_token=encode_continuation_token(users[-1].id))
+
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        admin: bool | None = None,
+        super_admin: bool | None = None,
+    ) -> AsyncIterator[User]:
+
+        if not (0 < page_size <= MAX_PAGE_SIZE):
+            raise ValueError(
+                f"Page size ({page_size}) invalid (must be 1-{MAX_PAGE_SIZE})")
+
+        return self.user_repository.iter_all(page_size, admin, super_admin)
@@ -0,0 +1,158 @@
+import asyncio
+import random
+from typing import Awaitable, Callable
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.repositories.async_user_repository import AsyncUserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.password_vo import Password
+from app.core.domain.value_objects.person_name_vo import PersonName
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+
+
+class AsyncUpdateUserUseCase:
+    def __init__(self,
+                 user_repository: AsyncUserRepository,
+                 max_retries: int = 5,
+                 retry_backoff_seconds: float = 0.005):
+        self.user_repository = user_repository
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+    async def execute(
+        self,
+        creator_id: str,
+        id_str: str,
+        password_hasher: PasswordHasher | None = None,
+        document_str: str | None = None,
+        name_str: str | None = None,
+        email_str: str | None = None,
+        phone_number_str: str | None = None,
+        password_str: str | None = None,
+        last_accessed_at_utc_str: str | None = None,
+        admin: bool | None = None,
+    ) -> None:
+
+        if password_str and not password_hasher:
+            raise ValueError(
+                "Password hasher must be provided when updating password.")
+
+        # shared by every attempt, so a retry after a conflict does not hash again
+        hashed_passwords: list[Password] = []
+
+        async def new_password() -> Password:
+            if not hashed_passwords:
+                Password.validate(password_str)
+                hashed_password = await password_hasher.hash_async(
+                    Password.from_validated_plain(password_str, password_hasher))
+                hashed_passwords.append(Password(hashed_password, password_hasher, is_hashed=True))
+            return hashed_passwords[0]
+
+        # optimistic concurrency: on a version conflict, reread and retry
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.__execute_once(
+                    creator_id, id_str, document_str, name_str, email_str,
+                    phone_number_str, new_password if password_str else None,
+                    last_accessed_at_utc_str, admin)
+
+            except ConcurrencyConflictException:
+                if attempt == self.max_retries:
+                    raise
+
+                await asyncio.sleep(self.retry_backoff_seconds *
+                                    (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    async def __execute_once(
+        self,
+        creator_id: str,
+        id_str: str,
+        document_str: str | None = None,
+        name_str: str | None = None,
+        email_str: str | None = None,
+        phone_number_str: str | None = None,
+        new_password: Callable[[], Awaitable[Password]] | None = None,
+        last_accessed_at_utc_str: str | None = None,
+        admin: bool | None = None,
+    ) -> None:
+
+        id_vo = UUIDv7(id_str)
+
+        creator_user, existing_user = await asyncio.gather(
+            self.user_repository.get_by_id(UUIDv7(creator_id)),
+            self.user_repository.get_by_id(id_vo),
+        )
+
+        if not creator_user:
+            raise ValueError(f"Creator with id '{creator_id}' does not exist.")
+
+        if admin == True and creator_user.admin == False and creator_user.super_admin == False:
+            raise ValueError(f"Only admin can change admin permissions.")
+
+        if not existing_user:
+            raise ValueError(f"User with id '{id_str}' does not exist.")
+
+        changes = {}
+
+        if document_str:
+            document_vo = Document(document_str)
+            if document_vo != existing_user.document:
+                changes["document"] = document_vo
+
+        if name_str:
+            name_vo = PersonName.parse(name_str)
+            if name_vo != existing_user.name:
+                changes["name"] = name_vo
+
+        if email_str:
+            email_vo = Email.parse(email_str)
+            if email_vo != existing_user.email:
+                changes["email"] = email_vo
+
+        if phone_number_str:
+            phone_number_vo = PhoneNumber.parse(phone_number_str)
+            if phone_number_vo != existing_user.phone:
+                changes["phone"] = phone_number_vo
+
+        if admin is not None and admin != existing_user.admin:
+            changes["admin"] = admin
+
+        if last_accessed_at_utc_str:
+            last_accessed_at_utc = Timestamp.from_iso(last_accessed_at_utc_str)
+            if last_accessed_at_utc != existing_user.last_accessed_at_utc:
+                changes["last_accessed_at_utc"] = last_accessed_at_utc
+
+        conflicts = await self.user_repository.find_conflicts(
+            email=changes.get("email"),
+            phone=changes.get("phone"),
+            document=changes.get("document"),
+            exclude_id=id_vo,
+        ) if changes.keys() & {"email", "phone", "document"} else set()
+
+        if "document" in conflicts:
+            raise ValueError(
+                f"The document '{document_str}' is already in use.")
+
+        if "email" in conflicts:
+            raise ValueError(f"The email '{email_str}' is already in use.")
+
+        if "phone" in conflicts:
+            raise ValueError(
+                f"The phone number '{phone_number_str}' is already in use.")
+
+        if new_password:
+            changes["password"] = await new_password()
+
+        if not changes:
+            return None
+
+        changes["updated_at_utc"] = Timestamp.now()
+
+        await self.user_repository.patch(
+            id_vo, changes, expected_version=existing_user.version)
+
+        return None
@@ -1,6 +1,6 @@
-import datetime
 
 from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.interfaces.use_case_observer import UseCaseInvocation, UseCaseObserver
 from app.core.domain.entities.user import User
 from app.core.domain.repositories.user_repository import UserRepository
 from app.core.domain.value_objects.document_vo import Document
@@ -8,12 +8,19 @@ from app.core.domain.value_objects.email_vo import Email
 from app.core.domain.value_objects.password_vo import Password
 from app.core.domain.value_objects.person_name_vo import PersonName
 from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.use_cases.user.creator_permission_cache import CreatorPermissionCache
 
 
 class CreateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self,
+                 user_repository: UserRepository,
+                 permission_cache: CreatorPermissionCache | None = None,
+                 observer: UseCaseObserver | None = None):
         self.user_repository = user_repository
+        self.permission_cache = permission_cache or CreatorPermissionCache.shared(user_repository)
+        self.observer = observer or UseCaseObserver()
 
     def execute(
         self,
@@ -28,39 +35,84 @@ class CreateUserUseCase:
         super_admin: bool = False
     ) -> str | None:
 
-        creator_user = self.user_repository.get_by_id(UUIDv7(creator_id))
-        if not creator_user:
+        invocation = self.observer.start("CreateUserUseCase")
+        try:
+            user_id = self.__execute(
+                invocation, document_str, name_str, email_str, phone_number_str, password_str,
+                password_hasher, creator_id, admin, super_admin)
+        except BaseException as error:
+            invocation.finish(error)
+            raise
+
+        invocation.finish()
+        return user_id
+
+    def __execute(
+        self,
+        invocation: UseCaseInvocation,
+        document_str: str,
+        name_str: str,
+        email_str: str,
+        phone_number_str: str,
+        password_str: str,
+        password_hasher: PasswordHasher,
+        creator_id: str,
+        admin: bool,
+        super_admin: bool,
+    ) -> str | None:
+
+        invocation.enter("authorization")
+        try:
+            creator_id_vo = UUIDv7(creator_id)
+        except (TypeError, ValueError) as error:
+            invocation.validation_failed(UUIDv7, error)
+            raise
+
+        creator_permissions = self.permission_cache.get(creator_id_vo)
+        if not creator_permissions:
             raise ValueError(f"Creator with id '{creator_id}' does not exist.")
 
-        if super_admin == True and creator_user.super_admin == False:
+        if super_admin == True and creator_permissions.super_admin == False:
             raise ValueError("Only super admins can create super admins.")
 
-        if creator_user.admin == False:
+        if creator_permissions.admin == False:
             raise ValueError("Only admins can create new users.")
 
+        invocation.enter("validation")
         id_vo = UUIDv7(None)
-        document_vo = Document(document_str)
-        name_vo = PersonName(name_str)
-        email_vo = Email(email_str)
-        phone_number_vo = PhoneNumber(phone_number_str)
-        password_vo = Password(password_str, password_hasher)
-
-        email_user = self.user_repository.get_by_email(email_vo)
-        if email_user and email_user.email == email_vo:
+        # the Value Object under construction, reported if it fails
+        value_object: type = Document
+        try:
+            document_vo = Document(document_str)
+            value_object = PersonName
+            name_vo = PersonName.parse(name_str)
+            value_object = Email
+            email_vo = Email.parse(email_str)
+            value_object = PhoneNumber
+            phone_number_vo = PhoneNumber.parse(phone_number_str)
+            value_object = Password
+            password_vo = Password(password_str, password_hasher)
+        except (TypeError, ValueError) as error:
+            invocation.validation_failed(value_object, error)
+            raise
+
+        invocation.enter("conflict_check")
+        conflicts = self.user_repository.find_conflicts(
+            email=email_vo, phone=phone_number_vo, document=document_vo)
+
+        if "email" in conflicts:
             raise ValueError(f"The email '{email_str}' is already in use.")
 
-        phone_user = self.user_repository.get_by_phone_number(phone_number_vo)
-        if phone_user and phone_user.phone == phone_number_vo:
+        if "phone" in conflicts:
             raise ValueError(
                 f"The phone number '{phone_number_str}' is already in use.")
 
-        document_user = self.user_repository.get_by_document(document_vo)
-        if document_user and document_user.document == document_vo:
+        if "document" in conflicts:
             raise ValueError(
                 f"The document '{document_str}' is already in use.")
 
-        current_data = str(datetime.datetime.now(
-            datetime.timezone.utc).isoformat())
+        invocation.enter("persist")
+        current_data = Timestamp.now()
 
         user = User(
             id=id_vo,
@@ -71,7 +123,7 @@ class CreateUserUseCase:
             password=password_vo,
             created_at_utc=current_data,
             updated_at_utc=current_data,
-            last_accessed_at_utc="",
+            last_accessed_at_utc=None,
             admin=admin,
             super_admin=super_admin,
         )
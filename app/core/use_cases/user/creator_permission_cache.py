@@ -0,0 +1,141 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+@dataclass(frozen=True, slots=True)
+class CreatorPermissions:
+    admin: bool
+    super_admin: bool
+
+
+class CreatorPermissionCache:
+    """
+    Caches the `(admin, super_admin)` flags of the users acting as creators.
+
+    Misses are loaded with `UserRepository.get_permissions`, which reads only
+    the two flags. Entries live `ttl_seconds`; use cases sharing one instance
+    invalidate an entry as soon as they change its flags, other writers are
+    only seen once the entry expires. Use cases given no cache share the one
+    of their repository, see `shared`. `ttl_seconds=0` caches nothing and
+    only narrows the load.
+    """
+
+    def __init__(self,
+                 user_repository: UserRepository,
+                 ttl_seconds: float = 5.0,
+                 max_size: int = 10_000,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.user_repository = user_repository
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[CreatorPermissions, float]] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls, user_repository: UserRepository) -> "CreatorPermissionCache":
+        """
+        The default-configured cache of `user_repository`, created on first
+        use, so admin changes made by one use case reach the others.
+        """
+        with _shared_lock:
+            cache = _shared_caches.get(user_repository)
+            if cache is None:
+                # a proxy, the cache must not keep its repository (the key) alive
+                cache = _shared_caches[user_repository] = cls(weakref.proxy(user_repository))
+            return cache
+
+    def get(self, creator_id: UUIDv7) -> CreatorPermissions | None:
+        """Returns the creator's flags, None when the user does not exist."""
+        permissions = self.get_cached(creator_id)
+        if permissions is not None:
+            return permissions
+
+        generation = self.generation()
+        flags = self.user_repository.get_permissions(creator_id)
+        if flags is None:
+            return None
+
+        permissions = CreatorPermissions(*flags)
+        with self._lock:
+            # flags changed while loading, the loaded ones may be stale
+            if generation == self._generation:
+                self._store(creator_id.value, permissions)
+
+        return permissions
+
+    def get_cached(self, creator_id: UUIDv7) -> CreatorPermissions | None:
+        with self._lock:
+            entry = self._entries.get(creator_id.value)
+            if entry is not None:
+                if entry[1] > self._clock():
+                    self._entries.move_to_end(creator_id.value)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[creator_id.value]
+
+            self.misses += 1
+            return None
+
+    def generation(self) -> int:
+        """Token to read before loading a creator, for `remember`."""
+        with self._lock:
+            return self._generation
+
+    def remember(self, user: User, generation: int) -> CreatorPermissions:
+        """
+        Caches the flags of a creator the caller has just loaded, unless an
+        invalidation happened since `generation` was read before the load.
+        """
+        permissions = CreatorPermissions(user.admin, user.super_admin)
+        with self._lock:
+            # flags changed while loading, the loaded ones may be stale
+            if generation == self._generation:
+                self._store(user.id.value, permissions)
+
+        return permissions
+
+    def invalidate(self, *user_ids: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def _store(self, user_id: str, permissions: CreatorPermissions) -> None:
+        if self.ttl_seconds <= 0:
+            return
+
+        self._entries[user_id] = (permissions, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_shared_lock = threading.Lock()
+_shared_caches: "weakref.WeakKeyDictionary[UserRepository, CreatorPermissionCache]" = weakref.WeakKeyDictionary()
@@ -9,7 +9,7 @@ class GetUserByEmailUseCase:
 
     def execute(self, email: str) -> User:
 
-        email_vo = Email(email)
+        email_vo = Email.parse(email)
 
         user_data = self.user_repository.get_by_email(email=email_vo)
 
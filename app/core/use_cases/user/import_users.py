@@ -0,0 +1,220 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.password_vo import Password
+from app.core.domain.value_objects.person_name_vo import PersonName
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.use_cases.user.creator_permission_cache import CreatorPermissionCache, CreatorPermissions
+
+
+@dataclass(frozen=True)
+class ImportUserRow:
+    document_str: str
+    name_str: str
+    email_str: str
+    phone_number_str: str
+    password_str: str
+    admin: bool = False
+    super_admin: bool = False
+
+
+@dataclass(frozen=True)
+class ImportUserResult:
+    row_number: int
+    user_id: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class _PendingRow:
+    row_number: int
+    row: ImportUserRow
+    document: Document
+    name: PersonName
+    email: Email
+    phone: PhoneNumber
+    password: Password | None = None
+    error: str | None = None
+
+
+class ImportUsersUseCase:
+    """
+    Batch counterpart of CreateUserUseCase.
+
+    Rows are consumed in chunks of `batch_size`, so the input can be streamed
+    from a CSV/JSONL reader. A failing row is reported in its result and never
+    stops the rest of the import.
+    """
+
+    def __init__(self,
+                 user_repository: UserRepository,
+                 batch_size: int = 1000,
+                 max_hash_workers: int | None = None,
+                 permission_cache: CreatorPermissionCache | None = None):
+        self.user_repository = user_repository
+        self.permission_cache = permission_cache or CreatorPermissionCache.shared(user_repository)
+        self.batch_size = batch_size
+        self.max_hash_workers = max_hash_workers
+
+    def execute(
+        self,
+        rows: Iterable[ImportUserRow],
+        password_hasher: PasswordHasher,
+        creator_id: str,
+    ) -> list[ImportUserResult]:
+
+        creator_permissions = self.permission_cache.get(UUIDv7(creator_id))
+        if not creator_permissions:
+            raise ValueError(f"Creator with id '{creator_id}' does not exist.")
+
+        if creator_permissions.admin == False:
+            raise ValueError("Only admins can create new users.")
+
+        results: list[ImportUserResult] = []
+        seen_keys: set[tuple[str, str]] = set()
+        numbered_rows = enumerate(rows, start=1)
+
+        with ThreadPoolExecutor(max_workers=self.max_hash_workers) as executor:
+            while chunk := list(itertools.islice(numbered_rows, self.batch_size)):
+                results.extend(self.__import_chunk(
+                    chunk, creator_permissions, password_hasher, seen_keys, executor))
+
+        return results
+
+    def __import_chunk(
+        self,
+        chunk: list[tuple[int, ImportUserRow]],
+        creator_permissions: CreatorPermissions,
+        password_hasher: PasswordHasher,
+        seen_keys: set[tuple[str, str]],
+        executor: ThreadPoolExecutor,
+    ) -> list[ImportUserResult]:
+
+        results: dict[int, ImportUserResult] = {}
+        pending: list[_PendingRow] = []
+
+        for row_number, row in chunk:
+            try:
+                if row.super_admin == True and creator_permissions.super_admin == False:
+                    raise ValueError(
+                        "Only super admins can create super admins.")
+
+                pending.append(_PendingRow(
+                    row_number=row_number,
+                    row=row,
+                    document=Document(row.document_str),
+                    name=PersonName.parse(row.name_str),
+                    email=Email.parse(row.email_str),
+                    phone=PhoneNumber.parse(row.phone_number_str),
+                ))
+            except (TypeError, ValueError) as error:
+                results[row_number] = ImportUserResult(
+                    row_number, error=str(error))
+
+        taken_emails = {user.email.address for user in
+                        self.user_repository.get_by_emails([item.email for item in pending])}
+        taken_phones = {user.phone.number for user in
+                        self.user_repository.get_by_phone_numbers([item.phone for item in pending])}
+        taken_documents = {user.document.value for user in
+                           self.user_repository.get_by_documents([item.document for item in pending])}
+
+        for item in pending:
+            for kind, key, taken, message in self.__keys(item, taken_emails, taken_phones, taken_documents):
+                if key in taken or (kind, key) in seen_keys:
+                    item.error = message
+                    break
+
+        def hash_password(item: _PendingRow) -> None:
+            try:
+                item.password = Password(item.row.password_str, password_hasher)
+            except (TypeError, ValueError) as error:
+                item.error = str(error)
+
+        list(executor.map(hash_password, [item for item in pending if item.error is None]))
+
+        # keys are reserved in row order once a row passed every check, so a
+        # row rejected for its password leaves them to a later duplicate
+        for item in pending:
+            if item.error is not None:
+                continue
+
+            keys = self.__keys(item, taken_emails, taken_phones, taken_documents)
+            for kind, key, _, message in keys:
+                if (kind, key) in seen_keys:
+                    item.error = message
+                    break
+            else:
+                seen_keys.update((kind, key) for kind, key, _, _ in keys)
+
+        current_data = Timestamp.now()
+
+        users_to_create = []
+        for item in pending:
+            if item.error is not None:
+                results[item.row_number] = ImportUserResult(
+                    item.row_number, error=item.error)
+                continue
+
+            user = User(
+                id=UUIDv7(None),
+                document=item.document,
+                name=item.name,
+                email=item.email,
+                phone=item.phone,
+                password=item.password,
+                created_at_utc=current_data,
+                updated_at_utc=current_data,
+                last_accessed_at_utc=None,
+                admin=item.row.admin,
+                super_admin=item.row.super_admin,
+            )
+            users_to_create.append((item.row_number, user))
+
+        if users_to_create:
+            try:
+                user_ids = self.user_repository.create_many(
+                    [user for _, user in users_to_create])
+            except BusinessRuleException:
+                # a key taken since the lookup (or an all-or-nothing insert)
+                # fails the whole chunk, retry it row by row
+                user_ids = []
+                for row_number, user in users_to_create:
+                    try:
+                        user_ids.append(self.user_repository.create(user))
+                    except BusinessRuleException as error:
+                        user_ids.append(None)
+                        results[row_number] = ImportUserResult(
+                            row_number, error=str(error))
+
+            for (row_number, _), user_id in zip(users_to_create, user_ids):
+                if user_id is not None:
+                    results[row_number] = ImportUserResult(
+                        row_number, user_id=user_id.value)
+
+        return [results[row_number] for row_number, _ in chunk]
+
+    @staticmethod
+    def __keys(
+        item: _PendingRow,
+        taken_emails: set[str],
+        taken_phones: set[str],
+        taken_documents: set[str],
+    ) -> tuple[tuple[str, str, set[str], str], ...]:
+        return (
+            ("email", item.email.address, taken_emails,
+             f"The email '{item.row.email_str}' is already in use."),
+            ("phone", item.phone.number, taken_phones,
+             f"The phone number '{item.row.phone_number_str}' is already in use."),
+            ("document", item.document.value, taken_documents,
+             f"The document '{item.row.document_str}' is already in use."),
+        )
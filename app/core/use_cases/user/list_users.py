@@ -1,5 +1,36 @@
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass
+from typing import Iterator
+
 from app.core.domain.entities.user import User
 from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+
+@dataclass(frozen=True)
+class UserPage:
+    users: list[User]
+    next_token: str | None
+
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_continuation_token(last_id: UUIDv7) -> str:
+    return base64.urlsafe_b64encode(last_id.value.encode()).decode().rstrip('=')
+
+
+def decode_continuation_token(token: str) -> UUIDv7:
+    try:
+        padding = '=' * (-len(token) % 4)
+        value = base64.urlsafe_b64decode(token + padding).decode()
+        uuid.UUID(value)
+        return UUIDv7(value)
+
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid continuation token.")
 
 
 class ListUsersUseCase:
@@ -11,3 +42,42 @@ class ListUsersUseCase:
         users = self.user_repository.get_all()
 
         return users
+
+    def execute_page(
+        self,
+        page_size: int = 100,
+        continuation_token: str | None = None,
+        admin: bool | None = None,
+        super_admin: bool | None = None,
+    ) -> UserPage:
+
+        if not (0 < page_size <= MAX_PAGE_SIZE):
+            raise ValueError(
+                f"Page size ({page_size}) invalid (must be 1-{MAX_PAGE_SIZE})")
+
+        after_id = decode_continuation_token(
+            continuation_token) if continuation_token else None
+
+        # one extra row tells whether another page exists
+        users = self.user_repository.get_page(
+            page_size + 1, after_id, admin, super_admin)
+
+        if len(users) <= page_size:
+            return UserPage(users=users, next_token=None)
+
+        users = users[:page_size]
+
+        return UserPage(users=users, next_token=encode_continuation_token(users[-1].id))
+
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        admin: bool | None = None,
+        super_admin: bool | None = None,
+    ) -> Iterator[User]:
+
+        if not (0 < page_size <= MAX_PAGE_SIZE):
+            raise ValueError(
+                f"Page size ({page_size}) invalid (must be 1-{MAX_PAGE_SIZE})")
+
+        return self.user_repository.iter_all(page_size, admin, super_admin)
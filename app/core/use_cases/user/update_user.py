@@ -1,19 +1,34 @@
-import datetime
+import functools
+import random
+import time
+from typing import Callable
 
 from app.core.domain.interfaces.password_hasher import PasswordHasher
-from app.core.domain.entities.user import User
+from app.core.domain.interfaces.use_case_observer import UseCaseInvocation, UseCaseObserver
 from app.core.domain.repositories.user_repository import UserRepository
 from app.core.domain.value_objects.document_vo import Document
 from app.core.domain.value_objects.email_vo import Email
 from app.core.domain.value_objects.password_vo import Password
 from app.core.domain.value_objects.person_name_vo import PersonName
 from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
 from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.use_cases.user.creator_permission_cache import CreatorPermissionCache
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
 
 
 class UpdateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self,
+                 user_repository: UserRepository,
+                 max_retries: int = 5,
+                 retry_backoff_seconds: float = 0.005,
+                 permission_cache: CreatorPermissionCache | None = None,
+                 observer: UseCaseObserver | None = None):
         self.user_repository = user_repository
+        self.permission_cache = permission_cache or CreatorPermissionCache.shared(user_repository)
+        self.observer = observer or UseCaseObserver()
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
 
     def execute(
         self,
@@ -29,71 +44,160 @@ class UpdateUserUseCase:
         admin: bool | None = None,
     ) -> None:
 
-        creator_user = self.user_repository.get_by_id(UUIDv7(creator_id))
+        if password_str and not password_hasher:
+            raise ValueError(
+                "Password hasher must be provided when updating password.")
 
-        if not creator_user:
-            raise ValueError(f"Creator with id '{creator_id}' does not exist.")
+        # shared by every attempt, so a retry after a conflict does not hash again
+        new_password = functools.cache(
+            lambda: Password(password_str, password_hasher)) if password_str else None
+
+        invocation = self.observer.start("UpdateUserUseCase")
+        try:
+            # optimistic concurrency: on a version conflict, reread and retry
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.__execute_once(
+                        invocation, creator_id, id_str, document_str, name_str, email_str,
+                        phone_number_str, new_password, last_accessed_at_utc_str, admin)
+                    break
+
+                except ConcurrencyConflictException:
+                    if attempt == self.max_retries:
+                        raise
+
+                    invocation.enter("retry_backoff")
+                    time.sleep(self.retry_backoff_seconds *
+                               (2 ** attempt) * random.uniform(0.5, 1.5))
+
+        except BaseException as error:
+            invocation.finish(error)
+            raise
+
+        invocation.finish()
+        return None
 
-        if admin == True and creator_user.admin == False and creator_user.super_admin == False:
-            raise ValueError(f"Only admin can change admin permissions.")
+    def __execute_once(
+        self,
+        invocation: UseCaseInvocation,
+        creator_id: str,
+        id_str: str,
+        document_str: str | None = None,
+        name_str: str | None = None,
+        email_str: str | None = None,
+        phone_number_str: str | None = None,
+        new_password: Callable[[], Password] | None = None,
+        last_accessed_at_utc_str: str | None = None,
+        admin: bool | None = None,
+    ) -> None:
 
-        id_vo = UUIDv7(id_str)
+        invocation.enter("load")
+        try:
+            creator_id_vo = UUIDv7(creator_id)
+            id_vo = UUIDv7(id_str)
+        except (TypeError, ValueError) as error:
+            invocation.validation_failed(UUIDv7, error)
+            raise
+
+        # on a cache miss the creator is loaded along with the target user
+        creator_permissions = self.permission_cache.get_cached(creator_id_vo)
+        if creator_permissions:
+            existing_user = self.user_repository.get_by_id(id_vo)
+        else:
+            generation = self.permission_cache.generation()
+            users = self.user_repository.get_many_by_ids([creator_id_vo, id_vo])
+            existing_user = users.get(id_vo.value)
+            if creator_id_vo.value in users:
+                creator_permissions = self.permission_cache.remember(
+                    users[creator_id_vo.value], generation)
+
+        if not creator_permissions:
+            raise ValueError(f"Creator with id '{creator_id}' does not exist.")
 
-        existing_user = self.user_repository.get_by_id(id_vo)
+        if admin == True and creator_permissions.admin == False and creator_permissions.super_admin == False:
+            raise ValueError(f"Only admin can change admin permissions.")
 
         if not existing_user:
             raise ValueError(f"User with id '{id_str}' does not exist.")
 
-        document_vo = Document(
-            document_str) if document_str else existing_user.document
-        name_vo = PersonName(name_str) if name_str else existing_user.name
-        email_vo = Email(email_str) if email_str else existing_user.email
-        phone_number_vo = PhoneNumber(
-            phone_number_str) if phone_number_str else existing_user.phone
-        is_admin = admin if admin is not None else existing_user.admin
-        has_last_accessed_at_utc = last_accessed_at_utc_str if last_accessed_at_utc_str else existing_user.last_accessed_at_utc
-
-        if document_str:
-            document_user = self.user_repository.get_by_document(document_vo)
-            if document_user and document_user.id != id_vo:
-                raise ValueError(
-                    f"The document '{document_str}' is already in use.")
-
-        if email_str:
-            email_user = self.user_repository.get_by_email(email_vo)
-            if email_user and email_user.id != id_vo:
-                raise ValueError(f"The email '{email_str}' is already in use.")
-
-        if phone_number_str:
-            phone_user = self.user_repository.get_by_phone_number(
-                phone_number_vo)
-            if phone_user and phone_user.id != id_vo:
-                raise ValueError(
-                    f"The phone number '{phone_number_str}' is already in use.")
+        invocation.enter("validation")
+        changes = {}
+
+        # the Value Object under construction, reported if it fails
+        value_object: type = Document
+        try:
+            if document_str:
+                document_vo = Document(document_str)
+                if document_vo != existing_user.document:
+                    changes["document"] = document_vo
+
+            if name_str:
+                value_object = PersonName
+                name_vo = PersonName.parse(name_str)
+                if name_vo != existing_user.name:
+                    changes["name"] = name_vo
+
+            if email_str:
+                value_object = Email
+                email_vo = Email.parse(email_str)
+                if email_vo != existing_user.email:
+                    changes["email"] = email_vo
+
+            if phone_number_str:
+                value_object = PhoneNumber
+                phone_number_vo = PhoneNumber.parse(phone_number_str)
+                if phone_number_vo != existing_user.phone:
+                    changes["phone"] = phone_number_vo
+
+            if admin is not None and admin != existing_user.admin:
+                changes["admin"] = admin
+
+            if last_accessed_at_utc_str:
+                value_object = Timestamp
+                last_accessed_at_utc = Timestamp.from_iso(last_accessed_at_utc_str)
+                if last_accessed_at_utc != existing_user.last_accessed_at_utc:
+                    changes["last_accessed_at_utc"] = last_accessed_at_utc
+        except (TypeError, ValueError) as error:
+            invocation.validation_failed(value_object, error)
+            raise
+
+        invocation.enter("conflict_check")
+        conflicts = self.user_repository.find_conflicts(
+            email=changes.get("email"),
+            phone=changes.get("phone"),
+            document=changes.get("document"),
+            exclude_id=id_vo,
+        ) if changes.keys() & {"email", "phone", "document"} else set()
+
+        if "document" in conflicts:
+            raise ValueError(
+                f"The document '{document_str}' is already in use.")
 
-        if password_str and not password_hasher:
+        if "email" in conflicts:
+            raise ValueError(f"The email '{email_str}' is already in use.")
+
+        if "phone" in conflicts:
             raise ValueError(
-                "Password hasher must be provided when updating password.")
+                f"The phone number '{phone_number_str}' is already in use.")
+
+        if new_password:
+            invocation.enter("validation")
+            try:
+                changes["password"] = new_password()
+            except (TypeError, ValueError) as error:
+                invocation.validation_failed(Password, error)
+                raise
+
+        if not changes:
+            return None
+
+        invocation.enter("persist")
+        changes["updated_at_utc"] = Timestamp.now()
+
+        self.user_repository.patch(
+            id_vo, changes, expected_version=existing_user.version)
 
-        password_vo = Password(
-            password_str, password_hasher) if password_str and password_hasher else existing_user.password
-
-        current_data = datetime.datetime.now(datetime.timezone.utc).isoformat()
-
-        user = User(
-            id=id_vo,
-            document=document_vo,
-            name=name_vo,
-            email=email_vo,
-            phone=phone_number_vo,
-            password=password_vo,
-            created_at_utc=existing_user.created_at_utc,
-            updated_at_utc=current_data,
-            last_accessed_at_utc=existing_user.last_accessed_at_utc,
-            admin=is_admin,
-            super_admin=existing_user.super_admin
-        )
-
-        self.user_repository.update(user)
+        if "admin" in changes:
+            self.permission_cache.invalidate(id_vo.value)
 
         return None
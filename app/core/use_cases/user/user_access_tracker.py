@@ -0,0 +1,109 @@
+import threading
+from typing import Callable
+
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+
+
+class UserAccessTracker:
+    """
+    Write-behind buffer for `User.last_accessed_at_utc`.
+
+    `record` only keeps the latest timestamp per user in memory; the buffer is
+    written with one `update_last_accessed_many` call when it reaches
+    `max_pending` users, every `flush_interval_seconds` once `start()` runs
+    the background flusher, and on `close()`.
+    """
+
+    def __init__(self,
+                 user_repository: UserRepository,
+                 max_pending: int = 10_000,
+                 flush_interval_seconds: float = 5.0,
+                 clock: Callable[[], Timestamp] = Timestamp.now):
+        self.user_repository = user_repository
+        self.max_pending = max_pending
+        self.flush_interval_seconds = flush_interval_seconds
+        self.clock = clock
+        self.recorded = 0
+        self.written = 0
+        self.flushes = 0
+        self.__pending: dict[str, Timestamp] = {}
+        self.__lock = threading.Lock()
+        self.__flush_lock = threading.Lock()
+        self.__wake_up = threading.Event()
+        self.__closed = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def record(self, user_id: str, accessed_at_utc: Timestamp | None = None) -> None:
+        accessed_at_utc = accessed_at_utc or self.clock()
+
+        with self.__lock:
+            self.recorded += 1
+            current = self.__pending.get(user_id)
+            if current is None or current < accessed_at_utc:
+                self.__pending[user_id] = accessed_at_utc
+            is_full = len(self.__pending) >= self.max_pending
+
+        if is_full:
+            if self.__thread is not None:
+                self.__wake_up.set()
+            else:
+                self.flush()
+
+    def flush(self) -> int:
+        """Writes the buffered accesses, returns how many users were written."""
+        with self.__flush_lock:
+            with self.__lock:
+                pending, self.__pending = self.__pending, {}
+
+            if not pending:
+                return 0
+
+            try:
+                self.user_repository.update_last_accessed_many(pending)
+
+            except Exception:
+                # put them back, keeping whatever is newer
+                with self.__lock:
+                    for user_id, accessed_at_utc in pending.items():
+                        current = self.__pending.get(user_id)
+                        if current is None or current < accessed_at_utc:
+                            self.__pending[user_id] = accessed_at_utc
+                raise
+
+            self.written += len(pending)
+            self.flushes += 1
+            return len(pending)
+
+    def start(self) -> "UserAccessTracker":
+        if self.__thread is None:
+            self.__thread = threading.Thread(
+                target=self.__run, name="user-access-tracker", daemon=True)
+            self.__thread.start()
+
+        return self
+
+    def close(self) -> None:
+        self.__closed.set()
+        self.__wake_up.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        self.flush()
+
+    def __enter__(self) -> "UserAccessTracker":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __run(self) -> None:
+        while not self.__closed.is_set():
+            self.__wake_up.wait(self.flush_interval_seconds)
+            self.__wake_up.clear()
+            try:
+                self.flush()
+            except Exception:
+                # kept in the buffer, retried on the next round
+                pass
@@ -0,0 +1,71 @@
+from bisect import bisect_left
+import math
+from typing import Sequence
+
+# 1 µs to ~67 s, doubling
+SECONDS_BUCKETS: tuple[float, ...] = tuple(1e-6 * 2 ** exponent for exponent in range(27))
+
+COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 25, 32, 50, 64, 100)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; `bounds` are the inclusive upper bounds of the
+    buckets, larger values go to an overflow bucket. Percentiles are the
+    upper bound of the bucket they fall in, capped by the largest value
+    seen. Not thread-safe, RecordingUseCaseObserver records under its lock.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self, bounds: Sequence[float] = SECONDS_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+
+        if index == len(self.bounds):
+            return self.maximum
+        return min(self.bounds[index], self.maximum)
+
+    def to_dict(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.total / self.count,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            # upper bound -> count, non-empty buckets only; "+Inf" is the overflow bucket
+            "buckets": {
+                (repr(self.bounds[index]) if index < len(self.bounds) else "+Inf"): bucket_count
+                for index, bucket_count in enumerate(self.counts) if bucket_count
+            },
+        }
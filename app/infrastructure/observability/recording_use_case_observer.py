@@ -0,0 +1,176 @@
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Callable
+
+from app.core.domain.interfaces.use_case_observer import UseCaseInvocation, UseCaseObserver
+from app.infrastructure.observability.histogram import COUNT_BUCKETS, Histogram
+
+
+class _UseCaseMetrics:
+    __slots__ = ("calls", "errors", "duration", "phases", "repository_calls", "repository_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.duration = Histogram()
+        self.phases: dict[str, Histogram] = {}
+        self.repository_calls = Histogram(COUNT_BUCKETS)
+        self.repository_seconds = Histogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "duration_seconds": self.duration.to_dict(),
+            "phases_seconds": {phase: histogram.to_dict() for phase, histogram in self.phases.items()},
+            "repository_calls": self.repository_calls.to_dict(),
+            "repository_seconds": self.repository_seconds.to_dict(),
+        }
+
+
+class _RecordingInvocation(UseCaseInvocation):
+    """
+    Only collects timestamps while the use case runs; phase durations are
+    worked out once, in `phases`, when the observer records the call.
+    """
+
+    __slots__ = ("observer", "use_case", "token", "clock", "marks", "nested", "repository_calls",
+                 "repository_seconds", "validation_failures")
+
+    def __init__(self, observer: "RecordingUseCaseObserver", use_case: str) -> None:
+        self.observer = observer
+        self.use_case = use_case
+        self.token: Token | None = None
+        self.clock = observer.clock
+        # (phase, start); the first mark is the start of the call, outside any phase
+        self.marks: list[tuple[str | None, float]] = [(None, self.clock())]
+        # (index of the running mark, phase, seconds) of time reported as its own phase (hashing)
+        self.nested: list[tuple[int, str, float]] = []
+        self.repository_calls = 0
+        self.repository_seconds = 0.0
+        self.validation_failures: list[str] = []
+
+    def enter(self, phase: str) -> None:
+        self.marks.append((phase, self.clock()))
+
+    def validation_failed(self, value_object: type, error: Exception) -> None:
+        self.validation_failures.append(value_object.__name__)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        self.marks.append((None, self.clock()))
+        self.observer._finish(self, error)
+
+    def phases(self) -> dict[str, float]:
+        marks = self.marks
+        phases: dict[str, float] = {}
+        for index in range(1, len(marks) - 1):
+            phase, started = marks[index]
+            phases[phase] = phases.get(phase, 0.0) + marks[index + 1][1] - started
+
+        for index, phase, seconds in self.nested:
+            running_phase = marks[index][0]
+            if running_phase is not None:
+                phases[running_phase] = max(phases[running_phase] - seconds, 0.0)
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+        return phases
+
+
+class RecordingUseCaseObserver(UseCaseObserver):
+    """
+    Aggregates use-case metrics in process, exported by `snapshot` as a
+    plain dict:
+
+    - per use case: calls, errors by exception type, and histograms of the
+      duration, of each phase, and of the repository calls (count and time)
+      made by one call
+    - per repository method: a histogram of the call time
+    - a histogram of PasswordHasher.hash time
+    - validation failures by Value Object type
+
+    Repository calls and hashes are attributed to the use case running in
+    the same thread (or asyncio task) through a context variable, so one
+    observer can be shared by every use case.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._current: ContextVar[_RecordingInvocation | None] = ContextVar(
+            f"use_case_invocation_{id(self)}", default=None)
+        self._use_cases: dict[str, _UseCaseMetrics] = {}
+        self._repository: dict[str, Histogram] = {}
+        self._password_hashes = Histogram()
+        self._validation_failures: dict[str, int] = {}
+
+    def start(self, use_case: str) -> UseCaseInvocation:
+        invocation = _RecordingInvocation(self, use_case)
+        invocation.token = self._current.set(invocation)
+        return invocation
+
+    def repository_call(self, method: str, seconds: float) -> None:
+        invocation = self._current.get()
+        if invocation is not None:
+            invocation.repository_calls += 1
+            invocation.repository_seconds += seconds
+
+        with self._lock:
+            histogram = self._repository.get(method)
+            if histogram is None:
+                histogram = self._repository[method] = Histogram()
+            histogram.record(seconds)
+
+    def password_hash(self, seconds: float) -> None:
+        invocation = self._current.get()
+        if invocation is not None:
+            invocation.nested.append((len(invocation.marks) - 1, "password_hash", seconds))
+
+        with self._lock:
+            self._password_hashes.record(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "use_cases": {name: metrics.to_dict() for name, metrics in self._use_cases.items()},
+                "repository_seconds": {method: histogram.to_dict()
+                                       for method, histogram in self._repository.items()},
+                "password_hash_seconds": self._password_hashes.to_dict(),
+                "validation_failures": dict(self._validation_failures),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._use_cases.clear()
+            self._repository.clear()
+            self._password_hashes = Histogram()
+            self._validation_failures.clear()
+
+    def _finish(self, invocation: _RecordingInvocation, error: BaseException | None) -> None:
+        try:
+            self._current.reset(invocation.token)
+        except ValueError:
+            # finished from another context than it started in, nothing to restore
+            pass
+
+        seconds = invocation.marks[-1][1] - invocation.marks[0][1]
+        phases = invocation.phases()
+        with self._lock:
+            metrics = self._use_cases.get(invocation.use_case)
+            if metrics is None:
+                metrics = self._use_cases[invocation.use_case] = _UseCaseMetrics()
+
+            metrics.calls += 1
+            if error is not None:
+                name = type(error).__name__
+                metrics.errors[name] = metrics.errors.get(name, 0) + 1
+            metrics.duration.record(seconds)
+            for phase, phase_seconds in phases.items():
+                histogram = metrics.phases.get(phase)
+                if histogram is None:
+                    histogram = metrics.phases[phase] = Histogram()
+                histogram.record(phase_seconds)
+            metrics.repository_calls.record(invocation.repository_calls)
+            metrics.repository_seconds.record(invocation.repository_seconds)
+            for value_object in invocation.validation_failures:
+                self._validation_failures[value_object] = self._validation_failures.get(value_object, 0) + 1
@@ -0,0 +1,103 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Set membership with false positives but no false negatives.
+
+    Sized for `capacity` keys at `false_positive_rate`; past `capacity` the
+    real rate grows, see `estimated_false_positive_rate`. Bit positions come
+    from one 128-bit BLAKE2b digest split in two halves (double hashing).
+    """
+
+    __MAGIC = b"BLM1"
+    __HEADER = struct.Struct(">4sQIQ")
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+
+        self.bit_count = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        # `|=` on a byte is a read-modify-write, concurrent adds could lose bits
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key: str) -> None:
+        positions = self._positions(key)
+        bits = self._bits
+        with self._lock:
+            for position in positions:
+                bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+    def to_bytes(self) -> bytes:
+        with self._lock:
+            header = self.__HEADER.pack(self.__MAGIC, self.bit_count, self.hash_count, self.count)
+            return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        header_size = cls.__HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Invalid Bloom filter data")
+
+        magic, bit_count, hash_count, count = cls.__HEADER.unpack_from(data)
+        bits = bytearray(data[header_size:])
+        if magic != cls.__MAGIC or len(bits) != (bit_count + 7) // 8 or hash_count == 0:
+            raise ValueError("Invalid Bloom filter data")
+
+        bloom_filter = object.__new__(cls)
+        bloom_filter.bit_count = bit_count
+        bloom_filter.hash_count = hash_count
+        bloom_filter.count = count
+        bloom_filter._bits = bits
+        bloom_filter._lock = threading.Lock()
+        return bloom_filter
+
+    def save(self, path: str) -> None:
+        """Writes the filter atomically, a crash never leaves a truncated file."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(self.to_bytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        bit_count = self.bit_count
+        return [(first + index * second) % bit_count for index in range(self.hash_count)]
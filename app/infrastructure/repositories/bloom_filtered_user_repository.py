@@ -0,0 +1,170 @@
+from typing import Any
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.infrastructure.repositories.bloom_filter import BloomFilter
+
+
+class BloomFilteredUserRepository(UserRepository):
+    """
+    Answers email, phone and document lookups of unknown values without
+    reaching the wrapped repository.
+
+    Every email, phone and document ever written through this wrapper (or
+    loaded by `warm_up`) is added to one Bloom filter before the write, so a
+    value the filter has never seen is certainly free and only possible
+    matches are queried. Values replaced by an update stay in the filter and
+    only cost a false positive.
+
+    The filter only knows about writes made through this instance. After
+    `bloom_filter.load`, users created elsewhere since the snapshot must be
+    added with `catch_up`; changes of keys made by other processes are not
+    seen, so a shared database needs `warm_up` on every start.
+    """
+
+    def __init__(self,
+                 user_repository: UserRepository,
+                 bloom_filter: BloomFilter | None = None,
+                 expected_users: int = 1_000_000,
+                 false_positive_rate: float = 0.01) -> None:
+        self.user_repository = user_repository
+        # three keys per user
+        self.bloom_filter = bloom_filter or BloomFilter(expected_users * 3, false_positive_rate)
+        self.skipped = 0
+        self.passed = 0
+
+    def warm_up(self, page_size: int = 1000) -> int:
+        """Adds the keys of every stored user, returns how many users were read."""
+        users = 0
+        for user in self.user_repository.iter_all(page_size):
+            self._remember(user)
+            users += 1
+        return users
+
+    def catch_up(self, since: Timestamp, until: Timestamp | None = None) -> int:
+        """Adds the keys of the users created in [since, until), e.g. after a saved snapshot."""
+        users = self.user_repository.get_created_between(since, until or Timestamp.now())
+        for user in users:
+            self._remember(user)
+        return len(users)
+
+    def get_by_id(self, id: UUIDv7) -> User | None:
+        return self.user_repository.get_by_id(id)
+
+    def get_all(self) -> list[User]:
+        return self.user_repository.get_all()
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        return self.user_repository.get_page(limit, after_id, admin, super_admin)
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        return self.user_repository.get_many_by_ids(ids)
+
+    def get_permissions(self, id: UUIDv7) -> tuple[bool, bool] | None:
+        return self.user_repository.get_permissions(id)
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        return self.user_repository.get_created_between(start, end)
+
+    def get_by_email(self, email: Email) -> User | None:
+        if not self._may_exist("email", email.address):
+            return None
+        return self.user_repository.get_by_email(email)
+
+    def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        if not self._may_exist("phone", telefone.number):
+            return None
+        return self.user_repository.get_by_phone_number(telefone)
+
+    def get_by_document(self, document: Document) -> User | None:
+        if not self._may_exist("document", document.value):
+            return None
+        return self.user_repository.get_by_document(document)
+
+    def get_by_emails(self, emails: list[Email]) -> list[User]:
+        emails = [email for email in emails if self._may_exist("email", email.address)]
+        return self.user_repository.get_by_emails(emails) if emails else []
+
+    def get_by_phone_numbers(self, telefones: list[PhoneNumber]) -> list[User]:
+        telefones = [telefone for telefone in telefones if self._may_exist("phone", telefone.number)]
+        return self.user_repository.get_by_phone_numbers(telefones) if telefones else []
+
+    def get_by_documents(self, documents: list[Document]) -> list[User]:
+        documents = [document for document in documents if self._may_exist("document", document.value)]
+        return self.user_repository.get_by_documents(documents) if documents else []
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        email = email if email and self._may_exist("email", email.address) else None
+        phone = phone if phone and self._may_exist("phone", phone.number) else None
+        document = document if document and self._may_exist("document", document.value) else None
+        if email is None and phone is None and document is None:
+            return set()
+
+        return self.user_repository.find_conflicts(email, phone, document, exclude_id)
+
+    def create(self, user: User) -> UUIDv7:
+        self._remember(user)
+        return self.user_repository.create(user)
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        for user in users:
+            self._remember(user)
+        return self.user_repository.create_many(users)
+
+    def update(self, user: User) -> None:
+        self._remember(user)
+        self.user_repository.update(user)
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        if "email" in changes:
+            self.bloom_filter.add(self._key("email", changes["email"].address))
+        if "phone" in changes:
+            self.bloom_filter.add(self._key("phone", changes["phone"].number))
+        if "document" in changes:
+            self.bloom_filter.add(self._key("document", changes["document"].value))
+        self.user_repository.patch(id, changes, expected_version)
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        self.user_repository.update_last_accessed_many(last_accesses)
+
+    def stats(self) -> dict[str, float]:
+        checks = self.skipped + self.passed
+        return {
+            "skipped": self.skipped,
+            "passed": self.passed,
+            "skip_rate": self.skipped / checks if checks else 0.0,
+            "keys": len(self.bloom_filter),
+            "estimated_false_positive_rate": self.bloom_filter.estimated_false_positive_rate,
+        }
+
+    def _may_exist(self, kind: str, value: str) -> bool:
+        if self._key(kind, value) in self.bloom_filter:
+            self.passed += 1
+            return True
+
+        self.skipped += 1
+        return False
+
+    def _remember(self, user: User) -> None:
+        self.bloom_filter.add(self._key("email", user.email.address))
+        self.bloom_filter.add(self._key("phone", user.phone.number))
+        self.bloom_filter.add(self._key("document", user.document.value))
+
+    @staticmethod
+    def _key(kind: str, value: str) -> str:
+        return f"{kind}:{value}"
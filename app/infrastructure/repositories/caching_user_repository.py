@@ -0,0 +1,263 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+CacheKey = tuple[str, str]
+
+
+class CachingUserRepository(UserRepository):
+    """
+    Read-through cache in front of any UserRepository.
+
+    Each cached User is stored once, keyed by id, and reachable through its
+    email, phone and document. Entries expire after `ttl_seconds` and the
+    least recently used ones are evicted past `max_size`. Misses are cached
+    for `negative_ttl_seconds`. Writes go straight to the wrapped repository
+    and invalidate every old and new key of the written users.
+    """
+
+    def __init__(self,
+                 user_repository: UserRepository,
+                 max_size: int = 10_000,
+                 ttl_seconds: float = 60.0,
+                 negative_ttl_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.user_repository = user_repository
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, tuple[User, float]] = OrderedDict()
+        self._ids_by_key: dict[CacheKey, str] = {}
+        self._misses_by_key: OrderedDict[CacheKey, float] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def get_by_id(self, id: UUIDv7) -> User | None:
+        return self._get(("id", id.value), lambda: self.user_repository.get_by_id(id))
+
+    def get_by_email(self, email: Email) -> User | None:
+        return self._get(("email", email.address), lambda: self.user_repository.get_by_email(email))
+
+    def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        return self._get(("phone", telefone.number),
+                         lambda: self.user_repository.get_by_phone_number(telefone))
+
+    def get_by_document(self, document: Document) -> User | None:
+        return self._get(("document", document.value),
+                         lambda: self.user_repository.get_by_document(document))
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        users = {}
+        missing_ids = []
+        with self._lock:
+            now = self._clock()
+            for id in ids:
+                entry = self._entries.get(id.value)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(id.value)
+                    self.hits += 1
+                    users[id.value] = entry[0]
+                else:
+                    self.misses += 1
+                    missing_ids.append(id)
+            generation = self._generation
+
+        if missing_ids:
+            loaded_users = self.user_repository.get_many_by_ids(missing_ids)
+            with self._lock:
+                # a write happened while loading, the loaded values may be stale
+                if generation == self._generation:
+                    expires_at = self._clock() + self.ttl_seconds
+                    for user in loaded_users.values():
+                        self._store(user, expires_at)
+            users.update(loaded_users)
+
+        return users
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        # uniqueness must be answered by the source of truth, never by the cache
+        return self.user_repository.find_conflicts(email, phone, document, exclude_id)
+
+    def get_all(self) -> list[User]:
+        return self.user_repository.get_all()
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        return self.user_repository.get_page(limit, after_id, admin, super_admin)
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        return self.user_repository.get_created_between(start, end)
+
+    def create(self, user: User) -> UUIDv7:
+        try:
+            return self.user_repository.create(user)
+        finally:
+            self.invalidate(user)
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        try:
+            return self.user_repository.create_many(users)
+        finally:
+            self.invalidate(*users)
+
+    def update(self, user: User) -> None:
+        try:
+            self.user_repository.update(user)
+        finally:
+            self.invalidate(user)
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        try:
+            self.user_repository.patch(id, changes, expected_version)
+        finally:
+            with self._lock:
+                self._generation += 1
+                self._remove(id.value)
+                if "email" in changes:
+                    self._forget(("email", changes["email"].address))
+                if "phone" in changes:
+                    self._forget(("phone", changes["phone"].number))
+                if "document" in changes:
+                    self._forget(("document", changes["document"].value))
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        self.user_repository.update_last_accessed_many(last_accesses)
+
+        # refreshed rather than evicted, evicting every active user on each flush would
+        # empty the cache; the cached user is replaced, callers may hold the old one
+        with self._lock:
+            for user_id, accessed_at_utc in last_accesses.items():
+                entry = self._entries.get(user_id)
+                if entry is None:
+                    continue
+                user, expires_at = entry
+                if user.last_accessed_at_utc is None or user.last_accessed_at_utc < accessed_at_utc:
+                    accessed_user = copy.copy(user)
+                    accessed_user.last_accessed_at_utc = accessed_at_utc
+                    self._entries[user_id] = (accessed_user, expires_at)
+
+    def invalidate(self, *users: User) -> None:
+        with self._lock:
+            self._generation += 1
+            for user in users:
+                self._remove(user.id.value)
+                for key in self._keys_of(user):
+                    self._forget(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._ids_by_key.clear()
+            self._misses_by_key.clear()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "negative_size": len(self._misses_by_key),
+            }
+
+    def _get(self, key: CacheKey, load: Callable[[], User | None]) -> User | None:
+        with self._lock:
+            now = self._clock()
+            user_id = key[1] if key[0] == "id" else self._ids_by_key.get(key)
+            entry = self._entries.get(user_id) if user_id is not None else None
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(user_id)
+                    self.hits += 1
+                    return entry[0]
+                self._remove(user_id)
+
+            expires_at = self._misses_by_key.get(key)
+            if expires_at is not None:
+                if expires_at > now:
+                    self.negative_hits += 1
+                    return None
+                del self._misses_by_key[key]
+
+            self.misses += 1
+            generation = self._generation
+
+        user = load()
+
+        with self._lock:
+            # a write happened while loading, the loaded value may be stale
+            if generation != self._generation:
+                return user
+
+            now = self._clock()
+            if user is None:
+                self._misses_by_key[key] = now + self.negative_ttl_seconds
+                while len(self._misses_by_key) > self.max_size:
+                    self._misses_by_key.popitem(last=False)
+            else:
+                self._store(user, now + self.ttl_seconds)
+
+        return user
+
+    def _store(self, user: User, expires_at: float) -> None:
+        self._remove(user.id.value)
+        self._entries[user.id.value] = (user, expires_at)
+        for key in self._keys_of(user):
+            self._ids_by_key[key] = user.id.value
+            self._misses_by_key.pop(key, None)
+
+        while len(self._entries) > self.max_size:
+            oldest_id = next(iter(self._entries))
+            self._remove(oldest_id)
+
+    def _forget(self, key: CacheKey) -> None:
+        """Drops the negative entry of `key` and the user currently cached under it."""
+        self._misses_by_key.pop(key, None)
+        owner_id = self._ids_by_key.get(key)
+        if owner_id is not None:
+            self._remove(owner_id)
+
+    def _remove(self, user_id: str) -> None:
+        self._misses_by_key.pop(("id", user_id), None)
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return
+
+        for key in self._keys_of(entry[0]):
+            if self._ids_by_key.get(key) == user_id:
+                del self._ids_by_key[key]
+
+    @staticmethod
+    def _keys_of(user: User) -> tuple[CacheKey, ...]:
+        return (
+            ("id", user.id.value),
+            ("email", user.email.address),
+            ("phone", user.phone.number),
+            ("document", user.document.value),
+        )
@@ -0,0 +1,146 @@
+import bisect
+import copy
+import threading
+
+from app.core.domain.entities.post import Post
+from app.core.domain.repositories.post_repository import PostRepository
+from app.core.domain.value_objects.post_status_vo import PostStatus, StatusEnum
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+
+UserStatusKey = tuple[str, StatusEnum]
+
+
+class InMemoryPostRepository(PostRepository):
+    """
+    Reference PostRepository with one id-sorted list per user and per
+    (user, status).
+
+    UUIDv7 ids grow with time, so new posts are appended at the end of their
+    lists and a page is a bisect plus a backwards walk. The per-status count
+    is the length of the (user, status) list.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._posts_by_id: dict[str, Post] = {}
+        self._ids_by_user: dict[str, list[str]] = {}
+        self._ids_by_user_status: dict[UserStatusKey, list[str]] = {}
+        # what each post is indexed under, the stored Post may be mutated by callers
+        self._keys_by_id: dict[str, UserStatusKey] = {}
+
+    def get_by_id(self, id: UUIDv7) -> Post | None:
+        return self._posts_by_id.get(id.value)
+
+    def get_all(self, user_id: UUIDv7) -> list[Post]:
+        with self._lock:
+            return [self._posts_by_id[post_id]
+                    for post_id in self._ids_by_user.get(user_id.value, ())]
+
+    def create(self, post: Post) -> UUIDv7:
+        with self._lock:
+            if post.id.value in self._posts_by_id:
+                raise BusinessRuleException(
+                    f"Post with id '{post.id.value}' already exists.")
+
+            self._posts_by_id[post.id.value] = post
+            self._index(post)
+
+        return post.id
+
+    def create_many(self, posts: list[Post]) -> list[UUIDv7]:
+        with self._lock:
+            ids = set()
+            for post in posts:
+                if post.id.value in self._posts_by_id or post.id.value in ids:
+                    raise BusinessRuleException(
+                        f"Post with id '{post.id.value}' already exists.")
+                ids.add(post.id.value)
+
+            for post in posts:
+                self._posts_by_id[post.id.value] = post
+                self._index(post)
+
+        return [post.id for post in posts]
+
+    def update(self, post: Post) -> None:
+        with self._lock:
+            existing_post = self._posts_by_id.get(post.id.value)
+            if not existing_post:
+                raise BusinessRuleException(
+                    f"Post with id '{post.id.value}' does not exist.")
+
+            if existing_post.version != post.version:
+                raise ConcurrencyConflictException(
+                    f"Post with id '{post.id.value}' was modified concurrently.")
+
+            # stored as a copy so the caller's instance keeps acting as a snapshot
+            stored_post = copy.copy(post)
+            stored_post.version = post.version + 1
+            if self._keys_by_id[post.id.value] != self._key_of(stored_post):
+                self._unindex(post.id.value)
+                self._index(stored_post)
+            self._posts_by_id[post.id.value] = stored_post
+            post.version = stored_post.version
+
+    def get_page(self,
+                 user_id: UUIDv7,
+                 limit: int,
+                 status: PostStatus | None = None,
+                 created_from: Timestamp | None = None,
+                 created_to: Timestamp | None = None,
+                 before_id: UUIDv7 | None = None,
+                 ) -> list[Post]:
+        with self._lock:
+            ids = (self._ids_by_user.get(user_id.value, []) if status is None
+                   else self._ids_by_user_status.get((user_id.value, status.status), []))
+            end = len(ids) if before_id is None else bisect.bisect_left(ids, before_id.value)
+
+            page = []
+            for position in range(end - 1, -1, -1):
+                post = self._posts_by_id[ids[position]]
+                if created_from is not None and post.created_at_utc < created_from:
+                    continue
+                if created_to is not None and post.created_at_utc >= created_to:
+                    continue
+
+                page.append(post)
+                if len(page) == limit:
+                    break
+
+            return page
+
+    def count_by_status(self, user_id: UUIDv7) -> dict[PostStatus, int]:
+        with self._lock:
+            counts = {}
+            for status in StatusEnum:
+                ids = self._ids_by_user_status.get((user_id.value, status))
+                if ids:
+                    counts[PostStatus(status)] = len(ids)
+
+            return counts
+
+    def _index(self, post: Post) -> None:
+        key = self._key_of(post)
+        self._keys_by_id[post.id.value] = key
+        for index, index_key in ((self._ids_by_user, key[0]), (self._ids_by_user_status, key)):
+            ids = index.setdefault(index_key, [])
+            # appending is the common case, UUIDv7 ids only grow with time
+            if not ids or ids[-1] < post.id.value:
+                ids.append(post.id.value)
+            else:
+                bisect.insort(ids, post.id.value)
+
+    def _unindex(self, post_id: str) -> None:
+        key = self._keys_by_id.pop(post_id)
+        for index, index_key in ((self._ids_by_user, key[0]), (self._ids_by_user_status, key)):
+            ids = index[index_key]
+            del ids[bisect.bisect_left(ids, post_id)]
+            if not ids:
+                del index[index_key]
+
+    @staticmethod
+    def _key_of(post: Post) -> UserStatusKey:
+        return (post.user_id.value, post.status.status)
@@ -0,0 +1,247 @@
+import bisect
+import copy
+import threading
+from typing import Any
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Reference UserRepository that keeps one hash index per unique key.
+
+    Every lookup is a single dict access on the already normalized value of
+    the Value Object, so its cost does not grow with the number of users.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._users_by_id: dict[str, User] = {}
+        self._sorted_ids: list[str] = []
+        # (created_at_utc epoch, id) pairs, for range scans on the creation time
+        self._sorted_created: list[tuple[int, str]] = []
+        self._ids_by_email: dict[str, str] = {}
+        self._ids_by_phone: dict[str, str] = {}
+        self._ids_by_document: dict[str, str] = {}
+
+    def get_by_id(self, id: UUIDv7) -> User | None:
+        return self._users_by_id.get(id.value)
+
+    def get_all(self) -> list[User]:
+        with self._lock:
+            return list(self._users_by_id.values())
+
+    def create(self, user: User) -> UUIDv7:
+        with self._lock:
+            if user.id.value in self._users_by_id:
+                raise BusinessRuleException(
+                    f"User with id '{user.id.value}' already exists.")
+
+            self._check_unique_keys(user)
+            self._users_by_id[user.id.value] = user
+            bisect.insort(self._sorted_ids, user.id.value)
+            bisect.insort(self._sorted_created, self._created_key(user))
+            self._index(user)
+
+        return user.id
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        with self._lock:
+            batch_keys: set[tuple[int, str]] = set()
+            for user in users:
+                if user.id.value in self._users_by_id:
+                    raise BusinessRuleException(
+                        f"User with id '{user.id.value}' already exists.")
+
+                self._check_unique_keys(user)
+                for index, key, label in self._keys_of(user):
+                    if (id(index), key) in batch_keys:
+                        raise BusinessRuleException(
+                            f"The {label} '{key}' is already in use.")
+                    batch_keys.add((id(index), key))
+
+            for user in users:
+                self._users_by_id[user.id.value] = user
+                bisect.insort(self._sorted_ids, user.id.value)
+                bisect.insort(self._sorted_created, self._created_key(user))
+                self._index(user)
+
+        return [user.id for user in users]
+
+    def update(self, user: User) -> None:
+        with self._lock:
+            existing_user = self._users_by_id.get(user.id.value)
+            if not existing_user:
+                raise BusinessRuleException(
+                    f"User with id '{user.id.value}' does not exist.")
+
+            self._check_version(existing_user, user.version)
+            self._check_unique_keys(user)
+
+            # stored as a copy so the caller's instance keeps acting as a snapshot
+            stored_user = copy.copy(user)
+            stored_user.version = user.version + 1
+            self._unindex(existing_user)
+            self._users_by_id[user.id.value] = stored_user
+            self._index(stored_user)
+            self._reindex_created(existing_user, stored_user)
+            user.version = stored_user.version
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        with self._lock:
+            existing_user = self._users_by_id.get(id.value)
+            if not existing_user:
+                raise BusinessRuleException(
+                    f"User with id '{id.value}' does not exist.")
+
+            if expected_version is not None:
+                self._check_version(existing_user, expected_version)
+
+            patched_user = copy.copy(existing_user)
+            for name, value in changes.items():
+                setattr(patched_user, name, value)
+            patched_user.version = existing_user.version + 1
+
+            if changes.keys() & {"email", "phone", "document"}:
+                self._check_unique_keys(patched_user)
+                self._unindex(existing_user)
+                self._index(patched_user)
+
+            self._users_by_id[id.value] = patched_user
+            if "created_at_utc" in changes:
+                self._reindex_created(existing_user, patched_user)
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        with self._lock:
+            for user_id, accessed_at_utc in last_accesses.items():
+                user = self._users_by_id.get(user_id)
+                if user is None:
+                    continue
+                if user.last_accessed_at_utc is None or user.last_accessed_at_utc < accessed_at_utc:
+                    # replaced like every other write, users handed out stay snapshots;
+                    # the version is kept, access tracking must not conflict with updates
+                    accessed_user = copy.copy(user)
+                    accessed_user.last_accessed_at_utc = accessed_at_utc
+                    self._users_by_id[user_id] = accessed_user
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        with self._lock:
+            first = bisect.bisect_left(self._sorted_created, (start.epoch_us, ""))
+            last = bisect.bisect_left(self._sorted_created, (end.epoch_us, ""))
+            return [self._users_by_id[user_id]
+                    for _, user_id in self._sorted_created[first:last]]
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        users = (self._users_by_id.get(id.value) for id in ids)
+        return {user.id.value: user for user in users if user}
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        lookups = (
+            ("email", self._ids_by_email, email.address if email else None),
+            ("phone", self._ids_by_phone, phone.number if phone else None),
+            ("document", self._ids_by_document, document.value if document else None),
+        )
+        excluded = exclude_id.value if exclude_id else None
+        conflicts = set()
+        for field, index, key in lookups:
+            owner_id = index.get(key) if key is not None else None
+            if owner_id is not None and owner_id != excluded:
+                conflicts.add(field)
+
+        return conflicts
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        if limit <= 0:
+            raise ValueError(f"Page limit ({limit}) must be positive")
+
+        with self._lock:
+            start = 0 if after_id is None else bisect.bisect_right(
+                self._sorted_ids, after_id.value)
+
+            page = []
+            for position in range(start, len(self._sorted_ids)):
+                user = self._users_by_id[self._sorted_ids[position]]
+                if admin is not None and user.admin != admin:
+                    continue
+                if super_admin is not None and user.super_admin != super_admin:
+                    continue
+
+                page.append(user)
+                if len(page) == limit:
+                    break
+
+            return page
+
+    def get_by_email(self, email: Email) -> User | None:
+        return self._get_by_key(self._ids_by_email, email.address)
+
+    def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        return self._get_by_key(self._ids_by_phone, telefone.number)
+
+    def get_by_document(self, document: Document) -> User | None:
+        return self._get_by_key(self._ids_by_document, document.value)
+
+    def _get_by_key(self, index: dict[str, str], key: str) -> User | None:
+        user_id = index.get(key)
+        if user_id is None:
+            return None
+
+        return self._users_by_id.get(user_id)
+
+    @staticmethod
+    def _check_version(existing_user: User, expected_version: int) -> None:
+        if existing_user.version != expected_version:
+            raise ConcurrencyConflictException(
+                f"User with id '{existing_user.id.value}' was modified concurrently.")
+
+    def _check_unique_keys(self, user: User) -> None:
+        for index, key, label in self._keys_of(user):
+            owner_id = index.get(key)
+            if owner_id is not None and owner_id != user.id.value:
+                raise BusinessRuleException(
+                    f"The {label} '{key}' is already in use.")
+
+    def _reindex_created(self, old_user: User, new_user: User) -> None:
+        old_key = self._created_key(old_user)
+        new_key = self._created_key(new_user)
+        if old_key != new_key:
+            del self._sorted_created[bisect.bisect_left(self._sorted_created, old_key)]
+            bisect.insort(self._sorted_created, new_key)
+
+    @staticmethod
+    def _created_key(user: User) -> tuple[int, str]:
+        return (user.created_at_utc.epoch_us, user.id.value)
+
+    def _index(self, user: User) -> None:
+        for index, key, _ in self._keys_of(user):
+            index[key] = user.id.value
+
+    def _unindex(self, user: User) -> None:
+        for index, key, _ in self._keys_of(user):
+            if index.get(key) == user.id.value:
+                del index[key]
+
+    def _keys_of(self, user: User) -> tuple[tuple[dict[str, str], str, str], ...]:
+        return (
+            (self._ids_by_email, user.email.address, "email"),
+            (self._ids_by_phone, user.phone.number, "phone number"),
+            (self._ids_by_document, user.document.value, "document"),
+        )
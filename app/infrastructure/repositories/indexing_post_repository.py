@@ -0,0 +1,61 @@
+from app.core.domain.entities.post import Post
+from app.core.domain.repositories.post_repository import PostRepository
+from app.core.domain.value_objects.post_status_vo import PostStatus
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.infrastructure.search.inverted_post_index import InvertedPostIndex
+
+
+class IndexingPostRepository(PostRepository):
+    """
+    PostRepository that keeps an InvertedPostIndex in sync with the posts
+    written through it.
+
+    The index is only updated after the wrapped repository accepted the
+    write. Posts already stored before wrapping have to be loaded with
+    `index.add_many` by the caller.
+    """
+
+    def __init__(self, post_repository: PostRepository, index: InvertedPostIndex | None = None) -> None:
+        self.post_repository = post_repository
+        self.index = index or InvertedPostIndex()
+
+    def get_by_id(self, id: UUIDv7) -> Post | None:
+        return self.post_repository.get_by_id(id)
+
+    def get_all(self, user_id: UUIDv7) -> list[Post]:
+        return self.post_repository.get_all(user_id)
+
+    def get_page(self,
+                 user_id: UUIDv7,
+                 limit: int,
+                 status: PostStatus | None = None,
+                 created_from: Timestamp | None = None,
+                 created_to: Timestamp | None = None,
+                 before_id: UUIDv7 | None = None,
+                 ) -> list[Post]:
+        return self.post_repository.get_page(
+            user_id, limit, status, created_from, created_to, before_id)
+
+    def count_by_status(self, user_id: UUIDv7) -> dict[PostStatus, int]:
+        return self.post_repository.count_by_status(user_id)
+
+    def create(self, post: Post) -> UUIDv7:
+        id = self.post_repository.create(post)
+        self.index.add(post)
+        return id
+
+    def create_many(self, posts: list[Post]) -> list[UUIDv7]:
+        ids = self.post_repository.create_many(posts)
+        self.index.add_many(posts)
+        return ids
+
+    def update(self, post: Post) -> None:
+        self.post_repository.update(post)
+        self.index.add(post)
+
+    def search(self, query: str, limit: int = 10, include_unpublished: bool = False) -> list[Post]:
+        """Best matching posts for `query`, see InvertedPostIndex.search."""
+        hits = self.index.search(query, limit, include_unpublished)
+        posts = (self.post_repository.get_by_id(UUIDv7.from_trusted(hit.post_id)) for hit in hits)
+        return [post for post in posts if post is not None]
@@ -0,0 +1,96 @@
+import time
+from typing import Any, Callable, TypeVar
+
+from app.core.domain.entities.user import User
+from app.core.domain.interfaces.use_case_observer import UseCaseObserver
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+T = TypeVar("T")
+
+
+class ObservedUserRepository(UserRepository):
+    """
+    Reports every call made to the wrapped repository, with its duration,
+    to `observer`. Only the outermost calls are seen: wrap the repository
+    the use cases are given, after any caching or filtering decorator.
+    """
+
+    def __init__(self, user_repository: UserRepository, observer: UseCaseObserver) -> None:
+        self.user_repository = user_repository
+        self.observer = observer
+
+    def get_by_id(self, id: UUIDv7) -> User | None:
+        return self._call("get_by_id", self.user_repository.get_by_id, id)
+
+    def get_all(self) -> list[User]:
+        return self._call("get_all", self.user_repository.get_all)
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        return self._call("get_page", self.user_repository.get_page, limit, after_id, admin, super_admin)
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        return self._call("get_many_by_ids", self.user_repository.get_many_by_ids, ids)
+
+    def get_permissions(self, id: UUIDv7) -> tuple[bool, bool] | None:
+        return self._call("get_permissions", self.user_repository.get_permissions, id)
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        return self._call("get_created_between", self.user_repository.get_created_between, start, end)
+
+    def get_by_email(self, email: Email) -> User | None:
+        return self._call("get_by_email", self.user_repository.get_by_email, email)
+
+    def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        return self._call("get_by_phone_number", self.user_repository.get_by_phone_number, telefone)
+
+    def get_by_document(self, document: Document) -> User | None:
+        return self._call("get_by_document", self.user_repository.get_by_document, document)
+
+    def get_by_emails(self, emails: list[Email]) -> list[User]:
+        return self._call("get_by_emails", self.user_repository.get_by_emails, emails)
+
+    def get_by_phone_numbers(self, telefones: list[PhoneNumber]) -> list[User]:
+        return self._call("get_by_phone_numbers", self.user_repository.get_by_phone_numbers, telefones)
+
+    def get_by_documents(self, documents: list[Document]) -> list[User]:
+        return self._call("get_by_documents", self.user_repository.get_by_documents, documents)
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        return self._call("find_conflicts", self.user_repository.find_conflicts, email, phone, document, exclude_id)
+
+    def create(self, user: User) -> UUIDv7:
+        return self._call("create", self.user_repository.create, user)
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        return self._call("create_many", self.user_repository.create_many, users)
+
+    def update(self, user: User) -> None:
+        self._call("update", self.user_repository.update, user)
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        self._call("patch", self.user_repository.patch, id, changes, expected_version)
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        self._call("update_last_accessed_many", self.user_repository.update_last_accessed_many, last_accesses)
+
+    def _call(self, method: str, function: Callable[..., T], *args: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.observer.repository_call(method, time.perf_counter() - start)
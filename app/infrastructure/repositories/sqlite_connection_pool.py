@@ -0,0 +1,65 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-safe pool of SQLite connections to one database file.
+
+    Connections run in WAL mode, so readers never block the writer. Each
+    connection keeps its own compiled statement cache, which is how the
+    repositories reuse prepared statements: they only ever send constant SQL.
+    """
+
+    def __init__(self,
+                 database: str,
+                 size: int = 8,
+                 timeout: float = 30.0,
+                 cached_statements: int = 256) -> None:
+        if database == ":memory:":
+            raise ValueError(
+                "SQLiteConnectionPool needs a database file, ':memory:' is private to each connection")
+
+        self.database = database
+        self.size = size
+        self.__connections: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self.__all_connections: list[sqlite3.Connection] = []
+
+        for _ in range(size):
+            connection = sqlite3.connect(database,
+                                         timeout=timeout,
+                                         check_same_thread=False,
+                                         isolation_level=None,
+                                         cached_statements=cached_statements)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+            self.__all_connections.append(connection)
+            self.__connections.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self.__connections.get()
+        try:
+            yield connection
+        finally:
+            self.__connections.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        for connection in self.__all_connections:
+            connection.close()
+        self.__all_connections.clear()
@@ -0,0 +1,149 @@
+from app.core.domain.entities.post import Post
+from app.core.domain.repositories.post_repository import PostRepository
+from app.core.domain.value_objects.post_status_vo import PostStatus
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+from app.infrastructure.repositories.sqlite_connection_pool import SQLiteConnectionPool
+
+
+class SQLitePostRepository(PostRepository):
+
+    __SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS posts (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            image TEXT,
+            title TEXT NOT NULL,
+            link TEXT,
+            description TEXT NOT NULL,
+            body_content TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at_utc INTEGER NOT NULL,
+            updated_at_utc INTEGER NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_posts_user_id ON posts (user_id, id)",
+        "CREATE INDEX IF NOT EXISTS ix_posts_user_id_status ON posts (user_id, status, id)",
+    )
+
+    __COLUMNS = ("id, user_id, image, title, link, description, body_content, "
+                 "status, created_at_utc, updated_at_utc, version")
+
+    __INSERT = f"INSERT INTO posts ({__COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+    __UPDATE = """
+        UPDATE posts SET user_id = ?, image = ?, title = ?, link = ?, description = ?,
+            body_content = ?, status = ?, created_at_utc = ?, updated_at_utc = ?,
+            version = version + 1
+        WHERE id = ? AND version = ?
+    """
+
+    __SELECT = f"SELECT {__COLUMNS} FROM posts"
+
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self.pool = pool
+
+        with self.pool.transaction() as connection:
+            for statement in self.__SCHEMA:
+                connection.execute(statement)
+
+    def get_by_id(self, id: UUIDv7) -> Post | None:
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                f"{self.__SELECT} WHERE id = ?", (id.value,)).fetchone()
+
+        return Post.from_row(row) if row else None
+
+    def get_all(self, user_id: UUIDv7) -> list[Post]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                f"{self.__SELECT} WHERE user_id = ? ORDER BY id", (user_id.value,)).fetchall()
+
+        return [Post.from_row(row) for row in rows]
+
+    def get_page(self,
+                 user_id: UUIDv7,
+                 limit: int,
+                 status: PostStatus | None = None,
+                 created_from: Timestamp | None = None,
+                 created_to: Timestamp | None = None,
+                 before_id: UUIDv7 | None = None,
+                 ) -> list[Post]:
+        # only the given filters are added, so SQLite can pick the (user_id, status, id) index
+        conditions = ["user_id = ?"]
+        parameters: list = [user_id.value]
+        for condition, value in (
+            ("status = ?", status.status.name if status else None),
+            ("created_at_utc >= ?", created_from.epoch_us if created_from else None),
+            ("created_at_utc < ?", created_to.epoch_us if created_to else None),
+            ("id < ?", before_id.value if before_id else None),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                f"""{self.__SELECT} WHERE {' AND '.join(conditions)}
+                ORDER BY id DESC LIMIT ?""", (*parameters, limit)).fetchall()
+
+        return [Post.from_row(row) for row in rows]
+
+    def count_by_status(self, user_id: UUIDv7) -> dict[PostStatus, int]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM posts WHERE user_id = ? GROUP BY status",
+                (user_id.value,)).fetchall()
+
+        return {PostStatus.from_trusted(status): count for status, count in rows}
+
+    def create(self, post: Post) -> UUIDv7:
+        with self.pool.connection() as connection:
+            connection.execute(self.__INSERT, self.__to_row(post))
+
+        return post.id
+
+    def create_many(self, posts: list[Post]) -> list[UUIDv7]:
+        with self.pool.transaction() as connection:
+            connection.executemany(
+                self.__INSERT, (self.__to_row(post) for post in posts))
+
+        return [post.id for post in posts]
+
+    def update(self, post: Post) -> None:
+        row = self.__to_row(post)
+        with self.pool.connection() as connection:
+            cursor = connection.execute(
+                self.__UPDATE, (*row[1:-1], post.id.value, post.version))
+
+            if cursor.rowcount == 0:
+                exists = connection.execute(
+                    "SELECT 1 FROM posts WHERE id = ?", (post.id.value,)).fetchone()
+                if exists:
+                    raise ConcurrencyConflictException(
+                        f"Post with id '{post.id.value}' was modified concurrently.")
+
+                raise BusinessRuleException(
+                    f"Post with id '{post.id.value}' does not exist.")
+
+        post.version += 1
+
+    @staticmethod
+    def __to_row(post: Post) -> tuple:
+        return (
+            post.id.value,
+            post.user_id.value,
+            post.image,
+            post.title,
+            post.link,
+            post.description,
+            post.body_content,
+            post.status.status.name,
+            post.created_at_utc.epoch_us,
+            post.updated_at_utc.epoch_us,
+            post.version,
+        )
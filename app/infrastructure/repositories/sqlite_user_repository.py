@@ -0,0 +1,345 @@
+import sqlite3
+from typing import Any
+
+from app.core.domain.entities.user import User
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.exceptions.business_rule_exception import BusinessRuleException
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+from app.infrastructure.repositories.sqlite_connection_pool import SQLiteConnectionPool
+
+
+class _UniqueViolationTranslator:
+    """Turns a UNIQUE constraint IntegrityError into BusinessRuleException."""
+
+    def __init__(self, labels: dict[str, str], values: dict[str, str]) -> None:
+        self.labels = labels
+        self.values = values
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None or not issubclass(exc_type, sqlite3.IntegrityError):
+            return False
+
+        column = str(exc_value).rsplit(":", 1)[-1].strip()
+        label = self.labels.get(column)
+        if label is None:
+            return False
+
+        value = self.values.get(column)
+        if value is None:
+            raise BusinessRuleException(
+                f"The {label} is already in use.") from exc_value
+
+        raise BusinessRuleException(
+            f"The {label} '{value}' is already in use.") from exc_value
+
+
+class SQLiteUserRepository(UserRepository):
+    """
+    UserRepository stored in SQLite.
+
+    Email, phone and document have UNIQUE indexes, so a duplicate is rejected
+    by the insert/update itself and surfaces as BusinessRuleException.
+    Timestamps are stored as INTEGER epoch microseconds.
+    """
+
+    __SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            document TEXT NOT NULL,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            phone TEXT NOT NULL,
+            password TEXT NOT NULL,
+            created_at_utc INTEGER NOT NULL,
+            updated_at_utc INTEGER NOT NULL,
+            last_accessed_at_utc INTEGER,
+            admin INTEGER NOT NULL DEFAULT 0,
+            super_admin INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_users_email ON users (email)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_users_phone ON users (phone)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_users_document ON users (document)",
+        "CREATE INDEX IF NOT EXISTS ix_users_created_at_utc ON users (created_at_utc, id)",
+    )
+
+    __COLUMNS = ("id, document, name, email, phone, password, created_at_utc, "
+                 "updated_at_utc, last_accessed_at_utc, admin, super_admin, version")
+
+    __INSERT = f"INSERT INTO users ({__COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+    __UPDATE = """
+        UPDATE users SET document = ?, name = ?, email = ?, phone = ?, password = ?,
+            created_at_utc = ?, updated_at_utc = ?, last_accessed_at_utc = ?,
+            admin = ?, super_admin = ?, version = version + 1
+        WHERE id = ? AND version = ?
+    """
+
+    __SELECT = f"SELECT {__COLUMNS} FROM users"
+
+    # User attribute -> (column, stored value)
+    __PATCHABLE_COLUMNS = {
+        "document": ("document", lambda document: document.value),
+        "name": ("name", lambda name: name.name),
+        "email": ("email", lambda email: email.address),
+        "phone": ("phone", lambda phone: phone.number),
+        "password": ("password", lambda password: password.value),
+        "created_at_utc": ("created_at_utc", lambda timestamp: timestamp.epoch_us),
+        "updated_at_utc": ("updated_at_utc", lambda timestamp: timestamp.epoch_us),
+        "last_accessed_at_utc": ("last_accessed_at_utc",
+                                 lambda timestamp: timestamp.epoch_us if timestamp else None),
+        "admin": ("admin", int),
+        "super_admin": ("super_admin", int),
+    }
+
+    __UPDATE_LAST_ACCESSED = """
+        UPDATE users SET last_accessed_at_utc = ?
+        WHERE id = ? AND (last_accessed_at_utc IS NULL OR last_accessed_at_utc < ?)
+    """
+
+    __FIND_CONFLICTS = """
+        SELECT email = ? AS email, phone = ? AS phone, document = ? AS document
+        FROM users
+        WHERE (email = ? OR phone = ? OR document = ?) AND id != ?
+    """
+
+    # stays below SQLITE_MAX_VARIABLE_NUMBER on older builds
+    __MAX_PARAMETERS = 500
+
+    __UNIQUE_LABELS = {
+        "users.email": "email",
+        "users.phone": "phone number",
+        "users.document": "document",
+        "users.id": "id",
+    }
+
+    def __init__(self, pool: SQLiteConnectionPool, password_hasher: PasswordHasher) -> None:
+        self.pool = pool
+        self.password_hasher = password_hasher
+
+        with self.pool.transaction() as connection:
+            for statement in self.__SCHEMA:
+                connection.execute(statement)
+
+    def get_by_id(self, id: UUIDv7) -> User | None:
+        return self.__fetch_one(f"{self.__SELECT} WHERE id = ?", id.value)
+
+    def get_all(self) -> list[User]:
+        return self.__fetch_all(f"{self.__SELECT} ORDER BY id")
+
+    def get_page(self,
+                 limit: int,
+                 after_id: UUIDv7 | None = None,
+                 admin: bool | None = None,
+                 super_admin: bool | None = None,
+                 ) -> list[User]:
+        # a negative LIMIT means no limit to SQLite
+        if limit <= 0:
+            raise ValueError(f"Page limit ({limit}) must be positive")
+
+        return self.__fetch_all(
+            f"""{self.__SELECT}
+            WHERE id > ?
+              AND (? IS NULL OR admin = ?)
+              AND (? IS NULL OR super_admin = ?)
+            ORDER BY id LIMIT ?""",
+            after_id.value if after_id else "",
+            admin, admin, super_admin, super_admin, limit)
+
+    def create(self, user: User) -> UUIDv7:
+        with self.pool.connection() as connection:
+            with self.__unique_violations(self.__unique_values(user)):
+                connection.execute(self.__INSERT, self.__to_row(user))
+
+        return user.id
+
+    def create_many(self, users: list[User]) -> list[UUIDv7]:
+        with self.pool.transaction() as connection:
+            with self.__unique_violations({}):
+                connection.executemany(
+                    self.__INSERT, (self.__to_row(user) for user in users))
+
+        return [user.id for user in users]
+
+    def update(self, user: User) -> None:
+        row = self.__to_row(user)
+        with self.pool.connection() as connection:
+            with self.__unique_violations(self.__unique_values(user)):
+                cursor = connection.execute(
+                    self.__UPDATE, (*row[1:-1], user.id.value, user.version))
+
+        if cursor.rowcount == 0:
+            self.__raise_missed_write(user.id)
+
+        user.version += 1
+
+    def patch(self, id: UUIDv7, changes: dict[str, Any], expected_version: int | None = None) -> None:
+        unknown_fields = changes.keys() - self.__PATCHABLE_COLUMNS.keys()
+        if unknown_fields:
+            raise ValueError(
+                f"Cannot patch user fields: {', '.join(sorted(unknown_fields))}")
+
+        if not changes:
+            return None
+
+        assignments = []
+        parameters = []
+        written_values = {}
+        for name, value in changes.items():
+            column, to_stored = self.__PATCHABLE_COLUMNS[name]
+            assignments.append(f"{column} = ?")
+            parameters.append(to_stored(value))
+            written_values[f"users.{column}"] = parameters[-1]
+
+        with self.pool.connection() as connection:
+            with self.__unique_violations(written_values):
+                cursor = connection.execute(
+                    f"""UPDATE users SET {', '.join(assignments)}, version = version + 1
+                    WHERE id = ? AND (? IS NULL OR version = ?)""",
+                    (*parameters, id.value, expected_version, expected_version))
+
+        if cursor.rowcount == 0:
+            self.__raise_missed_write(id)
+
+    def get_by_email(self, email: Email) -> User | None:
+        return self.__fetch_one(f"{self.__SELECT} WHERE email = ?", email.address)
+
+    def get_by_phone_number(self, telefone: PhoneNumber) -> User | None:
+        return self.__fetch_one(f"{self.__SELECT} WHERE phone = ?", telefone.number)
+
+    def get_by_document(self, document: Document) -> User | None:
+        return self.__fetch_one(f"{self.__SELECT} WHERE document = ?", document.value)
+
+    def update_last_accessed_many(self, last_accesses: dict[str, Timestamp]) -> None:
+        with self.pool.transaction() as connection:
+            connection.executemany(
+                self.__UPDATE_LAST_ACCESSED,
+                ((accessed_at_utc.epoch_us, user_id, accessed_at_utc.epoch_us)
+                 for user_id, accessed_at_utc in last_accesses.items()))
+
+    def get_created_between(self, start: Timestamp, end: Timestamp) -> list[User]:
+        return self.__fetch_all(
+            f"""{self.__SELECT}
+            WHERE created_at_utc >= ? AND created_at_utc < ?
+            ORDER BY created_at_utc, id""",
+            start.epoch_us, end.epoch_us)
+
+    def get_many_by_ids(self, ids: list[UUIDv7]) -> dict[str, User]:
+        users = self.__fetch_in("id", [id.value for id in ids])
+        return {user.id.value: user for user in users}
+
+    def get_permissions(self, id: UUIDv7) -> tuple[bool, bool] | None:
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                "SELECT admin, super_admin FROM users WHERE id = ?", (id.value,)).fetchone()
+
+        return (bool(row["admin"]), bool(row["super_admin"])) if row else None
+
+    def find_conflicts(self,
+                       email: Email | None = None,
+                       phone: PhoneNumber | None = None,
+                       document: Document | None = None,
+                       exclude_id: UUIDv7 | None = None,
+                       ) -> set[str]:
+        values = (
+            email.address if email else None,
+            phone.number if phone else None,
+            document.value if document else None,
+        )
+        if values == (None, None, None):
+            return set()
+
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                self.__FIND_CONFLICTS,
+                (*values, *values, exclude_id.value if exclude_id else "")).fetchall()
+
+        conflicts = set()
+        for row in rows:
+            conflicts.update(field for field in ("email", "phone", "document") if row[field])
+
+        return conflicts
+
+    def get_by_emails(self, emails: list[Email]) -> list[User]:
+        return self.__fetch_in("email", [email.address for email in emails])
+
+    def get_by_phone_numbers(self, telefones: list[PhoneNumber]) -> list[User]:
+        return self.__fetch_in("phone", [telefone.number for telefone in telefones])
+
+    def get_by_documents(self, documents: list[Document]) -> list[User]:
+        return self.__fetch_in("document", [document.value for document in documents])
+
+    def __raise_missed_write(self, id: UUIDv7) -> None:
+        with self.pool.connection() as connection:
+            exists = connection.execute(
+                "SELECT 1 FROM users WHERE id = ?", (id.value,)).fetchone()
+
+        if exists:
+            raise ConcurrencyConflictException(
+                f"User with id '{id.value}' was modified concurrently.")
+
+        raise BusinessRuleException(
+            f"User with id '{id.value}' does not exist.")
+
+    def __fetch_one(self, sql: str, *parameters) -> User | None:
+        with self.pool.connection() as connection:
+            row = connection.execute(sql, parameters).fetchone()
+
+        return User.from_row(row, self.password_hasher) if row else None
+
+    def __fetch_all(self, sql: str, *parameters) -> list[User]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+
+        return [User.from_row(row, self.password_hasher) for row in rows]
+
+    def __fetch_in(self, column: str, values: list[str]) -> list[User]:
+        users = []
+        for start in range(0, len(values), self.__MAX_PARAMETERS):
+            chunk = values[start:start + self.__MAX_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            users.extend(self.__fetch_all(
+                f"{self.__SELECT} WHERE {column} IN ({placeholders})", *chunk))
+
+        return users
+
+    def __unique_violations(self, values: dict[str, str]) -> _UniqueViolationTranslator:
+        """`values` maps a constrained column ("users.email") to the value written."""
+        return _UniqueViolationTranslator(self.__UNIQUE_LABELS, values)
+
+    @staticmethod
+    def __unique_values(user: User) -> dict[str, str]:
+        return {
+            "users.id": user.id.value,
+            "users.email": user.email.address,
+            "users.phone": user.phone.number,
+            "users.document": user.document.value,
+        }
+
+    @staticmethod
+    def __to_row(user: User) -> tuple:
+        return (
+            user.id.value,
+            user.document.value,
+            user.name.name,
+            user.email.address,
+            user.phone.number,
+            user.password.value,
+            user.created_at_utc.epoch_us,
+            user.updated_at_utc.epoch_us,
+            user.last_accessed_at_utc.epoch_us if user.last_accessed_at_utc else None,
+            int(user.admin),
+            int(user.super_admin),
+            user.version,
+        )
@@ -0,0 +1,216 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.core.domain.entities.post import Post
+from app.core.domain.value_objects.post_status_vo import StatusEnum
+
+_WORD = re.compile(r"[^\W_]+")
+
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+# most frequent Portuguese function words, they would only grow the postings
+_STOPWORDS = frozenset("""
+    a ao aos as ate com como da das de do dos e ela elas ele eles em entre
+    era essa esse esta este eu foi for ha isso isto ja la lhe mais mas me
+    mesmo meu minha muito na nao nas nem no nos nossa nosso num numa o os
+    ou para pela pelas pelo pelos por qual quando que quem se sem ser seu
+    sua suas seus so tambem te tem ter um uma umas uns voce
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased, accent-folded words of `text` without stopwords."""
+    folded = _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text.casefold()))
+    return [word for word in _WORD.findall(folded) if word not in _STOPWORDS]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    post_id: str
+    score: float
+
+
+class InvertedPostIndex:
+    """
+    In-memory full-text index over Post title, description and body_content,
+    ranked with BM25.
+
+    Every indexed version of a post gets the next document number, so each
+    postings list is an append-only `array` of sorted document numbers with
+    a parallel array of term frequencies. Re-indexing or removing a post
+    leaves a tombstone; postings are compacted once tombstones outnumber
+    live documents. Title words count `title_weight` times.
+
+    Queries are scored term at a time, rarest term first. Once no document
+    outside the current candidates can reach the top `limit` (MaxScore), the
+    remaining, more common terms only score those candidates with a bisect
+    per candidate instead of walking their whole postings.
+    """
+
+    __REMOVED, __UNPUBLISHED, __PUBLISHED = 0, 1, 2
+
+    def __init__(self,
+                 k1: float = 1.2,
+                 b: float = 0.75,
+                 title_weight: int = 2) -> None:
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self._lock = threading.RLock()
+        self._documents: dict[str, array] = {}
+        self._frequencies: dict[str, array] = {}
+        self._post_ids: list[str | None] = []
+        self._lengths = array("I")
+        self._visibility = bytearray()
+        self._document_by_post_id: dict[str, int] = {}
+        self._total_length = 0
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self._document_by_post_id)
+
+    def add(self, post: Post) -> None:
+        """Indexes `post`, replacing the previously indexed version if any."""
+        terms = Counter(tokenize(post.title))
+        for term in terms:
+            terms[term] *= self.title_weight
+        terms.update(tokenize(post.description))
+        terms.update(tokenize(post.body_content))
+
+        with self._lock:
+            self._remove(post.id.value)
+
+            document = len(self._post_ids)
+            self._post_ids.append(post.id.value)
+            length = sum(terms.values())
+            self._lengths.append(length)
+            self._visibility.append(
+                self.__PUBLISHED if post.status.status is StatusEnum.PUBLISHED else self.__UNPUBLISHED)
+            self._document_by_post_id[post.id.value] = document
+            self._total_length += length
+
+            for term, frequency in terms.items():
+                documents = self._documents.get(term)
+                if documents is None:
+                    documents = self._documents[term] = array("I")
+                    self._frequencies[term] = array("I")
+                documents.append(document)
+                self._frequencies[term].append(frequency)
+
+            self._compact_if_needed()
+
+    def add_many(self, posts: Iterable[Post]) -> None:
+        with self._lock:
+            for post in posts:
+                self.add(post)
+
+    def remove(self, post_id: str) -> None:
+        with self._lock:
+            self._remove(post_id)
+            self._compact_if_needed()
+
+    def search(self, query: str, limit: int = 10, include_unpublished: bool = False) -> list[SearchHit]:
+        """Returns the `limit` best BM25 matches for any word of `query`, best first."""
+        terms = set(tokenize(query))
+
+        with self._lock:
+            live_documents = len(self._document_by_post_id)
+            if not terms or not self._total_length or limit <= 0:
+                return []
+
+            k1 = self.k1
+            length_weight = k1 * self.b * live_documents / self._total_length
+            base_weight = k1 * (1 - self.b)
+            lengths = self._lengths
+            visibility = self._visibility
+            minimum_visibility = self.__UNPUBLISHED if include_unpublished else self.__PUBLISHED
+
+            # (idf * (k1 + 1), documents, frequencies); idf * (k1 + 1) bounds a term's score
+            postings = []
+            for term in terms:
+                documents = self._documents.get(term)
+                if documents is not None:
+                    # document frequency counts tombstones until the next compaction
+                    count = len(documents)
+                    idf = math.log(1 + (live_documents - count + 0.5) / (count + 0.5))
+                    postings.append((idf * (k1 + 1), documents, self._frequencies[term]))
+            postings.sort(key=lambda item: item[0], reverse=True)
+
+            scores: dict[int, float] = {}
+            remaining_bound = sum(item[0] for item in postings)
+            for weight, documents, frequencies in postings:
+                if len(scores) >= limit and min(heapq.nlargest(limit, scores.values())) >= remaining_bound:
+                    for document in scores:
+                        position = bisect.bisect_left(documents, document)
+                        if position < len(documents) and documents[position] == document:
+                            frequency = frequencies[position]
+                            scores[document] += weight * frequency / (
+                                frequency + base_weight + length_weight * lengths[document])
+                else:
+                    get = scores.get
+                    for document, frequency in zip(documents, frequencies):
+                        if visibility[document] >= minimum_visibility:
+                            scores[document] = get(document, 0.0) + weight * frequency / (
+                                frequency + base_weight + length_weight * lengths[document])
+
+                remaining_bound -= weight
+
+            post_ids = self._post_ids
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [SearchHit(post_ids[document], score) for document, score in best]
+
+    def _remove(self, post_id: str) -> None:
+        document = self._document_by_post_id.pop(post_id, None)
+        if document is None:
+            return
+
+        self._post_ids[document] = None
+        self._visibility[document] = self.__REMOVED
+        self._total_length -= self._lengths[document]
+        self._tombstones += 1
+
+    def _compact_if_needed(self) -> None:
+        if self._tombstones <= max(len(self._document_by_post_id), 1024):
+            return
+
+        # renumber the live documents, keeping their order so postings stay sorted
+        renumbered = array("i", [-1]) * len(self._post_ids)
+        post_ids: list[str | None] = []
+        lengths = array("I")
+        visibility = bytearray()
+        for document, post_id in enumerate(self._post_ids):
+            if post_id is None:
+                continue
+            renumbered[document] = len(post_ids)
+            self._document_by_post_id[post_id] = len(post_ids)
+            post_ids.append(post_id)
+            lengths.append(self._lengths[document])
+            visibility.append(self._visibility[document])
+
+        for term in list(self._documents):
+            documents = array("I")
+            frequencies = array("I")
+            for document, frequency in zip(self._documents[term], self._frequencies[term]):
+                if renumbered[document] >= 0:
+                    documents.append(renumbered[document])
+                    frequencies.append(frequency)
+
+            if documents:
+                self._documents[term] = documents
+                self._frequencies[term] = frequencies
+            else:
+                del self._documents[term]
+                del self._frequencies[term]
+
+        self._post_ids = post_ids
+        self._lengths = lengths
+        self._visibility = visibility
+        self._tombstones = 0
@@ -0,0 +1,33 @@
+import time
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.interfaces.use_case_observer import UseCaseObserver
+from app.core.domain.value_objects.password_vo import Password
+
+
+class ObservedPasswordHasher(PasswordHasher):
+    """Reports the duration of every `hash` to `observer`; `verify` is forwarded as is."""
+
+    def __init__(self, password_hasher: PasswordHasher, observer: UseCaseObserver) -> None:
+        self.password_hasher = password_hasher
+        self.observer = observer
+
+    def hash(self, password: Password) -> str:
+        start = time.perf_counter()
+        try:
+            return self.password_hasher.hash(password)
+        finally:
+            self.observer.password_hash(time.perf_counter() - start)
+
+    def verify(self, password: Password, hashed_password: str) -> bool:
+        return self.password_hasher.verify(password, hashed_password)
+
+    async def hash_async(self, password: Password) -> str:
+        start = time.perf_counter()
+        try:
+            return await self.password_hasher.hash_async(password)
+        finally:
+            self.observer.password_hash(time.perf_counter() - start)
+
+    async def verify_async(self, password: Password, hashed_password: str) -> bool:
+        return await self.password_hasher.verify_async(password, hashed_password)
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.value_objects.password_vo import Password
+
+
+def _hash_in_worker(password_hasher: PasswordHasher, plain_value: str) -> str:
+    # the plain value already passed Password validation in the caller process
+    return password_hasher.hash(Password.from_validated_plain(plain_value, password_hasher))
+
+
+def _verify_in_worker(password_hasher: PasswordHasher, plain_value: str, hashed_password: str) -> bool:
+    return password_hasher.verify(Password.from_validated_plain(plain_value, password_hasher), hashed_password)
+
+
+class PooledPasswordHasher(PasswordHasher):
+    """
+    Runs a picklable PasswordHasher in a bounded process pool.
+
+    The calling thread only waits on a future, so slow KDFs no longer hold the
+    GIL of the request worker. At most `max_pending` jobs are queued; further
+    submissions wait for a free slot and raise TimeoutError after
+    `queue_timeout` seconds (None waits forever).
+    """
+
+    def __init__(self,
+                 password_hasher: PasswordHasher,
+                 max_workers: int | None = None,
+                 max_pending: int | None = None,
+                 queue_timeout: float | None = None) -> None:
+        self.password_hasher = password_hasher
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_timeout = queue_timeout
+        self.__slots = threading.BoundedSemaphore(
+            max_pending or self.max_workers * 4)
+        self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def hash(self, password: Password) -> str:
+        return self.__submit(_hash_in_worker, password.value).result()
+
+    def verify(self, password: Password, hashed_password: str) -> bool:
+        return self.__submit(_verify_in_worker, password.value, hashed_password).result()
+
+    def hash_many(self, passwords: list[Password]) -> list[str]:
+        futures = [self.__submit(_hash_in_worker, password.value)
+                   for password in passwords]
+        return [future.result() for future in futures]
+
+    async def hash_async(self, password: Password) -> str:
+        future = await self.__submit_async(_hash_in_worker, password.value)
+        return await asyncio.wrap_future(future)
+
+    async def verify_async(self, password: Password, hashed_password: str) -> bool:
+        future = await self.__submit_async(_verify_in_worker, password.value, hashed_password)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.__executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "PooledPasswordHasher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def __acquire_slot(self) -> None:
+        if not self.__slots.acquire(timeout=self.queue_timeout):
+            raise TimeoutError("Password hashing queue is full.")
+
+    def __submit(self, function, *args) -> Future:
+        self.__acquire_slot()
+        return self.__start(function, *args)
+
+    async def __submit_async(self, function, *args) -> Future:
+        if not self.__slots.acquire(blocking=False):
+            acquiring = asyncio.get_running_loop().run_in_executor(None, self.__acquire_slot)
+            try:
+                await asyncio.shield(acquiring)
+            except asyncio.CancelledError:
+                # the thread still takes the slot after the caller gave up, hand it back
+                acquiring.add_done_callback(self.__release_abandoned_slot)
+                raise
+
+        return self.__start(function, *args)
+
+    def __release_abandoned_slot(self, acquiring: asyncio.Future) -> None:
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self.__slots.release()
+
+    def __start(self, function, *args) -> Future:
+        try:
+            future = self.__executor.submit(
+                function, self.password_hasher, *args)
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self.__slots.release())
+        return future
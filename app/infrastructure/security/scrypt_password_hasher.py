@@ -0,0 +1,61 @@
+import base64
+import hashlib
+import hmac
+import os
+
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.value_objects.password_vo import Password
+
+
+class ScryptPasswordHasher(PasswordHasher):
+    """
+    PasswordHasher backed by the stdlib hashlib.scrypt.
+
+    Hashes are stored as `scrypt$<n>$<r>$<p>$<salt>$<key>`, with salt and key
+    base64 encoded, so the cost parameters can be raised later without
+    invalidating existing hashes.
+    """
+
+    __PREFIX = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1,
+                 salt_size: int = 16, key_size: int = 64) -> None:
+        self.n = n
+        self.r = r
+        self.p = p
+        self.salt_size = salt_size
+        self.key_size = key_size
+
+    def hash(self, password: Password) -> str:
+        salt = os.urandom(self.salt_size)
+        key = self.__derive(password.value, salt, self.n,
+                            self.r, self.p, self.key_size)
+
+        return '$'.join([
+            self.__PREFIX,
+            str(self.n),
+            str(self.r),
+            str(self.p),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(key).decode(),
+        ])
+
+    def verify(self, password: Password, hashed_password: str) -> bool:
+        try:
+            prefix, n, r, p, salt, key = hashed_password.split('$')
+            if prefix != self.__PREFIX:
+                return False
+
+            expected_key = base64.b64decode(key)
+            derived_key = self.__derive(password.value, base64.b64decode(salt),
+                                        int(n), int(r), int(p), len(expected_key))
+
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(derived_key, expected_key)
+
+    @staticmethod
+    def __derive(value: str, salt: bytes, n: int, r: int, p: int, key_size: int) -> bytes:
+        return hashlib.scrypt(value.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * r * (n + p + 2), dklen=key_size)
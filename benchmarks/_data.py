@@ -0,0 +1,197 @@
+import random
+
+from app.core.domain.entities.post import Post
+from app.core.domain.entities.user import User
+from app.core.domain.interfaces.password_hasher import PasswordHasher
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.password_vo import Password
+from app.core.domain.value_objects.person_name_vo import PersonName
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.post_status_vo import PostStatus, StatusEnum
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+
+DDD_CODES = (
+    "11", "12", "13", "14", "15", "16", "17", "18", "19", "21", "22", "24", "27", "28",
+    "31", "32", "33", "34", "35", "37", "38", "41", "42", "43", "44", "45", "46", "47",
+    "48", "49", "51", "53", "54", "55", "61", "62", "63", "64", "65", "66", "67", "68",
+    "69", "71", "73", "74", "75", "77", "79", "81", "82", "83", "84", "85", "86", "87",
+    "88", "89", "91", "92", "93", "94", "95", "96", "97", "98", "99",
+)
+
+
+class PlainPasswordHasher(PasswordHasher):
+    """Non-cryptographic hasher, only meant to keep benchmarks CPU-bound on the code under test."""
+
+    def hash(self, password: Password) -> str:
+        return f"plain${password.value}"
+
+    def verify(self, password: Password, hashed_password: str) -> bool:
+        return hashed_password == f"plain${password.value}"
+
+
+def make_cpf(seed: int) -> str:
+    base = f"3{seed % 10 ** 8:08d}"
+    if len(set(base)) == 1:
+        base = f"4{seed % 10 ** 8:08d}"
+
+    digits = [int(char) for char in base]
+    for weight_start in (10, 11):
+        total = sum(digit * (weight_start - i) for i, digit in enumerate(digits))
+        rest = (total * 10) % 11
+        digits.append(rest if rest < 10 else 0)
+
+    return ''.join(str(digit) for digit in digits)
+
+
+def make_phone(seed: int) -> str:
+    return f"55119{seed % 10 ** 8:08d}"
+
+
+def make_email(seed: int) -> str:
+    return f"user{seed}@example.com"
+
+
+def make_user(seed: int) -> User:
+    return User(
+        id=UUIDv7(None),
+        document=Document(make_cpf(seed)),
+        name=PersonName("Benchmark User"),
+        email=Email(make_email(seed)),
+        phone=PhoneNumber(make_phone(seed)),
+        created_at_utc=None,
+        updated_at_utc=None,
+        last_accessed_at_utc=None,
+        password=Password("plain$secret123", PlainPasswordHasher(), is_hashed=True),
+    )
+
+
+def make_post(seed: int, user_id: UUIDv7, status: StatusEnum = StatusEnum.PUBLISHED) -> Post:
+    return Post(
+        id=UUIDv7(None),
+        user_id=user_id,
+        image=None,
+        title=f"Post {seed}",
+        link=None,
+        description="",
+        body_content="",
+        status=PostStatus(status),
+        created_at_utc=None,
+        updated_at_utc=None,
+    )
+
+
+def make_cnpj(seed: int) -> str:
+    base = f"{seed % 10 ** 8:08d}0001"
+    if len(set(base)) == 1:
+        base = f"{(seed + 1) % 10 ** 8:08d}0001"
+
+    digits = [int(char) for char in base]
+    for weights in ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+                    (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)):
+        rest = sum(digit * weight for digit, weight in zip(digits, weights)) % 11
+        digits.append(0 if rest < 2 else 11 - rest)
+
+    return ''.join(str(digit) for digit in digits)
+
+
+def make_documents(count: int, invalid_ratio: float = 0.2, seed: int = 0, start: int = 0) -> list[str]:
+    """
+    Mix of formatted/unformatted CPFs and CNPJs, with a share of corrupted
+    ones. Documents are numbered from `start`, distinct calls that must not
+    collide use distinct ranges.
+    """
+    random_generator = random.Random(seed)
+    documents = []
+    for index in range(start, start + count):
+        value = make_cpf(index) if index % 2 else make_cnpj(index)
+        if random_generator.random() < invalid_ratio:
+            position = random_generator.randrange(len(value))
+            value = value[:position] + str((int(value[position]) + 1) % 10) + value[position + 1:]
+
+        if index % 3 == 0:
+            value = (f"{value[:3]}.{value[3:6]}.{value[6:9]}-{value[9:]}" if len(value) == 11
+                     else f"{value[:2]}.{value[2:5]}.{value[5:8]}/{value[8:12]}-{value[12:]}")
+
+        documents.append(value)
+
+    return documents
+
+
+def make_phones(count: int, invalid_ratio: float = 0.2, seed: int = 0) -> list[str]:
+    """Mobile and landline numbers spread over every DDD, in the formats users type, some invalid."""
+    random_generator = random.Random(seed)
+    phones = []
+    for index in range(count):
+        ddd = DDD_CODES[index % len(DDD_CODES)]
+        subscriber = f"{random_generator.randrange(10 ** 8):08d}"
+        if index % 2:
+            subscriber = "9" + subscriber
+
+        if random_generator.random() < invalid_ratio:
+            corruption = random_generator.randrange(4)
+            if corruption == 0:
+                ddd = random_generator.choice(("10", "20", "23", "25", "29", "30", "50", "90"))
+            elif corruption == 1:
+                subscriber = subscriber[:random_generator.randint(4, 7)]
+            elif corruption == 2:
+                subscriber += "0" * random_generator.randint(1, 3)
+            else:
+                subscriber = subscriber[:4] + " " + subscriber[4:]
+
+        match index % 4:
+            case 0:
+                phones.append(f"+55({ddd}){subscriber[:-4]}-{subscriber[-4:]}")
+            case 1:
+                phones.append(f"({ddd}){subscriber[:-4]}-{subscriber[-4:]}")
+            case 2:
+                phones.append(f"55{ddd}{subscriber}")
+            case _:
+                phones.append(f"{ddd}{subscriber}")
+
+    return phones
+
+
+def make_emails(count: int, invalid_ratio: float = 0.2, seed: int = 0) -> list[str]:
+    """Addresses with two to seven domain labels, some breaking one of the Email rules."""
+    random_generator = random.Random(seed)
+    labels = ("mail", "corp", "sp", "rj", "ti", "vendas", "sub-dominio", "gov", "edu", "org", "com", "br")
+    emails = []
+    for index in range(count):
+        local_part = random_generator.choice(("maria", "joao.silva", "ana_paula", "jose-carlos", "x"))
+        domain = random_generator.sample(labels, random_generator.randint(1, 5)) + ["example", "com", "br"]
+        domain = domain[-random_generator.randint(2, len(domain)):]
+        email = f"{local_part}{index}@{'.'.join(domain)}"
+
+        if random_generator.random() < invalid_ratio:
+            email = random_generator.choice((
+                email.replace("@", ""),
+                email.replace("@", ".@", 1),
+                email.replace("@", "@-", 1),
+                email.replace(".", "..", 1),
+                email.replace("@", "@@", 1),
+                email.replace("@", " @", 1),
+                f"{'a' * 61}{email}",
+                email.rsplit(".", 1)[0].replace(".", "") + "ç",
+            ))
+
+        emails.append(email)
+
+    return emails
+
+
+def user_to_row(user: User) -> dict:
+    return {
+        "id": user.id.value,
+        "document": user.document.value,
+        "name": user.name.name,
+        "email": user.email.address,
+        "phone": user.phone.number,
+        "created_at_utc": user.created_at_utc.epoch_us,
+        "updated_at_utc": user.updated_at_utc.epoch_us,
+        "last_accessed_at_utc": user.last_accessed_at_utc.epoch_us if user.last_accessed_at_utc else None,
+        "password": user.password.value,
+        "admin": user.admin,
+        "super_admin": user.super_admin,
+        "version": user.version,
+    }
@@ -0,0 +1,51 @@
+"""
+Repository writes needed to track user accesses: one UpdateUserUseCase call
+per request versus UserAccessTracker coalescing them.
+
+Usage:
+    python -m benchmarks.access_tracker_benchmark [requests] [active_users]
+"""
+import random
+import sys
+import time
+
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.use_cases.user.update_user import UpdateUserUseCase
+from app.core.use_cases.user.user_access_tracker import UserAccessTracker
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import make_user
+from benchmarks.round_trip_benchmark import CountingRepository
+
+
+def main(argv: list[str]) -> None:
+    requests = int(argv[0]) if argv else 100_000
+    active_users = int(argv[1]) if len(argv) > 1 else 1_000
+
+    repository = InMemoryUserRepository()
+    creator = make_user(0)
+    creator.admin = True
+    repository.create(creator)
+    ids = [repository.create(make_user(seed)).value for seed in range(1, active_users + 1)]
+    first_access = Timestamp.now().epoch_us
+    accesses = [(random.choice(ids), Timestamp(first_access + i)) for i in range(requests)]
+
+    counting = CountingRepository(repository)
+    use_case = UpdateUserUseCase(counting)
+    start = time.perf_counter()
+    for user_id, accessed_at_utc in accesses:
+        use_case.execute(creator.id.value, user_id,
+                         last_accessed_at_utc_str=accessed_at_utc.isoformat())
+    seconds = time.perf_counter() - start
+    print(f"{'UpdateUserUseCase':<18} {sum(counting.calls.values()):>8} repository calls  {seconds:.2f} s")
+
+    counting = CountingRepository(repository)
+    start = time.perf_counter()
+    with UserAccessTracker(counting, max_pending=active_users * 10) as tracker:
+        for user_id, accessed_at_utc in accesses:
+            tracker.record(user_id, accessed_at_utc)
+    seconds = time.perf_counter() - start
+    print(f"{'UserAccessTracker':<18} {sum(counting.calls.values()):>8} repository calls  {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
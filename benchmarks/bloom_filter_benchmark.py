@@ -0,0 +1,83 @@
+"""
+Signups of new identities through CreateUserUseCase with and without
+BloomFilteredUserRepository, plus the filter's measured false positive
+rate, warm-up and save/load cost. Repository calls sleep like in
+concurrency_benchmark, standing in for a database round trip.
+
+Usage:
+    python -m benchmarks.bloom_filter_benchmark [existing_users] [signups]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from app.core.use_cases.user.create_user import CreateUserUseCase
+from app.infrastructure.repositories.bloom_filter import BloomFilter
+from app.infrastructure.repositories.bloom_filtered_user_repository import BloomFilteredUserRepository
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import PlainPasswordHasher, make_cpf, make_email, make_phone, make_user
+from benchmarks.concurrency_benchmark import LatencyRepository
+from benchmarks.round_trip_benchmark import CountingRepository
+
+FALSE_POSITIVE_RATE = 0.01
+
+
+def signup(repository, creator_id: str, seeds: range) -> float:
+    use_case = CreateUserUseCase(repository)
+    password_hasher = PlainPasswordHasher()
+    start = time.perf_counter()
+    for seed in seeds:
+        use_case.execute(make_cpf(seed), "Maria Silva", make_email(seed), make_phone(seed),
+                         "secret123", password_hasher, creator_id)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> None:
+    existing_users = int(argv[0]) if argv else 100_000
+    signups = int(argv[1]) if len(argv) > 1 else 2_000
+
+    repository = InMemoryUserRepository()
+    creator = make_user(0)
+    creator.admin = True
+    repository.create(creator)
+    repository.create_many([make_user(seed) for seed in range(1, existing_users)])
+
+    counting = CountingRepository(LatencyRepository(repository))
+    seconds = signup(counting, creator.id.value, range(existing_users, existing_users + signups))
+    print(f"{'plain':<8} {counting.calls['find_conflicts'] / signups:.3f} conflict queries/signup  "
+          f"{seconds / signups * 1e6:>6.1f} us/signup")
+
+    counting = CountingRepository(LatencyRepository(repository))
+    filtered = BloomFilteredUserRepository(
+        counting, expected_users=existing_users + 2 * signups, false_positive_rate=FALSE_POSITIVE_RATE)
+    start = time.perf_counter()
+    filtered.warm_up()
+    warm_up_seconds = time.perf_counter() - start
+    counting.calls.clear()
+
+    seconds = signup(filtered, creator.id.value,
+                     range(existing_users + signups, existing_users + 2 * signups))
+    print(f"{'bloom':<8} {counting.calls['find_conflicts'] / signups:.3f} conflict queries/signup  "
+          f"{seconds / signups * 1e6:>6.1f} us/signup")
+
+    probes = [f"email:unseen{seed}@example.org" for seed in range(100_000)]
+    false_positives = sum(probe in filtered.bloom_filter for probe in probes)
+    print(f"false positive rate {false_positives / len(probes):.4f} "
+          f"(configured {FALSE_POSITIVE_RATE}, estimated {filtered.bloom_filter.estimated_false_positive_rate:.4f})")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "users.bloom")
+        start = time.perf_counter()
+        filtered.bloom_filter.save(path)
+        save_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = BloomFilter.load(path)
+        load_seconds = time.perf_counter() - start
+        assert all(filtered._key("email", make_email(seed)) in loaded for seed in range(1, 1000))
+        print(f"warm-up {warm_up_seconds:.2f} s  save {save_seconds * 1e3:.1f} ms  "
+              f"load {load_seconds * 1e3:.1f} ms  {os.path.getsize(path) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+"""
+Concurrent read-modify-write of users: optimistic concurrency (versioned
+compare-and-swap with retries) versus one global lock around every update.
+
+Each operation increments a counter kept in the epoch microseconds of
+last_accessed_at_utc, so any lost update shows up as a final sum lower than
+the number of operations. Every repository call sleeps `latency` seconds to
+stand in for a network round trip.
+
+Usage:
+    python -m benchmarks.concurrency_benchmark [threads] [operations_per_thread] [users]
+"""
+import random
+import sys
+import threading
+import time
+
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.exceptions.concurrency_conflict_exception import ConcurrencyConflictException
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import make_user
+
+LATENCY_SECONDS = 0.0005
+
+
+class LatencyRepository:
+
+    def __init__(self, user_repository) -> None:
+        self.user_repository = user_repository
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.user_repository, name)
+
+        def delayed(*args, **kwargs):
+            time.sleep(LATENCY_SECONDS)
+            return attribute(*args, **kwargs)
+
+        return delayed
+
+
+def setup(users: int):
+    repository = InMemoryUserRepository()
+    ids = []
+    for seed in range(users):
+        user = make_user(seed)
+        user.last_accessed_at_utc = Timestamp(0)
+        ids.append(repository.create(user))
+    return repository, ids
+
+
+def increment(repository, id, expected_version: bool) -> None:
+    user = repository.get_by_id(id)
+    repository.patch(id,
+                     {"last_accessed_at_utc": Timestamp(user.last_accessed_at_utc.epoch_us + 1)},
+                     user.version if expected_version else None)
+
+
+def run(threads: int, operations: int, users: int, optimistic: bool) -> tuple[float, int, int]:
+    inner, ids = setup(users)
+    repository = LatencyRepository(inner)
+    global_lock = threading.Lock()
+    conflicts = [0]
+    conflicts_lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(operations):
+            id = random.choice(ids)
+            if not optimistic:
+                with global_lock:
+                    increment(repository, id, expected_version=False)
+                continue
+
+            while True:
+                try:
+                    increment(repository, id, expected_version=True)
+                    break
+                except ConcurrencyConflictException:
+                    with conflicts_lock:
+                        conflicts[0] += 1
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    total = sum(inner.get_by_id(id).last_accessed_at_utc.epoch_us for id in ids)
+    return seconds, total, conflicts[0]
+
+
+def main(argv: list[str]) -> None:
+    threads = int(argv[0]) if argv else 8
+    operations = int(argv[1]) if len(argv) > 1 else 200
+    users = int(argv[2]) if len(argv) > 2 else 50
+    expected = threads * operations
+
+    for name, optimistic in (("global lock", False), ("optimistic", True)):
+        seconds, total, conflicts = run(threads, operations, users, optimistic)
+        status = "no lost updates" if total == expected else f"LOST {expected - total} updates"
+        print(f"{name:<12} {expected / seconds:>8,.0f} ops/s  {conflicts:>5} conflicts  {status}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
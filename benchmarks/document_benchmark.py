@@ -0,0 +1,53 @@
+"""
+Throughput of Document.validate_many against one Document() per value.
+
+Before timing, both paths are run over the generated data plus a set of
+edge cases and must agree on every input.
+
+Usage:
+    python -m benchmarks.document_benchmark [count]
+"""
+import sys
+import time
+
+from app.core.domain.value_objects.document_vo import Document
+from benchmarks._data import make_documents
+
+EDGE_CASES = [
+    "", "\n", ".", "./-", "111.111.111-11", "11111111111", "00000000000000",
+    "529.982.247-25", "52998224725\n", "52998224725\n\n", " 52998224725",
+    "5299822472５", "529982247²5", "12.345.678/0001-95", "123", None, 12345678909,
+]
+
+
+def scalar(values: list) -> tuple[list[bool], list[str | None]]:
+    mask, normalized = [], []
+    for value in values:
+        try:
+            normalized.append(Document(value).value)
+            mask.append(True)
+        except (TypeError, ValueError):
+            normalized.append(None)
+            mask.append(False)
+
+    return mask, normalized
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 500_000
+    values = make_documents(count) + EDGE_CASES
+
+    scalar_mask, scalar_values = scalar(values)
+    batch_mask, batch_values = Document.validate_many(values)
+    assert scalar_mask == batch_mask
+    assert all(batch_values[i] == scalar_values[i] for i, valid in enumerate(scalar_mask) if valid)
+
+    for name, function in (("Document()", scalar), ("Document.validate_many", Document.validate_many)):
+        start = time.perf_counter()
+        function(values)
+        seconds = time.perf_counter() - start
+        print(f"{name:<24} {len(values) / seconds:>12,.0f} documents/s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
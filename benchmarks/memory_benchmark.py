@@ -0,0 +1,33 @@
+"""
+Memory held per User (with its value objects) and per Post.
+
+Usage:
+    python -m benchmarks.memory_benchmark [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from benchmarks._data import make_post, make_user
+
+
+def bytes_per_object(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(seed) for seed in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 50_000
+    user_id = UUIDv7(None)
+    print(f"User {bytes_per_object(make_user, count):>8.0f} bytes/object")
+    print(f"Post {bytes_per_object(lambda seed: make_post(seed, user_id), count):>8.0f} bytes/object")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
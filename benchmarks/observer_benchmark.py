@@ -0,0 +1,79 @@
+"""
+Cost of use-case instrumentation: CreateUserUseCase and UpdateUserUseCase
+with the default no-op observer, with a RecordingUseCaseObserver fed by the
+observed repository and hasher, and the bare no-op calls themselves. Ends
+with the recorded snapshot of the last run.
+
+Usage:
+    python -m benchmarks.observer_benchmark [calls]
+"""
+import json
+import sys
+import time
+import timeit
+
+from app.core.domain.interfaces.use_case_observer import UseCaseObserver
+from app.core.use_cases.user.create_user import CreateUserUseCase
+from app.core.use_cases.user.update_user import UpdateUserUseCase
+from app.infrastructure.observability.recording_use_case_observer import RecordingUseCaseObserver
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from app.infrastructure.repositories.observed_user_repository import ObservedUserRepository
+from app.infrastructure.security.observed_password_hasher import ObservedPasswordHasher
+from benchmarks._data import PlainPasswordHasher, make_cpf, make_email, make_phone, make_user
+
+
+def run(calls: int, recording: bool, first_seed: int) -> tuple[float, float, RecordingUseCaseObserver | None]:
+    repository = InMemoryUserRepository()
+    creator = make_user(first_seed)
+    creator.admin = True
+    repository.create(creator)
+
+    observer = RecordingUseCaseObserver() if recording else None
+    password_hasher = PlainPasswordHasher()
+    if observer is not None:
+        repository = ObservedUserRepository(repository, observer)
+        password_hasher = ObservedPasswordHasher(password_hasher, observer)
+
+    create_user = CreateUserUseCase(repository, observer=observer)
+    update_user = UpdateUserUseCase(repository, observer=observer)
+    seeds = range(first_seed + 1, first_seed + 1 + calls)
+    inputs = [(make_cpf(seed), make_email(seed), make_phone(seed)) for seed in seeds]
+
+    start = time.perf_counter()
+    ids = [create_user.execute(document, "Usuario Novo", email, phone, "secret123",
+                               password_hasher, creator.id.value)
+           for document, email, phone in inputs]
+    create_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for id in ids:
+        update_user.execute(creator.id.value, id, name_str="Maria Souza")
+    update_seconds = time.perf_counter() - start
+
+    return create_seconds / calls * 1e9, update_seconds / calls * 1e9, observer
+
+
+def main(argv: list[str]) -> None:
+    calls = int(argv[0]) if argv else 20_000
+
+    observer = UseCaseObserver()
+
+    def no_op_calls() -> None:
+        invocation = observer.start("CreateUserUseCase")
+        for phase in ("authorization", "validation", "conflict_check", "persist"):
+            invocation.enter(phase)
+        invocation.finish()
+
+    no_op = min(timeit.repeat(no_op_calls, number=100_000, repeat=5)) / 100_000 * 1e9
+    print(f"no-op observer calls per execute {no_op:>10.0f} ns")
+
+    print(f"{'':<24} {'create':>10} {'update':>10}")
+    for label, recording in (("no-op observer", False), ("recording observer", True)) * 2:
+        create_ns, update_ns, recorded = run(calls, recording, first_seed=10 ** 7 * (1 + recording))
+        print(f"{label:<24} {create_ns:>7.0f} ns {update_ns:>7.0f} ns")
+
+    print(json.dumps(recorded.snapshot()["use_cases"]["CreateUserUseCase"]["phases_seconds"], indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
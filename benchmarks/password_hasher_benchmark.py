@@ -0,0 +1,38 @@
+"""
+scrypt hashing throughput inline versus PooledPasswordHasher with an
+increasing number of worker processes.
+
+Usage:
+    python -m benchmarks.password_hasher_benchmark [passwords]
+"""
+import os
+import sys
+import time
+
+from app.core.domain.value_objects.password_vo import Password
+from app.infrastructure.security.pooled_password_hasher import PooledPasswordHasher
+from app.infrastructure.security.scrypt_password_hasher import ScryptPasswordHasher
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 64
+    scrypt = ScryptPasswordHasher()
+    passwords = [Password.from_validated_plain(f"password-{i}", scrypt) for i in range(count)]
+
+    start = time.perf_counter()
+    for password in passwords:
+        scrypt.hash(password)
+    print(f"{'inline':<12} {count / (time.perf_counter() - start):>8.1f} hashes/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with PooledPasswordHasher(scrypt, max_workers=workers) as pooled:
+            pooled.hash_many(passwords[:workers])  # warm up the processes
+            start = time.perf_counter()
+            pooled.hash_many(passwords)
+            print(f"{f'{workers} workers':<12} {count / (time.perf_counter() - start):>8.1f} hashes/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,88 @@
+"""
+Rendering one page of a user's published feed and counting their posts per
+status: get_all plus filtering in Python versus get_page / count_by_status.
+
+Each user gets `posts_per_user` posts, a third of them published.
+
+Usage:
+    python -m benchmarks.post_repository_benchmark [users] [posts_per_user]
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+from app.core.domain.value_objects.post_status_vo import PostStatus, StatusEnum
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.infrastructure.repositories.in_memory_post_repository import InMemoryPostRepository
+from app.infrastructure.repositories.sqlite_connection_pool import SQLiteConnectionPool
+from app.infrastructure.repositories.sqlite_post_repository import SQLitePostRepository
+from benchmarks._data import make_post
+
+PAGE_SIZE = 20
+LOOKUPS = 200
+PUBLISHED = PostStatus(StatusEnum.PUBLISHED)
+
+
+def fill(repository, users: int, posts_per_user: int) -> list[UUIDv7]:
+    user_ids = [UUIDv7(None) for _ in range(users)]
+    statuses = list(StatusEnum)
+    posts = [make_post(seed, user_id, statuses[seed % len(statuses)])
+             for user_id in user_ids for seed in range(posts_per_user)]
+    repository.create_many(posts)
+    return user_ids
+
+
+def feed_with_get_all(repository, user_id: UUIDv7) -> list:
+    posts = [post for post in repository.get_all(user_id) if post.status == PUBLISHED]
+    posts.sort(key=lambda post: post.id.value, reverse=True)
+    return posts[:PAGE_SIZE]
+
+
+def count_with_get_all(repository, user_id: UUIDv7) -> dict:
+    counts: dict = {}
+    for post in repository.get_all(user_id):
+        counts[post.status] = counts.get(post.status, 0) + 1
+    return counts
+
+
+def run(name: str, repository, users: int, posts_per_user: int) -> None:
+    user_ids = fill(repository, users, posts_per_user)
+    sample = [random.choice(user_ids) for _ in range(LOOKUPS)]
+
+    for user_id in sample[:10]:
+        expected = [post.id for post in feed_with_get_all(repository, user_id)]
+        assert expected == [post.id for post in repository.get_page(user_id, PAGE_SIZE, PUBLISHED)]
+        assert count_with_get_all(repository, user_id) == repository.count_by_status(user_id)
+
+    def per_call(function) -> float:
+        seconds = timeit.timeit(lambda: [function(user_id) for user_id in sample], number=1)
+        return seconds / len(sample) * 1e6
+
+    results = (
+        ("feed: get_all + filter", per_call(lambda user_id: feed_with_get_all(repository, user_id))),
+        ("feed: get_page", per_call(lambda user_id: repository.get_page(user_id, PAGE_SIZE, PUBLISHED))),
+        ("count: get_all + count", per_call(lambda user_id: count_with_get_all(repository, user_id))),
+        ("count: count_by_status", per_call(repository.count_by_status)),
+    )
+    for label, microseconds in results:
+        print(f"{name:<10} {label:<24} {microseconds:>10.1f} us/call")
+
+
+def main(argv: list[str]) -> None:
+    users = int(argv[0]) if argv else 100
+    posts_per_user = int(argv[1]) if len(argv) > 1 else 2_000
+
+    run("in-memory", InMemoryPostRepository(), users, posts_per_user)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SQLiteConnectionPool(os.path.join(directory, "posts.db"))
+        try:
+            run("sqlite", SQLitePostRepository(pool), users, posts_per_user)
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
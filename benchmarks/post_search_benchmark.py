@@ -0,0 +1,118 @@
+"""
+Query latency of InvertedPostIndex as the number of posts grows, against a
+linear scan of every post on the smallest size.
+
+Post text is drawn from a synthetic, Zipf-distributed Portuguese-like
+vocabulary with accents, a third of the posts are PUBLISHED. Each query has
+two or three words of mixed frequency.
+
+Usage:
+    python -m benchmarks.post_search_benchmark [size ...]
+"""
+import itertools
+import random
+import sys
+import time
+
+from app.core.domain.entities.post import Post
+from app.core.domain.value_objects.post_status_vo import PostStatus, StatusEnum
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.infrastructure.search.inverted_post_index import InvertedPostIndex, tokenize
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+QUERIES = 200
+LIMIT = 10
+SYLLABLES = ("ba", "ca", "ção", "da", "fé", "ga", "lã", "ma", "na", "pão", "ra", "sa", "tá", "vi", "zu", "lo", "mé", "pi")
+
+
+def make_vocabulary(size: int, random_generator: random.Random) -> tuple[list[str], list[float]]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(random_generator.choices(SYLLABLES, k=random_generator.randint(2, 4))))
+    vocabulary = sorted(words)
+    random_generator.shuffle(vocabulary)
+    cumulative_weights = list(itertools.accumulate(1 / rank for rank in range(1, size + 1)))
+    return vocabulary, cumulative_weights
+
+
+def make_posts(count: int, seed: int = 0):
+    random_generator = random.Random(seed)
+    vocabulary, cumulative_weights = make_vocabulary(30_000, random_generator)
+    statuses = [PostStatus(status) for status in StatusEnum]
+    user_id = UUIDv7(None)
+
+    def words(count: int) -> str:
+        return " ".join(random_generator.choices(vocabulary, cum_weights=cumulative_weights, k=count))
+
+    for seed in range(count):
+        yield Post(
+            id=UUIDv7(None),
+            user_id=user_id,
+            image=None,
+            title=words(6).capitalize(),
+            link=None,
+            description=words(12),
+            body_content=words(40),
+            status=statuses[seed % len(statuses)],
+            created_at_utc=None,
+            updated_at_utc=None,
+        )
+
+
+def make_queries(seed: int = 1) -> list[str]:
+    random_generator = random.Random(seed)
+    vocabulary, _ = make_vocabulary(30_000, random.Random(0))
+    # one word from the head, the others from the middle and the tail of the distribution
+    return [" ".join([vocabulary[random_generator.randrange(50)],
+                      vocabulary[random_generator.randrange(50, 2_000)],
+                      *([vocabulary[random_generator.randrange(2_000, 30_000)]] if index % 2 else [])])
+            for index in range(QUERIES)]
+
+
+def percentiles(samples: list[float]) -> tuple[float, float]:
+    samples = sorted(samples)
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+def scan(posts: list[Post], query: str) -> list[str]:
+    terms = set(tokenize(query))
+    matches = [post.id.value for post in posts if post.status.status is StatusEnum.PUBLISHED
+               and terms & set(tokenize(f"{post.title} {post.description} {post.body_content}"))]
+    return matches[:LIMIT]
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    queries = make_queries()
+    print(f"{'posts':>10} {'build':>9} {'p50':>10} {'p95':>10}")
+
+    for position, size in enumerate(sizes):
+        index = InvertedPostIndex()
+        kept_posts = []
+        start = time.perf_counter()
+        for post in make_posts(size):
+            index.add(post)
+            if position == 0:
+                kept_posts.append(post)
+        build_seconds = time.perf_counter() - start
+
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, LIMIT)
+            samples.append((time.perf_counter() - start) * 1e3)
+        p50, p95 = percentiles(samples)
+        print(f"{size:>10} {build_seconds:>7.1f} s {p50:>7.2f} ms {p95:>7.2f} ms")
+
+        if kept_posts:
+            samples = []
+            for query in queries[:10]:
+                start = time.perf_counter()
+                scan(kept_posts, query)
+                samples.append((time.perf_counter() - start) * 1e3)
+            p50, p95 = percentiles(samples)
+            print(f"{'(scan)':>10} {'':>9} {p50:>7.2f} ms {p95:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,84 @@
+"""
+Loading stored rows through ListUsersUseCase, rehydrating each User with the
+validating constructors versus User.from_row.
+
+Usage:
+    python -m benchmarks.rehydration_benchmark [rows]
+"""
+import sys
+import time
+
+from app.core.domain.entities.user import User
+from app.core.domain.repositories.user_repository import UserRepository
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.password_vo import Password
+from app.core.domain.value_objects.person_name_vo import PersonName
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.timestamp_vo import Timestamp
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.use_cases.user.list_users import ListUsersUseCase
+from benchmarks._data import PlainPasswordHasher, make_user, user_to_row
+
+
+def validated_user(row: dict, password_hasher: PlainPasswordHasher) -> User:
+    return User(
+        id=UUIDv7(row["id"]),
+        document=Document(row["document"]),
+        name=PersonName(row["name"]),
+        email=Email(row["email"]),
+        phone=PhoneNumber(row["phone"]),
+        created_at_utc=Timestamp(row["created_at_utc"]),
+        updated_at_utc=Timestamp(row["updated_at_utc"]),
+        last_accessed_at_utc=(Timestamp(row["last_accessed_at_utc"])
+                              if row["last_accessed_at_utc"] is not None else None),
+        password=Password(row["password"], password_hasher, is_hashed=True),
+        admin=row["admin"],
+        super_admin=row["super_admin"],
+    )
+
+
+class RowUserRepository(UserRepository):
+
+    def __init__(self, rows: list[dict], rehydrate) -> None:
+        self.rows = rows
+        self.rehydrate = rehydrate
+        self.password_hasher = PlainPasswordHasher()
+
+    def get_all(self) -> list[User]:
+        return [self.rehydrate(row, self.password_hasher) for row in self.rows]
+
+    def get_by_id(self, id):
+        raise NotImplementedError
+
+    def create(self, user):
+        raise NotImplementedError
+
+    def update(self, user):
+        raise NotImplementedError
+
+    def get_by_email(self, email):
+        raise NotImplementedError
+
+    def get_by_phone_number(self, telefone):
+        raise NotImplementedError
+
+    def get_by_document(self, document):
+        raise NotImplementedError
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 1_000_000
+    rows = [user_to_row(make_user(seed)) for seed in range(count)]
+
+    for name, rehydrate in (("validated constructors", validated_user), ("User.from_row", User.from_row)):
+        use_case = ListUsersUseCase(RowUserRepository(rows, rehydrate))
+        start = time.perf_counter()
+        users = use_case.execute()
+        seconds = time.perf_counter() - start
+        print(f"{name:<24} {seconds:>8.2f} s  {count / seconds:>12,.0f} users/s")
+        del users
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
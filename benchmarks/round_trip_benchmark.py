@@ -0,0 +1,82 @@
+"""
+Repository round trips per CreateUserUseCase / UpdateUserUseCase call.
+
+Every top-level call the use case makes on the repository is counted, which
+is what each network round trip would be against a remote store. The first
+rows use the default CreatorPermissionCache, shared by the use cases of one
+repository; the last rows repeat the calls with the cache disabled.
+
+Usage:
+    python -m benchmarks.round_trip_benchmark
+"""
+from collections import Counter
+
+from app.core.use_cases.user.create_user import CreateUserUseCase
+from app.core.use_cases.user.creator_permission_cache import CreatorPermissionCache
+from app.core.use_cases.user.update_user import UpdateUserUseCase
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import PlainPasswordHasher, make_cpf, make_email, make_phone, make_user
+
+
+class CountingRepository:
+
+    def __init__(self, user_repository) -> None:
+        self.user_repository = user_repository
+        self.calls: Counter[str] = Counter()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.user_repository, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.calls[name] += 1
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+def report(name: str, repository: CountingRepository) -> None:
+    calls = ", ".join(f"{method}={count}" for method, count in sorted(repository.calls.items()))
+    print(f"{name:<32} {sum(repository.calls.values())} round trips ({calls})")
+    repository.calls.clear()
+
+
+def main() -> None:
+    repository = InMemoryUserRepository()
+    creator = make_user(0)
+    creator.admin = True
+    repository.create(creator)
+    counting = CountingRepository(repository)
+
+    user_id = CreateUserUseCase(counting).execute(
+        make_cpf(1), "Maria Silva", make_email(1), make_phone(1), "secret123",
+        PlainPasswordHasher(), creator.id.value)
+    report("CreateUserUseCase", counting)
+
+    UpdateUserUseCase(counting).execute(creator.id.value, user_id, name_str="Maria Souza")
+    report("UpdateUserUseCase (name)", counting)
+
+    UpdateUserUseCase(counting).execute(creator.id.value, user_id, name_str="Maria Souza")
+    report("UpdateUserUseCase (no change)", counting)
+
+    UpdateUserUseCase(counting).execute(
+        creator.id.value, user_id, document_str=make_cpf(2), email_str=make_email(2),
+        phone_number_str=make_phone(2))
+    report("UpdateUserUseCase (unique keys)", counting)
+
+    # the use cases above share the default cache of `counting`, compare without it
+    uncached = CreatorPermissionCache(counting, ttl_seconds=0)
+    create_use_case = CreateUserUseCase(counting, uncached)
+    update_use_case = UpdateUserUseCase(counting, permission_cache=uncached)
+    for seed in (3, 4):
+        user_id = create_use_case.execute(
+            make_cpf(seed), "Maria Silva", make_email(seed), make_phone(seed), "secret123",
+            PlainPasswordHasher(), creator.id.value)
+        report(f"CreateUserUseCase (uncached #{seed - 2})", counting)
+
+        update_use_case.execute(creator.id.value, user_id, name_str="Maria Souza")
+        report(f"UpdateUserUseCase (uncached #{seed - 2})", counting)
+
+if __name__ == "__main__":
+    main()
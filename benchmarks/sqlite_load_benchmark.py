@@ -0,0 +1,63 @@
+"""
+Concurrent load on SQLiteUserRepository: create, get_by_email and get_page
+operations per second with several threads sharing one connection pool.
+
+Usage:
+    python -m benchmarks.sqlite_load_benchmark [threads] [operations_per_thread]
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from app.core.domain.value_objects.email_vo import Email
+from app.infrastructure.repositories.sqlite_connection_pool import SQLiteConnectionPool
+from app.infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+from benchmarks._data import PlainPasswordHasher, make_email, make_user
+
+
+def run_threads(threads: int, target) -> float:
+    workers = [threading.Thread(target=target, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> None:
+    threads = int(argv[0]) if argv else 8
+    operations = int(argv[1]) if len(argv) > 1 else 2_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SQLiteConnectionPool(os.path.join(directory, "load.db"), size=threads)
+        repository = SQLiteUserRepository(pool, PlainPasswordHasher())
+        total = threads * operations
+
+        def create(index: int) -> None:
+            for seed in range(index * operations, (index + 1) * operations):
+                repository.create(make_user(seed))
+
+        def get_by_email(index: int) -> None:
+            emails = [Email(make_email(random.randrange(total))) for _ in range(operations)]
+            for email in emails:
+                repository.get_by_email(email)
+
+        def get_page(index: int) -> None:
+            for _ in range(operations // 10):
+                repository.get_page(100)
+
+        for name, target, count in (("create", create, total),
+                                    ("get_by_email", get_by_email, total),
+                                    ("get_page(100)", get_page, threads * (operations // 10))):
+            seconds = run_threads(threads, target)
+            print(f"{name:<14} {count / seconds:>10,.0f} ops/s  ({threads} threads)")
+
+        pool.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
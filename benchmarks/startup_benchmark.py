@@ -0,0 +1,75 @@
+"""
+Startup cost of the core packages: each statement runs in a fresh
+interpreter under `-X importtime`, and the median cumulative import time of
+its top-level module, the process wall time and the heaviest `app.` modules
+(self time) are reported. Modules the bare interpreter already imports
+(site, encodings, ...) are left out of the import time.
+
+Usage:
+    python -m benchmarks.startup_benchmark [repeat]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "pass",
+    "import app.core.domain",
+    "import app.core.use_cases",
+    "from app.core.domain import Email",
+    "from app.core.domain import User",
+    "from app.core.use_cases import CreateUserUseCase",
+    "import app.core.use_cases.user.update_user",
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(statement: str) -> tuple[float, dict[str, tuple[int, int, bool]]]:
+    """Wall seconds of the process and {module: (self µs, cumulative µs, top level)}."""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                               cwd=ROOT, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented by two spaces per level
+        modules[name.strip()] = (int(self_time), int(cumulative), not name.startswith("  "))
+    return wall, modules
+
+
+def measure(statement: str, repeat: int, preloaded: set[str]) -> tuple[float, float, list[tuple[str, int]]]:
+    walls, totals, app_modules = [], [], {}
+    for _ in range(repeat):
+        wall, modules = import_times(statement)
+        walls.append(wall)
+        # `import a.b.c` lists a, a.b and a.b.c side by side, each with its own nested imports
+        totals.append(sum(cumulative for name, (_, cumulative, top_level) in modules.items()
+                          if top_level and name not in preloaded))
+        for name, (self_time, _, _) in modules.items():
+            if name.startswith("app."):
+                app_modules.setdefault(name, []).append(self_time)
+
+    heaviest = sorted(((name, statistics.median(times)) for name, times in app_modules.items()),
+                      key=lambda item: item[1], reverse=True)
+    return statistics.median(totals), statistics.median(walls), heaviest[:3]
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    preloaded = set(import_times("pass")[1])
+
+    print(f"{'statement':<50} {'imports':>11} {'process':>11}  heaviest app modules (self)")
+    for statement in STATEMENTS:
+        total, wall, heaviest = measure(statement, repeat, preloaded)
+        modules = ", ".join(f"{name.removeprefix('app.core.')} {self_time / 1000:.2f}" for name, self_time in heaviest)
+        print(f"{statement:<50} {total / 1000:>8.2f} ms {wall * 1000:>8.1f} ms  {modules}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+Performance baseline for the value objects, entities and user use cases.
+
+    python -m benchmarks.suite run [--sizes 1000 10000 ...] [--output report.json]
+    python -m benchmarks.suite compare baseline.json report.json [--threshold 0.1]
+
+`run` writes a JSON report (see `report.py`); `compare` lists every result
+that got slower (or bigger) than the baseline by more than the threshold
+and exits with status 1 if there is any.
+"""
@@ -0,0 +1,66 @@
+import argparse
+import sys
+import time
+
+from benchmarks.suite import report
+from benchmarks.suite.cases import all_cases
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def run(arguments: argparse.Namespace) -> int:
+    results = {}
+    for name, benchmark in all_cases(arguments.sizes, arguments.count, arguments.operations):
+        if arguments.filter and not any(pattern in name for pattern in arguments.filter):
+            continue
+
+        start = time.perf_counter()
+        measurement = benchmark(arguments.repeat)
+        results[name] = measurement
+        print(f"{name:<44} {measurement.value:>14,.0f} {measurement.unit:<12} "
+              f"({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+
+    settings = {
+        "sizes": arguments.sizes,
+        "count": arguments.count,
+        "operations": arguments.operations,
+        "repeat": arguments.repeat,
+    }
+    report.save(report.build_report(results, settings), arguments.output)
+    return 0
+
+
+def compare(arguments: argparse.Namespace) -> int:
+    comparison = report.compare(report.load(arguments.baseline), report.load(arguments.current), arguments.threshold)
+    print(report.format_comparison(comparison))
+    return 1 if comparison.regressions else 0
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write a JSON report")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                            help="stored users for the use-case benchmarks")
+    run_parser.add_argument("--count", type=int, default=20_000,
+                            help="inputs per value object and entity benchmark")
+    run_parser.add_argument("--operations", type=int, default=1_000, help="use-case calls per pass")
+    run_parser.add_argument("--repeat", type=int, default=5, help="passes per benchmark, the median is kept")
+    run_parser.add_argument("--filter", nargs="+", help="only run benchmarks whose name contains any of these")
+    run_parser.add_argument("--output", default="-", help="report path, '-' for stdout")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions of a report against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative slowdown tolerated before flagging, 0.10 = 10%%")
+    compare_parser.set_defaults(handler=compare)
+
+    arguments = parser.parse_args(argv)
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
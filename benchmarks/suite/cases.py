@@ -0,0 +1,176 @@
+"""
+Every benchmark of the suite, as (name, run) pairs where `run(repeat)`
+returns a Measurement. Names are `group/subject/variant[/size]`, stable
+across runs so reports can be compared.
+"""
+import functools
+import random
+from typing import Callable, Iterator
+
+from app.core.domain.entities.user import User
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7
+from app.core.use_cases.user.create_user import CreateUserUseCase
+from app.core.use_cases.user.get_user import GetUserUseCase
+from app.core.use_cases.user.get_user_by_email import GetUserByEmailUseCase
+from app.core.use_cases.user.import_users import ImportUserRow, ImportUsersUseCase
+from app.core.use_cases.user.list_users import ListUsersUseCase
+from app.core.use_cases.user.update_user import UpdateUserUseCase
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import (
+    PlainPasswordHasher, make_cpf, make_documents, make_email, make_emails, make_phone, make_phones, make_post,
+    make_user, user_to_row,
+)
+from benchmarks.suite.measure import Measurement, bytes_per_object, time_per_call
+
+Case = tuple[str, Callable[[int], Measurement]]
+
+PASSWORD_HASHER = PlainPasswordHasher()
+
+
+def split_by_validity(factory: Callable[[str], object], values: list[str]) -> tuple[list[str], list[str]]:
+    valid, invalid = [], []
+    for value in values:
+        try:
+            factory(value)
+            valid.append(value)
+        except ValueError:
+            invalid.append(value)
+
+    return valid, invalid
+
+
+def scalar_cases(count: int) -> Iterator[Case]:
+    for subject, factory, values in (
+        ("Document", Document, make_documents(count, seed=1)),
+        ("Email", Email, make_emails(count, seed=2)),
+        ("PhoneNumber", PhoneNumber, make_phones(count, seed=3)),
+    ):
+        valid, invalid = split_by_validity(factory, values)
+        yield f"scalar/{subject}/valid", functools.partial(time_per_call, factory, valid)
+        yield f"scalar/{subject}/invalid", functools.partial(time_per_call, factory, invalid)
+
+    uuids = [UUIDv7(None).value for _ in range(count)]
+    yield "scalar/UUIDv7/generate", functools.partial(time_per_call, UUIDv7, [None] * count)
+    yield "scalar/UUIDv7/parse", functools.partial(time_per_call, UUIDv7, uuids)
+
+    rows = [user_to_row(make_user(seed)) for seed in range(count)]
+    yield "entity/User/new", functools.partial(time_per_call, make_user, list(range(count)))
+    yield "entity/User/from_row", functools.partial(
+        time_per_call, lambda row: User.from_row(row, PASSWORD_HASHER), rows)
+
+
+def memory_cases(count: int) -> Iterator[Case]:
+    user_id = UUIDv7(None)
+    documents = make_documents(count, invalid_ratio=0, seed=4)
+    for subject, factory in (
+        ("User", make_user),
+        ("Post", lambda seed: make_post(seed, user_id)),
+        ("Document", lambda seed: Document(documents[seed])),
+        ("Email", lambda seed: Email(make_email(seed))),
+        ("PhoneNumber", lambda seed: PhoneNumber(make_phone(seed))),
+        ("UUIDv7", lambda seed: UUIDv7(None)),
+    ):
+        yield f"memory/{subject}", functools.partial(bytes_per_object, factory, count)
+
+
+class UserFixture:
+    """`size` stored users plus an admin creator, built once per size."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.repository = InMemoryUserRepository()
+        users = [make_user(seed) for seed in range(size)]
+        self.repository.create_many(users)
+        self.user_ids = [user.id.value for user in users]
+        self.emails = [user.email.address for user in users]
+
+        creator = make_user(size)
+        creator.admin = True
+        self.repository.create(creator)
+        self.creator_id = creator.id.value
+        # seeds of users created while benchmarking, past every stored one
+        self.next_seed = size + 1
+
+    def new_user_inputs(self, count: int) -> list[tuple[str, str, str, str]]:
+        seeds = range(self.next_seed, self.next_seed + count)
+        self.next_seed += count
+        return [(make_cpf(seed), make_email(seed), make_phone(seed), "secret123") for seed in seeds]
+
+    def import_rows(self, count: int) -> list[ImportUserRow]:
+        # a few bad fields per batch, as in real import files; valid rows must not collide with stored users
+        seed = self.next_seed
+        self.next_seed += count
+        documents = make_documents(count, invalid_ratio=0.05, seed=seed, start=seed)
+        emails = make_emails(count, invalid_ratio=0.05, seed=seed)
+        phones = make_phones(count, invalid_ratio=0.05, seed=seed)
+        return [ImportUserRow(documents[index], "Usuario Importado", f"{seed}.{emails[index]}",
+                              phones[index], "secret123")
+                for index in range(count)]
+
+
+def use_case_cases(size: int, operations: int) -> Iterator[Case]:
+    fixture = functools.cache(lambda: UserFixture(size))
+    sample = functools.cache(lambda: random.Random(size).sample(range(size), min(operations, size)))
+
+    def get_user(repeat: int) -> Measurement:
+        use_case = GetUserUseCase(fixture().repository)
+        return time_per_call(use_case.execute, [fixture().user_ids[index] for index in sample()], repeat)
+
+    def get_user_by_email(repeat: int) -> Measurement:
+        use_case = GetUserByEmailUseCase(fixture().repository)
+        return time_per_call(use_case.execute, [fixture().emails[index] for index in sample()], repeat)
+
+    def create_user(repeat: int) -> Measurement:
+        use_case = CreateUserUseCase(fixture().repository)
+
+        def execute(arguments: tuple[str, str, str, str]) -> None:
+            document, email, phone, password = arguments
+            use_case.execute(document, "Usuario Novo", email, phone, password, PASSWORD_HASHER,
+                             fixture().creator_id)
+
+        return time_per_call(execute, lambda number: fixture().new_user_inputs(operations), repeat)
+
+    def update_user(repeat: int) -> Measurement:
+        use_case = UpdateUserUseCase(fixture().repository)
+        ids = [fixture().user_ids[index] for index in sample()]
+
+        def execute(arguments: tuple[str, str]) -> None:
+            id, name = arguments
+            use_case.execute(fixture().creator_id, id, name_str=name)
+
+        # a different name on every pass, so each call writes
+        return time_per_call(
+            execute, lambda number: [(id, ("Maria Souza", "Joana Lima")[number % 2]) for id in ids], repeat)
+
+    def list_users(repeat: int) -> Measurement:
+        use_case = ListUsersUseCase(fixture().repository)
+        tokens = [None]
+        for _ in range(min(operations, size // 100) - 1):
+            tokens.append(use_case.execute_page(100, tokens[-1]).next_token)
+        return time_per_call(lambda token: use_case.execute_page(100, token), tokens, repeat)
+
+    def import_users(repeat: int) -> Measurement:
+        use_case = ImportUsersUseCase(fixture().repository, max_hash_workers=1)
+
+        def execute(rows: list[ImportUserRow]) -> None:
+            use_case.execute(rows, PASSWORD_HASHER, fixture().creator_id)
+
+        return time_per_call(
+            execute, lambda number: [fixture().import_rows(100) for _ in range(max(operations // 100, 1))], repeat)
+
+    yield f"use_case/GetUser/{size}", get_user
+    yield f"use_case/GetUserByEmail/{size}", get_user_by_email
+    yield f"use_case/CreateUser/{size}", create_user
+    yield f"use_case/UpdateUser/name/{size}", update_user
+    yield f"use_case/ListUsers/page_100/{size}", list_users
+    yield f"use_case/ImportUsers/batch_100/{size}", import_users
+
+
+def all_cases(sizes: list[int], count: int, operations: int) -> Iterator[Case]:
+    yield from scalar_cases(count)
+    yield from memory_cases(count)
+    for size in sizes:
+        yield from use_case_cases(size, operations)
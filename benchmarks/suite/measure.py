@@ -0,0 +1,66 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    unit: str
+    value: float
+    samples: list[float]
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": self.unit,
+            "value": self.value,
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "samples": self.samples,
+        }
+
+
+def time_per_call(function: Callable,
+                  inputs: list | Callable[[int], list],
+                  repeat: int,
+                  expected: tuple[type[Exception], ...] = (ValueError,),
+                  ) -> Measurement:
+    """
+    Nanoseconds per `function(value)` over `inputs`, the median of `repeat`
+    passes. Exceptions of the `expected` types count as a finished call, so
+    invalid inputs are timed through the same loop as valid ones.
+
+    Calls that change state (creating a user, say) need new inputs on every
+    pass: `inputs` may then be a function of the pass number.
+    """
+    samples = []
+    for number in range(repeat):
+        values = inputs(number) if callable(inputs) else inputs
+        gc.collect()
+        start = time.perf_counter_ns()
+        for value in values:
+            try:
+                function(value)
+            except expected:
+                pass
+        samples.append((time.perf_counter_ns() - start) / len(values))
+
+    return Measurement("ns/op", statistics.median(samples), samples)
+
+
+def bytes_per_object(factory: Callable[[int], object], count: int, repeat: int = 1) -> Measurement:
+    """Memory traced while building `count` objects with `factory(seed)`, per object."""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        objects = [factory(seed) for seed in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+        samples.append(size / count)
+
+    return Measurement("bytes/object", statistics.median(samples), samples)
+
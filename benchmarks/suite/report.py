@@ -0,0 +1,143 @@
+"""
+JSON report of a suite run and the comparison of two reports.
+
+    {
+      "schema": 1,
+      "created_at": "2026-01-01T12:00:00+00:00",
+      "environment": {"python": "3.12.1", "platform": ..., "git_commit": ...},
+      "settings": {"sizes": [...], "count": ..., "operations": ..., "repeat": ...},
+      "results": {"scalar/Email/valid": {"unit": "ns/op", "value": ..., "min": ..., "max": ..., "samples": [...]}}
+    }
+
+`value` is the median of the samples; lower is better for every unit.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from benchmarks.suite.measure import Measurement
+
+SCHEMA = 1
+
+
+def environment() -> dict:
+    try:
+        git_commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        git_commit = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": git_commit,
+    }
+
+
+def build_report(results: dict[str, Measurement], settings: dict) -> dict:
+    return {
+        "schema": SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "settings": settings,
+        "results": {name: measurement.to_dict() for name, measurement in results.items()},
+    }
+
+
+def save(report: dict, path: str) -> None:
+    if path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        report = json.load(file)
+
+    if report.get("schema") != SCHEMA:
+        raise ValueError(f"Unsupported benchmark report schema: {report.get('schema')!r}")
+
+    return report
+
+
+@dataclass(frozen=True, slots=True)
+class Difference:
+    name: str
+    unit: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, positive when the current run is slower or bigger."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    threshold: float
+    differences: list[Difference]
+    missing: list[str]
+    added: list[str]
+
+    @property
+    def regressions(self) -> list[Difference]:
+        return [difference for difference in self.differences if difference.change > self.threshold]
+
+    @property
+    def improvements(self) -> list[Difference]:
+        return [difference for difference in self.differences if difference.change < -self.threshold]
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> Comparison:
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    differences = []
+    for name, result in current_results.items():
+        previous = baseline_results.get(name)
+        # a changed unit means the benchmark itself changed, it is reported as removed and added
+        if previous is not None and previous["unit"] == result["unit"]:
+            differences.append(Difference(name, result["unit"], previous["value"], result["value"]))
+
+    compared = {difference.name for difference in differences}
+    return Comparison(
+        threshold=threshold,
+        differences=differences,
+        missing=sorted(name for name in baseline_results if name not in compared),
+        added=sorted(name for name in current_results if name not in compared),
+    )
+
+
+def format_comparison(comparison: Comparison) -> str:
+    lines = [f"{'benchmark':<44} {'baseline':>14} {'current':>14} {'change':>8}"]
+    for difference in comparison.differences:
+        if difference.change > comparison.threshold:
+            flag = "  REGRESSION"
+        elif difference.change < -comparison.threshold:
+            flag = "  improved"
+        else:
+            flag = ""
+        lines.append(f"{difference.name:<44} {difference.baseline:>14,.0f} {difference.current:>14,.0f} "
+                     f"{difference.change:>+8.1%}{flag}")
+
+    for name in comparison.missing:
+        lines.append(f"{name:<44} only in baseline")
+    for name in comparison.added:
+        lines.append(f"{name:<44} only in current run")
+
+    lines.append(f"{len(comparison.regressions)} regression(s), {len(comparison.improvements)} improvement(s) "
+                 f"beyond {comparison.threshold:.0%}")
+    return "\n".join(lines)
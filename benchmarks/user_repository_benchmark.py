@@ -0,0 +1,57 @@
+"""
+Lookup cost of InMemoryUserRepository as the number of users grows.
+
+Usage:
+    python -m benchmarks.user_repository_benchmark [size ...]
+
+Default sizes stop at 1M; pass 10000000 explicitly for the 10M run.
+"""
+import random
+import sys
+import timeit
+
+from app.core.domain.value_objects.document_vo import Document
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+from app.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from benchmarks._data import make_cpf, make_email, make_phone, make_user
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LOOKUPS = 10_000
+
+
+def run(size: int) -> dict[str, float]:
+    repository = InMemoryUserRepository()
+    ids = []
+    for seed in range(size):
+        ids.append(repository.create(make_user(seed)))
+
+    seeds = [random.randrange(size) for _ in range(LOOKUPS)]
+    id_keys = [random.choice(ids) for _ in range(LOOKUPS)]
+    emails = [Email(make_email(seed)) for seed in seeds]
+    phones = [PhoneNumber(make_phone(seed)) for seed in seeds]
+    documents = [Document(make_cpf(seed)) for seed in seeds]
+
+    def per_call(function, keys) -> float:
+        seconds = timeit.timeit(lambda: [function(key) for key in keys], number=1)
+        return seconds / len(keys) * 1e9
+
+    return {
+        "get_by_id": per_call(repository.get_by_id, id_keys),
+        "get_by_email": per_call(repository.get_by_email, emails),
+        "get_by_phone_number": per_call(repository.get_by_phone_number, phones),
+        "get_by_document": per_call(repository.get_by_document, documents),
+    }
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    print(f"{'users':>10} " + " ".join(f"{name:>20}" for name in
+                                       ("get_by_id", "get_by_email", "get_by_phone_number", "get_by_document")))
+    for size in sizes:
+        results = run(size)
+        print(f"{size:>10} " + " ".join(f"{value:>17.0f} ns" for value in results.values()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
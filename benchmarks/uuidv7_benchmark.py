@@ -0,0 +1,61 @@
+"""
+UUIDv7 generation cost: the original per-id implementation versus the
+pooled monotonic generator, in string, batch and binary modes.
+
+Usage:
+    python -m benchmarks.uuidv7_benchmark [count]
+"""
+import os
+import sys
+import time
+import timeit
+
+from app.core.domain.value_objects.uuidv7_vo import UUIDv7, UUIDv7Generator, default_uuidv7_generator
+
+
+def legacy_generate_uuidv7() -> str:
+    value = bytearray(os.urandom(16))
+    timestamp = int(time.time() * 1000)
+
+    value[0] = (timestamp >> 40) & 0xFF
+    value[1] = (timestamp >> 32) & 0xFF
+    value[2] = (timestamp >> 24) & 0xFF
+    value[3] = (timestamp >> 16) & 0xFF
+    value[4] = (timestamp >> 8) & 0xFF
+    value[5] = timestamp & 0xFF
+
+    value[6] = (value[6] & 0x0F) | 0x70
+    value[8] = (value[8] & 0x3F) | 0x80
+
+    return '-'.join([
+        ''.join(f'{byte:02x}' for byte in value[0:4]),
+        ''.join(f'{byte:02x}' for byte in value[4:6]),
+        ''.join(f'{byte:02x}' for byte in value[6:8]),
+        ''.join(f'{byte:02x}' for byte in value[8:10]),
+        ''.join(f'{byte:02x}' for byte in value[10:16])
+    ])
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 200_000
+    generator = default_uuidv7_generator
+
+    cases = {
+        "legacy string": lambda: [legacy_generate_uuidv7() for _ in range(count)],
+        "generator string": lambda: [UUIDv7Generator.format(generator.next_int()) for _ in range(count)],
+        "generator batch string": lambda: [UUIDv7Generator.format(value) for value in generator.next_ints(count)],
+        "generator batch int": lambda: generator.next_ints(count),
+        "UUIDv7(None)": lambda: [UUIDv7(None) for _ in range(count)],
+        "UUIDv7.generate_many": lambda: UUIDv7.generate_many(count),
+    }
+
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{name:<24} {seconds / count * 1e9:>8.0f} ns/id")
+
+    values = generator.next_ints(count)
+    assert values == sorted(values) and len(set(values)) == count
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
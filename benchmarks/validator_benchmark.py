@@ -0,0 +1,225 @@
+"""
+Email and PhoneNumber validation: the regex-based validators they replaced
+(kept below as the reference) versus the current table-driven ones.
+
+A differential fuzz run first checks that both accept the same inputs with
+the same normalized value and reject the rest with the same exception type
+and message, then the per-call latency of each is measured.
+
+Usage:
+    python -m benchmarks.validator_benchmark [fuzz_cases] [seed]
+"""
+import random
+import re
+import sys
+import timeit
+from dataclasses import dataclass
+
+from app.core.domain.value_objects.email_vo import Email
+from app.core.domain.value_objects.phone_number_vo import PhoneNumber
+
+_LEGACY_LOCAL_REGEX = re.compile(r"^[a-zA-Z0-9_.-]+$")
+_LEGACY_DOMAIN_REGEX = re.compile(r"^[a-zA-Z0-9.-]+$")
+_LEGACY_LABEL_REGEX = re.compile(r"^[a-zA-Z0-9-]+$")
+_LEGACY_PHONE_REGEX = re.compile(r"^55[1-9][0-9]{1}\d{9}$")
+_LEGACY_PHONE_CHARACTERS = re.compile(r"^[0-9\-()+]+$")
+_LEGACY_DDD_CODES = {
+    "11", "12", "13", "14", "15", "16", "17", "18", "19", "21", "22", "24", "27", "28",
+    "31", "32", "33", "34", "35", "37", "38", "41", "42", "43", "44", "45", "46", "47",
+    "48", "49", "51", "53", "54", "55", "61", "62", "64", "63", "65", "66", "67", "68",
+    "69", "71", "73", "74", "75", "77", "79", "81", "87", "82", "83", "84", "85", "88",
+    "86", "89", "91", "93", "94", "92", "97", "95", "96", "98", "99",
+}
+
+
+def legacy_email(address) -> str:
+    if not isinstance(address, str):
+        raise TypeError("Email address must be a string")
+
+    cleaned_address = address.strip()
+    if not cleaned_address:
+        raise ValueError("Email address cannot be empty or whitespace only")
+    if not (0 < len(cleaned_address) <= 250):
+        raise ValueError(f"Email total length ({len(cleaned_address)}) invalid (must be 1-250)")
+    try:
+        local_part, domain_part = cleaned_address.split('@', 1)
+    except ValueError:
+        raise ValueError("Email address must contain exactly one '@'")
+    if not (0 < len(local_part) <= 60):
+        raise ValueError(f"Email local part length ({len(local_part)}) invalid (must be 1-60)")
+    if local_part.startswith('.') or local_part.endswith('.'):
+        raise ValueError("Email local part cannot start or end with a dot")
+    if '..' in local_part:
+        raise ValueError("Email local part cannot contain consecutive dots")
+    if not _LEGACY_LOCAL_REGEX.fullmatch(local_part):
+        raise ValueError(f"Email local part '{local_part}' contains invalid characters")
+    if not (0 < len(domain_part) <= 190):
+        raise ValueError(f"Email domain part length ({len(domain_part)}) invalid (must be 1-190)")
+    if not _LEGACY_DOMAIN_REGEX.fullmatch(domain_part):
+        raise ValueError(f"Email domain part '{domain_part}' contains invalid characters")
+    domain_labels = domain_part.split('.')
+    if not domain_labels or len(domain_labels) < 2:
+        raise ValueError("Email domain must include at least one dot and a TLD")
+    for label in domain_labels:
+        if not label:
+            raise ValueError("Email domain cannot have empty labels (consecutive dots)")
+        if label.startswith('-') or label.endswith('-'):
+            raise ValueError(f"Email domain label '{label}' cannot start or end with a hyphen")
+        if not _LEGACY_LABEL_REGEX.fullmatch(label):
+            raise ValueError(f"Email domain label '{label}' contains invalid characters")
+    return cleaned_address
+
+
+def legacy_phone(number) -> str:
+    if not isinstance(number, str):
+        raise TypeError("Phone number must be a string")
+
+    cleaned_number = number.strip()
+    if not cleaned_number:
+        raise ValueError("Phone number cannot be empty or whitespace only")
+    if not _LEGACY_PHONE_CHARACTERS.fullmatch(cleaned_number):
+        raise ValueError(f"Phone number contains invalid characters ({cleaned_number})")
+    if not (0 < len(cleaned_number) <= 30):
+        raise ValueError(f"Phone number length ({len(cleaned_number)}) invalid (must be 1-30)")
+    number = re.sub(r'\D', '', cleaned_number)
+    if not number.startswith("55"):
+        number = "55" + number
+    ddi = number[:2]
+    ddd = number[2:4]
+    if ddd not in _LEGACY_DDD_CODES:
+        raise ValueError(f"Invalid DDD code: {ddd}")
+    remainder = number[4:]
+    if len(remainder) < 8 or len(remainder) > 9:
+        raise ValueError(f"Invalid phone number length without ddi and ddd: {len(remainder)}")
+    if len(remainder) < 9:
+        remainder = "9" + remainder
+    formated_number = f"{ddi}{ddd}{remainder[:5]}{remainder[5:]}"
+    if not _LEGACY_PHONE_REGEX.fullmatch(formated_number):
+        raise ValueError(f"Invalid phone number format: '{formated_number}'")
+    return formated_number
+
+
+@dataclass(frozen=True, slots=True)
+class LegacyEmail:
+    """Same shape as Email, so latencies also include the dataclass construction."""
+    address: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "address", legacy_email(self.address))
+
+
+@dataclass(frozen=True, slots=True)
+class LegacyPhoneNumber:
+    number: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "number", legacy_phone(self.number))
+
+
+# characters around every decision the validators make, plus non-ASCII
+# letters/digits and Unicode whitespace that regex classes and str methods
+# could disagree on
+EMAIL_ALPHABET = "aZ09_.-@+!#é٣Ⅻ \t\n  "
+PHONE_ALPHABET = "0123456789-()+ .a٣\t "
+SAMPLE_EMAILS = ("maria.silva@example.com", "a@b.co", "joao-99_x@mail.example.com.br", "x@sub-domain.org")
+SAMPLE_PHONES = ("(11)98765-4321", "+55-21-3456-7890", "5511987654321", "11987654321", "4834567890")
+
+
+def random_text(random_generator: random.Random, alphabet: str, max_length: int) -> str:
+    return "".join(random_generator.choices(alphabet, k=random_generator.randint(0, max_length)))
+
+
+def mutate(random_generator: random.Random, value: str, alphabet: str) -> str:
+    characters = list(value)
+    for _ in range(random_generator.randint(1, 3)):
+        operation = random_generator.randrange(3)
+        position = random_generator.randint(0, len(characters))
+        if operation == 0:
+            characters.insert(position, random_generator.choice(alphabet))
+        elif operation == 1 and characters:
+            del characters[min(position, len(characters) - 1)]
+        elif characters:
+            characters[min(position, len(characters) - 1)] = random_generator.choice(alphabet)
+    return "".join(characters)
+
+
+def email_cases(random_generator: random.Random):
+    while True:
+        kind = random_generator.randrange(4)
+        if kind == 0:
+            yield random_text(random_generator, EMAIL_ALPHABET, 20)
+        elif kind == 1:
+            yield mutate(random_generator, random_generator.choice(SAMPLE_EMAILS), EMAIL_ALPHABET)
+        elif kind == 2:
+            # lengths around the 60/190/250 limits
+            local = "a" * random_generator.choice((59, 60, 61))
+            domain = "b" * random_generator.choice((1, 185, 186, 187, 250)) + ".com"
+            yield f"{local}@{domain}"
+        else:
+            labels = [random_text(random_generator, "ab-", 4) for _ in range(random_generator.randint(1, 4))]
+            yield f"{random_text(random_generator, 'a._-', 5)}@{'.'.join(labels)}"
+
+
+def phone_cases(random_generator: random.Random):
+    while True:
+        kind = random_generator.randrange(3)
+        if kind == 0:
+            yield random_text(random_generator, PHONE_ALPHABET, 18)
+        elif kind == 1:
+            yield mutate(random_generator, random_generator.choice(SAMPLE_PHONES), PHONE_ALPHABET)
+        else:
+            yield "".join(random_generator.choices("0123456789", k=random_generator.randint(0, 15)))
+
+
+def outcome(function, value):
+    try:
+        return ("ok", function(value))
+    except (TypeError, ValueError) as error:
+        return (type(error).__name__, str(error))
+
+
+def differential_fuzz(cases: int, seed: int) -> None:
+    random_generator = random.Random(seed)
+    checks = (
+        ("Email", legacy_email, lambda value: Email(value).address, email_cases(random_generator)),
+        ("PhoneNumber", legacy_phone, lambda value: PhoneNumber(value).number, phone_cases(random_generator)),
+    )
+    for name, legacy, current, generator in checks:
+        accepted = 0
+        for value in [None, 42, *SAMPLE_EMAILS, *SAMPLE_PHONES, *(next(generator) for _ in range(cases))]:
+            expected = outcome(legacy, value)
+            actual = outcome(current, value)
+            if expected != actual:
+                raise AssertionError(f"{name}({value!r}): legacy {expected} != current {actual}")
+            accepted += expected[0] == "ok"
+        print(f"{name:<12} {cases:>9,} fuzz cases identical ({accepted:,} accepted)")
+
+
+def per_call(function, values: list[str]) -> float:
+    seconds = min(timeit.repeat(lambda: [outcome(function, value) for value in values], number=5, repeat=3))
+    return seconds / 5 / len(values) * 1e9
+
+
+def main(argv: list[str]) -> None:
+    cases = int(argv[0]) if argv else 200_000
+    seed = int(argv[1]) if len(argv) > 1 else 0
+    differential_fuzz(cases, seed)
+
+    random_generator = random.Random(seed)
+    valid_emails = [f"user.{index}@mail{index % 97}.example.com.br" for index in range(2_000)]
+    fuzzed_emails = [value for value, _ in zip(email_cases(random_generator), range(2_000))]
+    valid_phones = [f"(11)9{index:04d}-{index:04d}" for index in range(2_000)]
+    fuzzed_phones = [value for value, _ in zip(phone_cases(random_generator), range(2_000))]
+
+    print(f"{'':<22} {'legacy':>10} {'current':>10}")
+    for label, legacy, current, values in (
+        ("Email (valid)", LegacyEmail, Email, valid_emails),
+        ("Email (fuzzed)", LegacyEmail, Email, fuzzed_emails),
+        ("PhoneNumber (valid)", LegacyPhoneNumber, PhoneNumber, valid_phones),
+        ("PhoneNumber (fuzzed)", LegacyPhoneNumber, PhoneNumber, fuzzed_phones),
+    ):
+        print(f"{label:<22} {per_call(legacy, values):>7.0f} ns {per_call(current, values):>7.0f} ns")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])